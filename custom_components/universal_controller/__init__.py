@@ -1,17 +1,38 @@
 """Universal Controller Integration for Home Assistant."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers import storage
+from homeassistant.util import dt as dt_util
 
 from .frontend import async_register_frontend
+from .recording import StateStreamRecorder
 from .ticker_manager import TickerManager
-from .const import DOMAIN
+from .websocket import async_register_websocket_commands
+from .const import (
+    CONF_EXECUTOR_QUEUE_SIZE,
+    CONF_EXECUTOR_WORKERS,
+    CONF_STRICT_CODE_ANALYSIS,
+    DATA_ENTRIES,
+    DATA_RECORDER,
+    DATA_RESULT_SENSORS,
+    DATA_SETUP_LOCK,
+    DATA_STORE,
+    DATA_TICKER_MANAGER,
+    DOMAIN,
+    EXECUTOR_QUEUE_SIZE,
+    EXECUTOR_WORKERS,
+    PROFILE_MAX_EXECUTIONS,
+    RECORDING_DIR,
+    RECORDING_MAX_DURATION,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,6 +58,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     # Ensure frontend is registered
     await _ensure_frontend_registered(hass)
     
+    # Console streaming for the card
+    async_register_websocket_commands(hass)
+    
     return True
 
 
@@ -47,27 +71,36 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Ensure frontend is registered (critical for updates!)
     await _ensure_frontend_registered(hass)
     
-    # Initialize storage
-    store = storage.Store(hass, STORAGE_VERSION, STORAGE_KEY)
+    domain_data = hass.data.setdefault(DOMAIN, {})
     
-    # Initialize ticker manager
-    ticker_manager = TickerManager(hass)
-    await ticker_manager.async_setup()
+    # Tickers are shared by all entries: only the first entry creates the
+    # manager and registers services, so every ticker is scheduled once.
+    # Entries are set up concurrently, so the others wait until the manager
+    # has loaded its tickers before setting up their own platforms.
+    async with domain_data.setdefault(DATA_SETUP_LOCK, asyncio.Lock()):
+        if DATA_TICKER_MANAGER not in domain_data:
+            store = storage.Store(hass, STORAGE_VERSION, STORAGE_KEY)
+            ticker_manager = TickerManager(
+                hass,
+                executor_workers=entry.data.get(CONF_EXECUTOR_WORKERS, EXECUTOR_WORKERS),
+                executor_queue_size=entry.data.get(CONF_EXECUTOR_QUEUE_SIZE, EXECUTOR_QUEUE_SIZE),
+                strict_analysis=entry.data.get(CONF_STRICT_CODE_ANALYSIS, False),
+            )
+            domain_data[DATA_STORE] = store
+            domain_data[DATA_TICKER_MANAGER] = ticker_manager
+            domain_data[DATA_ENTRIES] = {}
+            
+            await ticker_manager.async_setup()
+            await _async_register_services(hass, store, ticker_manager)
     
-    # Store config entry data and services
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {
+    # Each entry holds a reference to the shared manager
+    domain_data[DATA_ENTRIES][entry.entry_id] = {
         "name": entry.data.get("name", "Universal Controller"),
-        "store": store,
-        "ticker_manager": ticker_manager,
     }
     
     # Forward entry setup to sensor platform
     await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
     
-    # Register services
-    await _async_register_services(hass, store, ticker_manager)
-    
     return True
 
 
@@ -122,6 +155,11 @@ async def _async_register_services(hass: HomeAssistant, store: storage.Store, ti
             css_styles=call.data.get("css_styles"),
             update_interval=call.data.get("update_interval"),
             enabled=call.data.get("enabled"),
+            update_interval_ms=call.data.get("update_interval_ms"),
+            schedule=call.data.get("schedule"),
+            priority=call.data.get("priority"),
+            sensors=call.data.get("sensors"),
+            guard=call.data.get("guard"),
         )
         
         if success:
@@ -193,6 +231,107 @@ async def _async_register_services(hass: HomeAssistant, store: storage.Store, ti
             "result": result
         })
     
+    async def reset_ticker(call: ServiceCall) -> None:
+        """Re-enable a Universal Controller ticker stopped by its circuit breaker."""
+        ticker_id = call.data.get("ticker_id")
+        
+        if not ticker_id:
+            _LOGGER.error("ticker_id is required for reset_ticker service")
+            return
+        
+        if await ticker_manager.reset_ticker(ticker_id):
+            _LOGGER.info(f"Reset ticker {ticker_id}")
+    
+    async def get_console(call: ServiceCall) -> None:
+        """Get the buffered console output of a Universal Controller ticker."""
+        ticker_id = call.data.get("ticker_id")
+        
+        if not ticker_id:
+            _LOGGER.error("ticker_id is required for get_console service")
+            return
+        
+        entries = ticker_manager.get_console(ticker_id)
+        
+        if entries is None:
+            _LOGGER.error(f"Ticker not found: {ticker_id}")
+            return
+        
+        # Fire event with console output
+        hass.bus.async_fire("universal_controller_ticker_console", {
+            "ticker_id": ticker_id,
+            "entries": entries
+        })
+    
+    async def profile_ticker(call: ServiceCall) -> ServiceResponse:
+        """Profile the next executions of a Universal Controller ticker."""
+        ticker_id = call.data.get("ticker_id")
+        
+        if not ticker_id:
+            _LOGGER.error("ticker_id is required for profile_ticker service")
+            return None
+        
+        executions = max(1, min(int(call.data.get("executions", 1)), PROFILE_MAX_EXECUTIONS))
+        
+        result = await ticker_manager.profile_ticker(
+            ticker_id,
+            executions=executions,
+            trace_memory=call.data.get("trace_memory", False),
+            top=int(call.data.get("top", 20)),
+        )
+        
+        if result is None:
+            _LOGGER.error(f"Ticker not found: {ticker_id}")
+            return None
+        
+        if result.get("busy"):
+            # Another ticker is being profiled; the caller can retry later
+            return result
+        
+        _LOGGER.info(f"Profiled {result['executions']} executions of ticker {ticker_id}")
+        
+        # Fire event with profile results
+        hass.bus.async_fire("universal_controller_ticker_profile", result)
+        
+        return result
+    
+    async def get_load_stats(call: ServiceCall) -> ServiceResponse:
+        """Get Universal Controller load shedding statistics."""
+        stats = ticker_manager.get_load_stats()
+        
+        # Fire event with load statistics
+        hass.bus.async_fire("universal_controller_load_stats", stats)
+        
+        return stats
+    
+    async def record_states(call: ServiceCall) -> ServiceResponse:
+        """Record the state change stream for offline ticker replay."""
+        domain_data = hass.data[DOMAIN]
+        
+        # Only one recording at a time; a new call replaces the running one
+        active = domain_data.pop(DATA_RECORDER, None)
+        if active is not None:
+            await active.async_stop()
+        
+        if call.data.get("stop", False):
+            return {"path": active.path if active else None, "events": active.events if active else 0}
+        
+        duration = max(1, min(int(call.data.get("duration", 300)), RECORDING_MAX_DURATION))
+        filename = os.path.basename(
+            call.data.get("filename") or dt_util.now().strftime("%Y%m%d-%H%M%S")
+        )
+        if not filename.endswith(".jsonl.gz"):
+            filename = f"{filename}.jsonl.gz"
+        
+        entity_globs = call.data.get("entity_id") or None
+        if isinstance(entity_globs, str):
+            entity_globs = [entity_globs]
+        
+        recorder = StateStreamRecorder(hass, hass.config.path(RECORDING_DIR, filename), entity_globs)
+        await recorder.async_start(duration)
+        domain_data[DATA_RECORDER] = recorder
+        
+        return {"path": recorder.path, "duration": duration}
+    
     # Legacy card-based services (deprecated but maintained for compatibility)
     async def save_config(call: ServiceCall) -> None:
         """Save configuration for a Universal Controller card (LEGACY)."""
@@ -267,6 +406,17 @@ async def _async_register_services(hass: HomeAssistant, store: storage.Store, ti
     hass.services.async_register(DOMAIN, "get_ticker", get_ticker)
     hass.services.async_register(DOMAIN, "list_tickers", list_tickers)
     hass.services.async_register(DOMAIN, "execute_ticker", execute_ticker)
+    hass.services.async_register(DOMAIN, "reset_ticker", reset_ticker)
+    hass.services.async_register(DOMAIN, "get_console", get_console)
+    hass.services.async_register(
+        DOMAIN, "profile_ticker", profile_ticker, supports_response=SupportsResponse.OPTIONAL
+    )
+    hass.services.async_register(
+        DOMAIN, "get_load_stats", get_load_stats, supports_response=SupportsResponse.OPTIONAL
+    )
+    hass.services.async_register(
+        DOMAIN, "record_states", record_states, supports_response=SupportsResponse.OPTIONAL
+    )
     
     # Register legacy services
     hass.services.async_register(DOMAIN, "save_config", save_config)
@@ -284,31 +434,51 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor"])
     
-    # Unload ticker manager
-    if DOMAIN in hass.data and entry.entry_id in hass.data[DOMAIN]:
-        entry_data = hass.data[DOMAIN][entry.entry_id]
-        if "ticker_manager" in entry_data:
-            await entry_data["ticker_manager"].async_unload()
-    
-    # Remove services when last entry is unloaded
-    if DOMAIN in hass.data:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
-        
-        # If no more entries, remove services
-        if not hass.data[DOMAIN]:
-            # Remove ticker services
-            hass.services.async_remove(DOMAIN, "create_ticker")
-            hass.services.async_remove(DOMAIN, "update_ticker")
-            hass.services.async_remove(DOMAIN, "delete_ticker")
-            hass.services.async_remove(DOMAIN, "get_ticker")
-            hass.services.async_remove(DOMAIN, "list_tickers")
-            hass.services.async_remove(DOMAIN, "execute_ticker")
-            
-            # Remove legacy services
-            hass.services.async_remove(DOMAIN, "save_config")
-            hass.services.async_remove(DOMAIN, "load_config") 
-            hass.services.async_remove(DOMAIN, "get_all_configs")
-            hass.services.async_remove(DOMAIN, "register_frontend")
-            _LOGGER.info("Universal Controller services removed")
+    domain_data = hass.data.get(DOMAIN)
+    if not domain_data or entry.entry_id not in domain_data.get(DATA_ENTRIES, {}):
+        return unload_ok
+    
+    domain_data[DATA_ENTRIES].pop(entry.entry_id)
+    
+    # Result sensors were unloaded with this entry's platform
+    result_sensors = domain_data.get(DATA_RESULT_SENSORS)
+    if result_sensors is not None and result_sensors.entry_id == entry.entry_id:
+        result_sensors.async_unload()
+        domain_data.pop(DATA_RESULT_SENSORS)
+        
+        # Another loaded entry takes the sensors over by setting its platform up again
+        for other_entry_id in domain_data[DATA_ENTRIES]:
+            other_entry = hass.config_entries.async_get_entry(other_entry_id)
+            if other_entry is not None:
+                await hass.config_entries.async_unload_platforms(other_entry, ["sensor"])
+                await hass.config_entries.async_forward_entry_setups(other_entry, ["sensor"])
+                break
+    
+    # Tear down the shared manager and services when the last entry is unloaded
+    if not domain_data[DATA_ENTRIES]:
+        await domain_data[DATA_TICKER_MANAGER].async_unload()
+        if DATA_RECORDER in domain_data:
+            await domain_data[DATA_RECORDER].async_stop()
+        hass.data.pop(DOMAIN)
+        
+        # Remove ticker services
+        hass.services.async_remove(DOMAIN, "create_ticker")
+        hass.services.async_remove(DOMAIN, "update_ticker")
+        hass.services.async_remove(DOMAIN, "delete_ticker")
+        hass.services.async_remove(DOMAIN, "get_ticker")
+        hass.services.async_remove(DOMAIN, "list_tickers")
+        hass.services.async_remove(DOMAIN, "execute_ticker")
+        hass.services.async_remove(DOMAIN, "reset_ticker")
+        hass.services.async_remove(DOMAIN, "get_console")
+        hass.services.async_remove(DOMAIN, "profile_ticker")
+        hass.services.async_remove(DOMAIN, "get_load_stats")
+        hass.services.async_remove(DOMAIN, "record_states")
+        
+        # Remove legacy services
+        hass.services.async_remove(DOMAIN, "save_config")
+        hass.services.async_remove(DOMAIN, "load_config") 
+        hass.services.async_remove(DOMAIN, "get_all_configs")
+        hass.services.async_remove(DOMAIN, "register_frontend")
+        _LOGGER.info("Universal Controller services removed")
     
     return unload_ok
@@ -0,0 +1,183 @@
+"""Static analysis of ticker code for performance hazards."""
+from __future__ import annotations
+
+import ast
+from typing import Any, Dict, List, Optional
+
+from .const import ANALYSIS_MAX_REPEAT, ANALYSIS_MAX_RESULT_BYTES
+
+# Hazard codes
+HAZARD_SYNTAX = "syntax_error"
+HAZARD_BLOCKING = "blocking_call"
+HAZARD_STATE_SCAN = "state_scan"
+HAZARD_OVERSIZED_RESULT = "oversized_result"
+HAZARD_UNBOUNDED_LOOP = "unbounded_loop"
+
+# Hazards that stall a worker thread for an unknown time
+BLOCKING_HAZARDS = {HAZARD_BLOCKING, HAZARD_UNBOUNDED_LOOP}
+
+# Calls that block the worker thread, by dotted name or module prefix
+_BLOCKING_CALLS = {"time.sleep", "open", "input", "os.system", "os.popen", "os.wait", "os.waitpid"}
+_BLOCKING_MODULES = ("requests", "httpx", "urllib.request", "http.client", "socket", "subprocess", "shutil")
+_BLOCKING_METHODS = {"read_text", "read_bytes", "write_text", "write_bytes"}
+
+# State machine methods that return every entity
+_STATE_SCAN_METHODS = {"all", "async_all", "entity_ids", "async_entity_ids", "async_entity_ids_count"}
+
+
+def _dotted_name(node: ast.AST) -> Optional[str]:
+    """Return `a.b.c` for a name/attribute chain, None for anything else."""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
+def _literal_size(node: ast.AST) -> int:
+    """Return a rough serialized size of a literal, 0 for non-literals."""
+    if isinstance(node, ast.Constant):
+        return len(str(node.value)) + 2
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        return sum(_literal_size(element) + 1 for element in node.elts) + 2
+    if isinstance(node, ast.Dict):
+        return sum(
+            _literal_size(key) + _literal_size(value) + 2
+            for key, value in zip(node.keys, node.values)
+            if key is not None
+        ) + 2
+    return 0
+
+
+def _has_exit(node: ast.AST, nested: bool = False) -> bool:
+    """Return if a loop body contains a break, return or raise ending the loop."""
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, (ast.Return, ast.Raise)) or (isinstance(child, ast.Break) and not nested):
+            return True
+        # Code in nested functions doesn't run as part of the loop
+        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)):
+            continue
+        # A break inside a nested loop only ends that loop
+        if _has_exit(child, nested or isinstance(child, (ast.For, ast.AsyncFor, ast.While))):
+            return True
+    return False
+
+
+class _HazardVisitor(ast.NodeVisitor):
+    """Collects hazards from the parsed ticker code."""
+
+    def __init__(self) -> None:
+        """Initialize the visitor."""
+        self.hazards: List[Dict[str, Any]] = []
+        # Local name -> imported dotted name
+        self._imports: Dict[str, str] = {}
+
+    def _add(self, code: str, node: ast.AST, message: str) -> None:
+        self.hazards.append({"code": code, "line": getattr(node, "lineno", None), "message": message})
+
+    def _resolve(self, name: str) -> str:
+        root, _, rest = name.partition(".")
+        if root not in self._imports:
+            return name
+        return f"{self._imports[root]}.{rest}" if rest else self._imports[root]
+
+    @staticmethod
+    def _is_blocking(name: str) -> bool:
+        return name in _BLOCKING_CALLS or any(
+            name == module or name.startswith(f"{module}.") for module in _BLOCKING_MODULES
+        )
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            if alias.asname:
+                self._imports[alias.asname] = alias.name
+        self.generic_visit(node)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        for alias in node.names:
+            self._imports[alias.asname or alias.name] = f"{node.module or ''}.{alias.name}"
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        name = _dotted_name(node.func)
+        if name is not None:
+            name = self._resolve(name)
+        if name is not None and self._is_blocking(name):
+            self._add(HAZARD_BLOCKING, node, f"{name}() blocks the ticker worker thread")
+        elif isinstance(node.func, ast.Attribute):
+            owner = _dotted_name(node.func.value) or ""
+            method = node.func.attr
+            if method in _BLOCKING_METHODS:
+                self._add(HAZARD_BLOCKING, node, f"{method}() does blocking file I/O")
+            elif (
+                method in _STATE_SCAN_METHODS
+                and owner.split(".")[-1] == "states"
+                and not node.args
+                and not node.keywords
+            ):
+                self._add(
+                    HAZARD_STATE_SCAN, node,
+                    f"{owner}.{method}() scans every entity; pass a domain or use states.get()",
+                )
+        self.generic_visit(node)
+
+    def visit_BinOp(self, node: ast.BinOp) -> None:
+        if isinstance(node.op, ast.Mult):
+            for sequence, count in ((node.left, node.right), (node.right, node.left)):
+                if (
+                    isinstance(sequence, (ast.List, ast.Tuple, ast.Constant))
+                    and isinstance(count, ast.Constant)
+                    and isinstance(count.value, int)
+                    and count.value > ANALYSIS_MAX_REPEAT
+                ):
+                    self._add(HAZARD_OVERSIZED_RESULT, node, f"sequence repeated {count.value} times")
+                    break
+        self.generic_visit(node)
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        # The result becomes a state attribute and is written on every run
+        if any(isinstance(target, ast.Name) and target.id == "result" for target in node.targets):
+            size = _literal_size(node.value)
+            if size > ANALYSIS_MAX_RESULT_BYTES:
+                self._add(
+                    HAZARD_OVERSIZED_RESULT, node,
+                    f"result literal is about {size} bytes (limit {ANALYSIS_MAX_RESULT_BYTES})",
+                )
+        self.generic_visit(node)
+
+    def visit_While(self, node: ast.While) -> None:
+        try:
+            endless = bool(ast.literal_eval(node.test))
+        except (ValueError, TypeError, SyntaxError):
+            endless = False
+        if endless and not _has_exit(node):
+            self._add(HAZARD_UNBOUNDED_LOOP, node, "while loop has a constant condition and no break")
+        self.generic_visit(node)
+
+
+def analyze_code(code: str) -> List[Dict[str, Any]]:
+    """Return the performance hazards found in ticker code.
+
+    Each hazard has a `code`, the `line` it was found on and a `message`.
+    Code is analyzed the way it is executed (`result = <code>`).
+    """
+    if not code or not code.strip():
+        return []
+
+    try:
+        tree = ast.parse(f"result = {code}")
+        # Catches errors the parser accepts, such as return outside a function
+        compile(tree, "<ticker>", "exec")
+    except (SyntaxError, ValueError) as e:
+        return [{
+            "code": HAZARD_SYNTAX,
+            "line": getattr(e, "lineno", None),
+            "message": f"code cannot be parsed: {getattr(e, 'msg', e)}",
+        }]
+
+    visitor = _HazardVisitor()
+    visitor.visit(tree)
+    return sorted(visitor.hazards, key=lambda hazard: hazard["line"] or 0)
@@ -0,0 +1,197 @@
+"""Batched execution of Universal Controller tickers."""
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+import json
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .console import ConsoleBuffer
+from .const import DEFAULT_BATCH_WINDOW
+from .executor import TickerExecutor, TickerExecutorClosed, TickerExecutorFull
+from .profiler import TickerProfiler
+
+if TYPE_CHECKING:
+    from .ticker import UniversalControllerTicker
+
+_LOGGER = logging.getLogger(__name__)
+
+# Ticker whose code is running on the current worker thread
+_current = threading.local()
+
+# (ticker_id, compiled code, per-ticker context, active profiler) handed to the executor
+BatchJob = Tuple[str, Any, Dict[str, Any], Optional[TickerProfiler]]
+# (success, result or error message, captured console) returned from the executor
+BatchOutcome = Tuple[bool, Any, ConsoleBuffer]
+
+
+def current_ticker_id() -> Optional[str]:
+    """Return the id of the ticker executing on this thread, if any."""
+    return getattr(_current, "ticker_id", None)
+
+
+def build_base_context(hass: HomeAssistant) -> Dict[str, Any]:
+    """Build the execution context pieces shared by every ticker in a batch."""
+    return {
+        "hass": hass,
+        "states": hass.states,
+        "services": hass.services,
+        "Date": datetime,
+        "JSON": json,
+    }
+
+
+def run_batch(jobs: List[BatchJob], base_context: Dict[str, Any]) -> List[BatchOutcome]:
+    """Run compiled ticker code back to back (runs in the executor).
+
+    Each job is isolated: an exception in one ticker, including SystemExit
+    from exit(), is captured as its outcome and does not affect the others
+    in the batch.
+    """
+    outcomes: List[BatchOutcome] = []
+    for ticker_id, code, ticker_context, profiler in jobs:
+        console = ConsoleBuffer()
+        exec_globals = dict(base_context)
+        exec_globals.update(ticker_context)
+        exec_globals["console"] = console.as_context()
+        exec_locals: Dict[str, Any] = {}
+        _current.ticker_id = ticker_id
+        try:
+            if profiler is not None:
+                profiler.run(exec, code, exec_globals, exec_locals)
+            else:
+                exec(code, exec_globals, exec_locals)
+            outcomes.append((True, exec_locals.get("result", None), console))
+        except Exception as e:
+            outcomes.append((False, f"Code execution error: {e}", console))
+        except BaseException as e:  # pylint: disable=broad-except
+            # exit() and friends must not abort the rest of the batch
+            outcomes.append((False, f"Code execution error: {type(e).__name__}({e})", console))
+        finally:
+            _current.ticker_id = None
+    return outcomes
+
+
+class TickerBatcher:
+    """Groups tickers that become due close together into one executor job."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        window: float = DEFAULT_BATCH_WINDOW,
+        executor: Optional[TickerExecutor] = None,
+    ) -> None:
+        """Initialize the batcher."""
+        self.hass = hass
+        self._window = window
+        self._executor = executor
+        # Builds the shared context for each batch; replaced by the replay harness
+        self.context_factory = build_base_context
+        self._pending: Dict[str, UniversalControllerTicker] = {}
+        self._cancel_flush = None
+
+    @property
+    def window(self) -> float:
+        """Return the batch window in seconds."""
+        return self._window
+
+    @callback
+    def async_submit(self, ticker: UniversalControllerTicker) -> None:
+        """Queue a due ticker for the next batch."""
+        self._pending[ticker.ticker_id] = ticker
+        if self._cancel_flush is None:
+            self._cancel_flush = async_call_later(self.hass, self._window, self._async_flush)
+
+    async def _async_flush(self, _now=None) -> None:
+        """Execute every ticker queued during the batch window."""
+        self._cancel_flush = None
+        tickers = list(self._pending.values())
+        self._pending.clear()
+        if tickers:
+            await self.async_execute(tickers)
+
+    async def async_execute(
+        self, tickers: List[UniversalControllerTicker]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Execute tickers in a single executor job and apply their results."""
+        batch: List[UniversalControllerTicker] = []
+        jobs: List[BatchJob] = []
+        results: Dict[str, Dict[str, Any]] = {}
+
+        # A full executor queue drops the batch before any state is written
+        if self._executor is not None and self._executor.full:
+            self._executor.rejected += 1
+            _LOGGER.debug(f"Ticker executor queue full, dropping batch of {len(tickers)} tickers")
+            for ticker in tickers:
+                ticker.executor_rejected += 1
+                results[ticker.ticker_id] = {"error": "Ticker executor queue is full"}
+            return results
+
+        for ticker in tickers:
+            if not ticker.user_code.strip():
+                results[ticker.ticker_id] = {"error": "No code to execute"}
+                continue
+
+            ticker._begin_execution()
+            try:
+                code = ticker.compiled_code
+            except Exception as e:
+                results[ticker.ticker_id] = ticker._complete_execution(
+                    False, f"Code execution error: {e}"
+                )
+                continue
+
+            batch.append(ticker)
+            jobs.append((ticker.ticker_id, code, ticker.execution_context(), ticker.profiler))
+
+        if not jobs:
+            return results
+
+        _LOGGER.debug(f"Executing batch of {len(jobs)} tickers")
+
+        try:
+            try:
+                if self._executor is not None:
+                    outcomes = await self._executor.async_run(
+                        run_batch, jobs, self.context_factory(self.hass)
+                    )
+                else:
+                    outcomes = await self.hass.async_add_executor_job(
+                        run_batch, jobs, self.context_factory(self.hass)
+                    )
+            except (TickerExecutorClosed, TickerExecutorFull) as e:
+                # The code never ran, so this doesn't count against the tickers
+                _LOGGER.debug(f"Ticker executor did not accept batch of {len(jobs)} tickers: {e}")
+                for ticker in batch:
+                    if isinstance(e, TickerExecutorFull):
+                        ticker.executor_rejected += 1
+                    ticker._abort_execution()
+                    results[ticker.ticker_id] = {"error": str(e)}
+                return results
+            except Exception as e:
+                outcomes = [(False, f"Batch execution error: {e}", ConsoleBuffer()) for _ in jobs]
+
+            for ticker, (success, value, console) in zip(batch, outcomes):
+                results[ticker.ticker_id] = ticker._complete_execution(success, value, console)
+        finally:
+            # However the batch ended, no ticker may stay marked as executing
+            for ticker in batch:
+                if ticker._executing:
+                    ticker._abort_execution()
+
+        return results
+
+    async def async_shutdown(self) -> None:
+        """Cancel any pending flush and drop queued tickers."""
+        if self._cancel_flush:
+            self._cancel_flush()
+            self._cancel_flush = None
+        self._pending.clear()
+
+    def discard(self, ticker_id: str) -> None:
+        """Remove a ticker from the pending batch."""
+        self._pending.pop(ticker_id, None)
@@ -10,12 +10,28 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN
+from .const import (
+    CONF_EXECUTOR_QUEUE_SIZE,
+    CONF_EXECUTOR_WORKERS,
+    CONF_STRICT_CODE_ANALYSIS,
+    DOMAIN,
+    EXECUTOR_QUEUE_SIZE,
+    EXECUTOR_WORKERS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 STEP_USER_DATA_SCHEMA = vol.Schema({
     vol.Required("name", default="Universal Controller"): str,
+    # Thread pool running ticker code; the first entry's values are used
+    vol.Optional(CONF_EXECUTOR_WORKERS, default=EXECUTOR_WORKERS): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=32)
+    ),
+    vol.Optional(CONF_EXECUTOR_QUEUE_SIZE, default=EXECUTOR_QUEUE_SIZE): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=1024)
+    ),
+    # Reject ticker code with blocking calls, state scans or endless loops
+    vol.Optional(CONF_STRICT_CODE_ANALYSIS, default=False): bool,
 })
 
 
@@ -46,6 +62,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     title=name,
                     data={
                         "name": name,
+                        CONF_EXECUTOR_WORKERS: user_input[CONF_EXECUTOR_WORKERS],
+                        CONF_EXECUTOR_QUEUE_SIZE: user_input[CONF_EXECUTOR_QUEUE_SIZE],
+                        CONF_STRICT_CODE_ANALYSIS: user_input[CONF_STRICT_CODE_ANALYSIS],
                     },
                 )
 
@@ -0,0 +1,116 @@
+"""Buffered console capture for Universal Controller tickers."""
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List
+
+from .const import (
+    CONSOLE_MAX_ENTRIES,
+    CONSOLE_MAX_MESSAGE_LENGTH,
+    CONSOLE_RING_SIZE,
+    CONSOLE_SAMPLE_RATE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+CONSOLE_LEVELS = ("debug", "log", "info", "warn", "error")
+
+
+class ConsoleBuffer:
+    """Collects console output of a single execution without touching the logger.
+
+    The first CONSOLE_MAX_ENTRIES calls are kept, after that only one in
+    CONSOLE_SAMPLE_RATE is sampled (errors are always kept) until the
+    buffer holds twice the limit.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the buffer."""
+        self.entries: List[Dict[str, Any]] = []
+        self.calls = 0
+        self.dropped = 0
+
+    def _write(self, level: str, args) -> None:
+        """Record a console call."""
+        self.calls += 1
+        kept = len(self.entries)
+        if kept >= 2 * CONSOLE_MAX_ENTRIES or (
+            level != "error"
+            and kept >= CONSOLE_MAX_ENTRIES
+            and self.calls % CONSOLE_SAMPLE_RATE
+        ):
+            self.dropped += 1
+            return
+
+        message = " ".join(str(arg) for arg in args)
+        if len(message) > CONSOLE_MAX_MESSAGE_LENGTH:
+            message = message[:CONSOLE_MAX_MESSAGE_LENGTH] + "…"
+
+        self.entries.append({"level": level, "message": message, "time": time.time()})
+
+    def as_context(self) -> Dict[str, Callable[..., None]]:
+        """Return the `console` object exposed to ticker code."""
+        return {
+            level: (lambda *args, _level=level: self._write(_level, args))
+            for level in CONSOLE_LEVELS
+        }
+
+
+class ConsoleRing:
+    """Per-ticker ring of recent console output with live subscribers."""
+
+    def __init__(self, ticker_id: str, size: int = CONSOLE_RING_SIZE) -> None:
+        """Initialize the ring."""
+        self._ticker_id = ticker_id
+        self._entries: Deque[Dict[str, Any]] = deque(maxlen=size)
+        self._subscribers: List[Callable[[List[Dict[str, Any]]], None]] = []
+        self.total_dropped = 0
+
+    def add(self, buffer: ConsoleBuffer) -> None:
+        """Store the output of one execution and report it."""
+        if not buffer.calls:
+            return
+
+        self._entries.extend(buffer.entries)
+        self.total_dropped += buffer.dropped
+
+        # Errors always reach the log, everything else only as a summary
+        for entry in buffer.entries:
+            if entry["level"] == "error":
+                _LOGGER.error(f"Ticker {self._ticker_id}: {entry['message']}")
+            elif _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(f"Ticker {self._ticker_id} [{entry['level']}]: {entry['message']}")
+
+        _LOGGER.debug(
+            f"Ticker {self._ticker_id}: {buffer.calls} console calls, "
+            f"{len(buffer.entries)} kept, {buffer.dropped} dropped"
+        )
+
+        for subscriber in list(self._subscribers):
+            try:
+                subscriber(buffer.entries)
+            except Exception as e:
+                _LOGGER.error(f"Error calling console subscriber: {e}")
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Return the buffered console entries, oldest first."""
+        return list(self._entries)
+
+    def clear(self) -> None:
+        """Drop all buffered entries."""
+        self._entries.clear()
+        self.total_dropped = 0
+
+    def subscribe(
+        self, subscriber: Callable[[List[Dict[str, Any]]], None]
+    ) -> Callable[[], None]:
+        """Stream new console entries to a subscriber; returns an unsubscribe."""
+        self._subscribers.append(subscriber)
+
+        def _unsubscribe() -> None:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+        return _unsubscribe
@@ -2,8 +2,77 @@
 
 DOMAIN = "universal_controller"
 
+# hass.data[DOMAIN] keys
+DATA_TICKER_MANAGER = "ticker_manager"
+DATA_STORE = "store"
+DATA_ENTRIES = "entries"
+DATA_RECORDER = "recorder"
+DATA_RESULT_SENSORS = "result_sensors"
+DATA_SETUP_LOCK = "setup_lock"
+
 # Configuration keys
 CONF_NAME = "name"
+CONF_EXECUTOR_WORKERS = "executor_workers"
+CONF_EXECUTOR_QUEUE_SIZE = "executor_queue_size"
+CONF_STRICT_CODE_ANALYSIS = "strict_code_analysis"
 
 # Default values
-DEFAULT_NAME = "Universal Controller"
\ No newline at end of file
+DEFAULT_NAME = "Universal Controller"
+
+# Ticker execution
+DEFAULT_BATCH_WINDOW = 0.05  # seconds tickers are collected before a batch runs
+ERROR_BACKOFF_MAX = 900  # seconds, cap for exponential backoff after errors
+ERROR_CIRCUIT_THRESHOLD = 10  # consecutive errors before a ticker is auto-disabled
+
+# Ticker executor
+EXECUTOR_WORKERS = 4  # threads dedicated to ticker code
+EXECUTOR_QUEUE_SIZE = 32  # batches waiting for a thread before runs are rejected
+EXECUTOR_WAIT_SAMPLES = 256  # queue wait samples kept for statistics
+EXECUTOR_SHUTDOWN_TIMEOUT = 10  # seconds unload waits for running ticker code
+
+# Code analysis
+ANALYSIS_MAX_RESULT_BYTES = 16384  # literal result size flagged, matches the recorder's attribute limit
+ANALYSIS_MAX_REPEAT = 1000  # repetition count of a sequence literal flagged as oversized
+
+# Console capture
+CONSOLE_MAX_ENTRIES = 100  # entries kept per execution before sampling starts
+CONSOLE_SAMPLE_RATE = 10  # keep one in N console calls once the cap is hit
+CONSOLE_MAX_MESSAGE_LENGTH = 1000  # characters per console entry
+CONSOLE_RING_SIZE = 500  # recent console entries kept per ticker
+
+# Scheduling
+MIN_INTERVAL_MS = 50  # shortest supported millisecond interval
+SCHEDULE_STATS_SAMPLES = 256  # lateness samples kept per ticker
+CRON_SEARCH_DAYS = 366 * 4  # how far ahead a cron expression is searched
+PRECISE_STATE_WRITE_INTERVAL = 5  # seconds between state writes of a high-frequency ticker
+
+# Ticker state store
+STATE_STORE_MAX_BYTES = 65536  # serialized size limit of a ticker's store
+STATE_SAVE_DELAY = 10  # seconds to wait before persisting store changes
+
+# HTTP client
+HTTP_DEFAULT_TIMEOUT = 10  # seconds per request
+HTTP_DEFAULT_TTL = 1  # seconds a GET response is shared between callers
+HTTP_CACHE_SIZE = 128  # cached GET responses
+HTTP_HOST_CONCURRENCY = 4  # concurrent requests per host
+
+# Profiling
+PROFILE_MAX_EXECUTIONS = 100  # executions a single profile_ticker call may cover
+PROFILE_TIMEOUT = 600  # seconds profile_ticker waits for scheduled executions
+PROFILE_TRACEMALLOC_FRAMES = 25  # frames kept per traced allocation
+
+# Priorities and load shedding
+PRIORITY_HIGH = "high"
+PRIORITY_NORMAL = "normal"
+PRIORITY_LOW = "low"
+PRIORITIES = (PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW)
+LOAD_PROBE_INTERVAL = 0.5  # seconds between event loop lag probes
+LOAD_LAG_ELEVATED = 0.1  # seconds of loop lag before low priority runs are deferred
+LOAD_LAG_SEVERE = 0.5  # seconds of loop lag before low priority runs are skipped
+LOAD_QUEUE_ELEVATED = 8  # ticker executor jobs waiting before low priority runs are deferred
+LOAD_QUEUE_SEVERE = 24  # ticker executor jobs waiting before low priority runs are skipped
+
+# State stream recording
+RECORDING_DIR = "universal_controller_recordings"  # folder in the config dir
+RECORDING_FLUSH_LINES = 500  # recorded events buffered before a write
+RECORDING_MAX_DURATION = 86400  # seconds a single recording may run
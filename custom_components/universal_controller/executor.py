@@ -0,0 +1,167 @@
+"""Dedicated thread pool for Universal Controller ticker code."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Deque, Dict, TypeVar
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DOMAIN,
+    EXECUTOR_QUEUE_SIZE,
+    EXECUTOR_SHUTDOWN_TIMEOUT,
+    EXECUTOR_WAIT_SAMPLES,
+    EXECUTOR_WORKERS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class TickerExecutorFull(Exception):
+    """Raised when the ticker executor queue is full."""
+
+
+class TickerExecutorClosed(Exception):
+    """Raised when a job is submitted after the ticker executor shut down."""
+
+
+class TickerExecutor:
+    """Bounded thread pool that keeps ticker code off Home Assistant's executor.
+
+    Slow tickers can only exhaust their own workers, and other integrations'
+    blocking I/O cannot delay ticker runs. At most `queue_size` jobs wait for
+    a worker; further submissions are rejected. Counters are updated from
+    worker threads and read from the event loop, so they are locked.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        workers: int = EXECUTOR_WORKERS,
+        queue_size: int = EXECUTOR_QUEUE_SIZE,
+    ) -> None:
+        """Initialize the executor."""
+        self.hass = hass
+        self.workers = workers
+        self.queue_size = queue_size
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"{DOMAIN}_ticker")
+        self._lock = threading.Lock()
+        self._closed = False
+        self.queued = 0
+        self.running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.saturated = 0
+        self._waits: Deque[float] = deque(maxlen=EXECUTOR_WAIT_SAMPLES)
+        self._wait_max = 0.0
+        self._created = time.monotonic()
+        self._saturated_since = 0.0
+        self._saturated_time = 0.0
+
+    @property
+    def full(self) -> bool:
+        """Return if no further job can be queued."""
+        return self.queued >= self.queue_size
+
+    async def async_run(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a function on a ticker worker thread."""
+        if self._closed:
+            raise TickerExecutorClosed("Ticker executor is shut down")
+        if self.full:
+            self.rejected += 1
+            raise TickerExecutorFull(f"Ticker executor queue is full ({self.queue_size} jobs waiting)")
+
+        with self._lock:
+            self.queued += 1
+            self.submitted += 1
+            if self.running >= self.workers:
+                self.saturated += 1
+
+        future = self._pool.submit(self._run, time.monotonic(), func, *args)
+        future.add_done_callback(self._cancelled)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # Queued jobs are cancelled by shutdown; that is not the caller's failure
+            if self._closed and future.cancelled():
+                raise TickerExecutorClosed("Ticker executor shut down before the job ran") from None
+            raise
+
+    def _run(self, submitted: float, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a job on a worker, measuring how long it waited for one."""
+        started = time.monotonic()
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+            if self.running == self.workers:
+                self._saturated_since = started
+            wait = started - submitted
+            self._waits.append(wait)
+            self._wait_max = max(self._wait_max, wait)
+
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                if self.running == self.workers:
+                    self._saturated_time += time.monotonic() - self._saturated_since
+                self.running -= 1
+                self.completed += 1
+
+    def _cancelled(self, future: Future) -> None:
+        """Release the queue slot of a job cancelled before it started."""
+        if future.cancelled():
+            with self._lock:
+                self.queued -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool size, queue and saturation statistics."""
+        with self._lock:
+            waits = sorted(self._waits)
+            saturated_time = self._saturated_time
+            if self.running == self.workers:
+                saturated_time += time.monotonic() - self._saturated_since
+            stats: Dict[str, Any] = {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "queued": self.queued,
+                "running": self.running,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "saturated_submissions": self.saturated,
+                "saturation": round(saturated_time / max(time.monotonic() - self._created, 1e-9), 4),
+            }
+
+        if waits:
+            stats.update({
+                "queue_wait_ms_avg": round(sum(waits) / len(waits) * 1000, 3),
+                "queue_wait_ms_p95": round(waits[int(len(waits) * 0.95)] * 1000, 3),
+                "queue_wait_ms_max": round(self._wait_max * 1000, 3),
+            })
+        return stats
+
+    async def async_shutdown(self) -> None:
+        """Cancel queued jobs and wait for running ticker code to finish."""
+        self._closed = True
+        try:
+            await asyncio.wait_for(
+                self.hass.async_add_executor_job(
+                    partial(self._pool.shutdown, wait=True, cancel_futures=True)
+                ),
+                EXECUTOR_SHUTDOWN_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            _LOGGER.warning(
+                f"Ticker code still running {EXECUTOR_SHUTDOWN_TIMEOUT}s after shutdown; "
+                f"{self.running} worker threads left behind"
+            )
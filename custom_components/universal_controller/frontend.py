@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 from pathlib import Path
 
 from homeassistant.core import HomeAssistant
@@ -14,12 +15,14 @@ _LOGGER = logging.getLogger(__name__)
 
 FRONTEND_URL_PATH = "/universal_controller"
 FRONTEND_FILE_PATH = "universal-controller-card.js"
+# The loader and the chunks it imports on demand
+FRONTEND_FILE_PATTERN = re.compile(r"universal-controller-[\w-]+\.js")
 
 
 class UniversalControllerView(HomeAssistantView):
-    """View to serve the Universal Controller frontend."""
+    """View to serve the Universal Controller card loader and its chunks."""
     
-    url = f"{FRONTEND_URL_PATH}/{FRONTEND_FILE_PATH}"
+    url = f"{FRONTEND_URL_PATH}/{{filename}}"
     name = "universal_controller:frontend"
     requires_auth = False
     
@@ -27,25 +30,33 @@ class UniversalControllerView(HomeAssistantView):
         """Initialize the view."""
         self.hass = hass
         
-    async def get(self, request):
+    async def get(self, request, filename: str):
         """Serve the Universal Controller card JavaScript."""
         try:
-            # Get the path to the JavaScript file within the integration
+            # Only serve bundle files from the integration's www folder
+            if not FRONTEND_FILE_PATTERN.fullmatch(filename):
+                return web.Response(text="Not found", status=404)
+            
             integration_dir = os.path.dirname(__file__)
-            js_file_path = os.path.join(integration_dir, "www", "universal-controller-card.js")
+            js_file_path = os.path.join(integration_dir, "www", filename)
             
             if not os.path.exists(js_file_path):
                 _LOGGER.error(f"Frontend file not found: {js_file_path}")
                 return web.Response(text="Frontend file not found", status=404)
             
             # Read and serve the JavaScript file
-            with open(js_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = await self.hass.async_add_executor_job(_read_file, js_file_path)
+            
+            # The loader keeps its name across releases; chunks are content-hashed
+            if filename == FRONTEND_FILE_PATH:
+                cache_control = "no-cache"
+            else:
+                cache_control = "public, max-age=31536000, immutable"
             
             return web.Response(
                 text=content,
                 content_type="application/javascript",
-                headers={"Cache-Control": "no-cache"}
+                headers={"Cache-Control": cache_control}
             )
             
         except Exception as e:
@@ -53,6 +64,12 @@ class UniversalControllerView(HomeAssistantView):
             return web.Response(text="Error serving frontend", status=500)
 
 
+def _read_file(path: str) -> str:
+    """Read a frontend file (runs in the executor)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
 async def async_register_frontend(hass: HomeAssistant) -> None:
     """Register the frontend components."""
     try:
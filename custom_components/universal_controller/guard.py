@@ -0,0 +1,124 @@
+"""Declarative guard conditions checked before a ticker run is dispatched."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+_CONDITION_KEYS = {"entity_id", "attribute", "state", "not_state", "above", "below"}
+
+# Evaluates one (sub)condition against the state machine
+_Check = Callable[[HomeAssistant], bool]
+
+
+def _as_list(value: Any, name: str) -> List[str]:
+    """Return a string or list of strings as a non-empty list."""
+    values = [value] if isinstance(value, str) else value
+    if not isinstance(values, list) or not values or not all(isinstance(v, str) for v in values):
+        raise ValueError(f"Guard {name} must be a string or a list of strings")
+    return values
+
+
+def _number(value: Any, name: str) -> float:
+    """Return a guard bound as a float."""
+    if isinstance(value, bool):
+        raise ValueError(f"Guard {name} must be a number")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Guard {name} must be a number") from None
+
+
+def _compile_condition(config: Dict[str, Any]) -> _Check:
+    """Compile a single entity condition."""
+    unknown = set(config) - _CONDITION_KEYS
+    if unknown:
+        raise ValueError(f"Unknown guard option: {', '.join(sorted(unknown))}")
+    if "entity_id" not in config:
+        raise ValueError("Guard condition requires entity_id")
+
+    entity_ids = [entity_id.lower() for entity_id in _as_list(config["entity_id"], "entity_id")]
+    attribute: Optional[str] = config.get("attribute")
+    if attribute is not None and not isinstance(attribute, str):
+        raise ValueError("Guard attribute must be a string")
+    states = set(_as_list(config["state"], "state")) if "state" in config else None
+    not_states = set(_as_list(config["not_state"], "not_state")) if "not_state" in config else None
+    above = _number(config["above"], "above") if "above" in config else None
+    below = _number(config["below"], "below") if "below" in config else None
+
+    if states is None and not_states is None and above is None and below is None:
+        raise ValueError("Guard condition requires state, not_state, above or below")
+
+    def matches(hass: HomeAssistant, entity_id: str) -> bool:
+        state = hass.states.get(entity_id)
+        if state is None:
+            return False
+
+        value = state.state if attribute is None else state.attributes.get(attribute)
+        if states is not None and str(value) not in states:
+            return False
+        if not_states is not None and str(value) in not_states:
+            return False
+
+        if above is not None or below is not None:
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                return False
+            if above is not None and not number > above:
+                return False
+            if below is not None and not number < below:
+                return False
+
+        return True
+
+    # Every listed entity has to match, as with Home Assistant's state condition
+    return lambda hass: all(matches(hass, entity_id) for entity_id in entity_ids)
+
+
+def _compile(config: Union[Dict[str, Any], List[Any]]) -> _Check:
+    """Compile a condition, an `all`/`any` group or a list (all must match)."""
+    if isinstance(config, list):
+        config = {"all": config}
+    if not isinstance(config, dict):
+        raise ValueError("Guard must be a condition, a list of conditions or an all/any group")
+
+    for group, combine in (("all", all), ("any", any)):
+        if group in config:
+            if len(config) != 1:
+                raise ValueError(f"Guard '{group}' group cannot be combined with other options")
+            members = config[group]
+            if not isinstance(members, list) or not members:
+                raise ValueError(f"Guard '{group}' must be a non-empty list of conditions")
+            checks = [_compile(member) for member in members]
+            return lambda hass, checks=checks, combine=combine: combine(check(hass) for check in checks)
+
+    return _compile_condition(config)
+
+
+class TickerGuard:
+    """Precondition over entity states, evaluated on the event loop.
+
+    Only state machine lookups are allowed (no templates), so a false guard
+    costs a few dictionary reads instead of a state write and an executor job.
+    A condition matches when its entity exists and its state, or the given
+    attribute, is in `state`, not in `not_state` and within `above`/`below`.
+    """
+
+    def __init__(self, config: Union[Dict[str, Any], List[Any]]) -> None:
+        """Compile the guard configuration."""
+        self.config = config
+        self._check = _compile(config)
+
+    @callback
+    def async_check(self, hass: HomeAssistant) -> bool:
+        """Return if the guarded ticker should run now."""
+        try:
+            return self._check(hass)
+        except Exception as e:  # pylint: disable=broad-except
+            # A broken guard must not silently stop the ticker
+            _LOGGER.error(f"Error evaluating ticker guard: {e}")
+            return True
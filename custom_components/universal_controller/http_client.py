@@ -0,0 +1,237 @@
+"""Shared HTTP client exposed to Universal Controller ticker code."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    HTTP_CACHE_SIZE,
+    HTTP_DEFAULT_TIMEOUT,
+    HTTP_DEFAULT_TTL,
+    HTTP_HOST_CONCURRENCY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# (url, sorted params, sorted headers) identifying a GET request
+RequestKey = Tuple[str, Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str], ...]]
+
+
+class TickerHttpError(Exception):
+    """Raised to ticker code when an HTTP request fails."""
+
+
+class SharedHttpClient:
+    """HTTP client backed by Home Assistant's pooled aiohttp session.
+
+    Ticker code calls it from the executor; the request itself runs on the
+    event loop, where identical in-flight GET requests are coalesced, fresh
+    responses are served from a small LRU cache and each host is limited to
+    HTTP_HOST_CONCURRENCY concurrent requests. All shared state is only
+    touched on the event loop.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the client."""
+        self.hass = hass
+        self._inflight: Dict[RequestKey, asyncio.Future] = {}
+        self._cache: OrderedDict[RequestKey, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    def for_ticker(self, ticker_id: str) -> TickerHttpClient:
+        """Return the client object exposed to a ticker as `http`."""
+        return TickerHttpClient(self, ticker_id)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        timeout: float,
+        **kwargs: Any,
+    ) -> Tuple[Dict[str, Any], str]:
+        """Perform a request from a worker thread; returns (response, source)."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError("http must not be called from the event loop")
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._async_request(method, url, timeout, **kwargs), self.hass.loop
+        )
+        try:
+            return future.result(timeout + 1)
+        except (aiohttp.ClientError, asyncio.TimeoutError, TimeoutError) as e:
+            future.cancel()
+            raise TickerHttpError(f"{method} {url} failed: {type(e).__name__}: {e}") from e
+
+    async def _async_request(
+        self,
+        method: str,
+        url: str,
+        timeout: float,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        ttl: float = 0,
+        **kwargs: Any,
+    ) -> Tuple[Dict[str, Any], str]:
+        """Serve a request from the cache, an in-flight twin or the network."""
+        if method != "GET":
+            return await self._async_fetch(method, url, timeout, params, headers, **kwargs), "network"
+
+        key: RequestKey = (
+            url,
+            tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())),
+            tuple(sorted((str(k), str(v)) for k, v in (headers or {}).items())),
+        )
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                return cached[1], "cache"
+            del self._cache[key]
+
+        if key in self._inflight:
+            return await asyncio.shield(self._inflight[key]), "coalesced"
+
+        future = self.hass.loop.create_task(
+            self._async_fetch(method, url, timeout, params, headers)
+        )
+        self._inflight[key] = future
+        try:
+            response = await asyncio.shield(future)
+        finally:
+            self._inflight.pop(key, None)
+
+        if ttl > 0 and 200 <= response["status"] < 300:
+            self._cache[key] = (time.monotonic() + ttl, response)
+            self._cache.move_to_end(key)
+            while len(self._cache) > HTTP_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        return response, "network"
+
+    async def _async_fetch(
+        self,
+        method: str,
+        url: str,
+        timeout: float,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Perform the request on the pooled session within the host limit."""
+        host = urlsplit(url).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(HTTP_HOST_CONCURRENCY)
+
+        session = async_get_clientsession(self.hass)
+        async with self._host_limits[host]:
+            async with session.request(
+                method,
+                url,
+                params=params,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+                **kwargs,
+            ) as resp:
+                return {
+                    "status": resp.status,
+                    "url": str(resp.url),
+                    "headers": dict(resp.headers),
+                    "text": await resp.text(),
+                }
+
+    def clear(self) -> None:
+        """Drop cached responses."""
+        self._cache.clear()
+
+
+class TickerHttpClient:
+    """Per-ticker view of the shared client that keeps the ticker's statistics."""
+
+    def __init__(self, client: SharedHttpClient, ticker_id: str) -> None:
+        """Initialize the ticker client."""
+        self._client = client
+        self._ticker_id = ticker_id
+        self.requests = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.errors = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        ttl: float = HTTP_DEFAULT_TTL,
+        timeout: float = HTTP_DEFAULT_TIMEOUT,
+    ) -> Dict[str, Any]:
+        """GET a URL; responses are shared for `ttl` seconds."""
+        return self._request("GET", url, timeout, params=params, headers=headers, ttl=ttl)
+
+    def post(
+        self,
+        url: str,
+        json: Any = None,
+        data: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = HTTP_DEFAULT_TIMEOUT,
+    ) -> Dict[str, Any]:
+        """POST to a URL; never cached or coalesced."""
+        return self._request("POST", url, timeout, json=json, data=data, headers=headers)
+
+    def _request(self, method: str, url: str, timeout: float, **kwargs: Any) -> Dict[str, Any]:
+        """Perform a request and record its statistics."""
+        self.requests += 1
+        start = time.monotonic()
+        try:
+            response, source = self._client.request(method, url, timeout, **kwargs)
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            latency = time.monotonic() - start
+            self._latency_total += latency
+            self._latency_max = max(self._latency_max, latency)
+
+        if source == "cache":
+            self.cache_hits += 1
+        elif source == "coalesced":
+            self.coalesced += 1
+
+        # Parse per call so tickers never share a mutable body
+        result = dict(response)
+        try:
+            result["json"] = json.loads(response["text"]) if response["text"] else None
+        except ValueError:
+            result["json"] = None
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Return request statistics for the ticker attributes."""
+        if not self.requests:
+            return {"requests": 0}
+        return {
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "hit_rate": round((self.cache_hits + self.coalesced) / self.requests, 3),
+            "latency_ms_avg": round(self._latency_total / self.requests * 1000, 3),
+            "latency_ms_max": round(self._latency_max * 1000, 3),
+        }
@@ -0,0 +1,160 @@
+"""Event-loop-lag-aware load shedding for Universal Controller tickers."""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    LOAD_LAG_ELEVATED,
+    LOAD_LAG_SEVERE,
+    LOAD_PROBE_INTERVAL,
+    LOAD_QUEUE_ELEVATED,
+    LOAD_QUEUE_SEVERE,
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+)
+from .executor import TickerExecutor
+
+if TYPE_CHECKING:
+    from .ticker import UniversalControllerTicker
+
+_LOGGER = logging.getLogger(__name__)
+
+PRESSURE_NONE = 0
+PRESSURE_ELEVATED = 1
+PRESSURE_SEVERE = 2
+
+PRESSURE_NAMES = {
+    PRESSURE_NONE: "normal",
+    PRESSURE_ELEVATED: "elevated",
+    PRESSURE_SEVERE: "severe",
+}
+
+# Weight of the newest lag sample, smooths out single slow callbacks
+_LAG_SMOOTHING = 0.3
+
+
+class LoadMonitor:
+    """Watches loop lag and ticker executor queue depth and sheds low-priority runs.
+
+    Under elevated pressure low-priority runs are deferred until the loop
+    recovers; under severe pressure low-priority runs are skipped and
+    normal-priority runs are deferred. High-priority runs always execute.
+    """
+
+    def __init__(self, hass: HomeAssistant, executor: Optional[TickerExecutor] = None) -> None:
+        """Initialize the monitor."""
+        self.hass = hass
+        self._executor = executor
+        self.lag = 0.0
+        self.queue_depth = 0
+        self.level = PRESSURE_NONE
+        self.deferred_total = 0
+        self.skipped_total = 0
+        self._deferred: Dict[str, UniversalControllerTicker] = {}
+        self._expected = 0.0
+        self._handle = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start probing the event loop."""
+        self._expected = self.hass.loop.time() + LOAD_PROBE_INTERVAL
+        self._handle = self.hass.loop.call_at(self._expected, self._probe)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop probing and drop deferred runs."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._deferred.clear()
+
+    def _executor_queue_depth(self) -> int:
+        """Return the number of jobs waiting for an executor thread."""
+        if self._executor is not None:
+            return self._executor.queued
+        executor = getattr(self.hass.loop, "_default_executor", None)
+        queue = getattr(executor, "_work_queue", None)
+        return queue.qsize() if queue is not None else 0
+
+    @callback
+    def _probe(self) -> None:
+        """Measure how late the loop ran this callback and update the level."""
+        now = self.hass.loop.time()
+        sample = max(0.0, now - self._expected)
+        self.lag = _LAG_SMOOTHING * sample + (1 - _LAG_SMOOTHING) * self.lag
+        self.queue_depth = self._executor_queue_depth()
+
+        if self.lag >= LOAD_LAG_SEVERE or self.queue_depth >= LOAD_QUEUE_SEVERE:
+            level = PRESSURE_SEVERE
+        elif self.lag >= LOAD_LAG_ELEVATED or self.queue_depth >= LOAD_QUEUE_ELEVATED:
+            level = PRESSURE_ELEVATED
+        else:
+            level = PRESSURE_NONE
+
+        if level != self.level:
+            _LOGGER.info(
+                f"Ticker load pressure {PRESSURE_NAMES[self.level]} -> {PRESSURE_NAMES[level]} "
+                f"(lag {self.lag * 1000:.0f} ms, executor queue {self.queue_depth})"
+            )
+            self.level = level
+
+        if self.level == PRESSURE_NONE and self._deferred:
+            self._resume_deferred()
+
+        self._expected = now + LOAD_PROBE_INTERVAL
+        self._handle = self.hass.loop.call_at(self._expected, self._probe)
+
+    def _resume_deferred(self) -> None:
+        """Run the deferred tickers now that the loop has recovered."""
+        deferred = list(self._deferred.values())
+        self._deferred.clear()
+        _LOGGER.debug(f"Resuming {len(deferred)} deferred ticker runs")
+        for ticker in deferred:
+            if ticker.scheduled:
+                self.hass.async_create_task(ticker._periodic_execution(None))
+
+    @callback
+    def async_admit(self, ticker: UniversalControllerTicker) -> bool:
+        """Return if a scheduled run may execute now; defers or skips it otherwise."""
+        priority = ticker.priority
+        if self.level == PRESSURE_NONE or priority == PRIORITY_HIGH:
+            return True
+
+        if self.level == PRESSURE_SEVERE and priority == PRIORITY_LOW:
+            self.skipped_total += 1
+            ticker.shed_skipped += 1
+            return False
+
+        if priority == PRIORITY_LOW or self.level == PRESSURE_SEVERE:
+            # One pending run per ticker, later ticks are folded into it
+            if ticker.ticker_id not in self._deferred:
+                self._deferred[ticker.ticker_id] = ticker
+                self.deferred_total += 1
+                ticker.shed_deferred += 1
+            return False
+
+        return True
+
+    def discard(self, ticker_id: str) -> None:
+        """Forget a deferred run of a removed ticker."""
+        self._deferred.pop(ticker_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the load shedding state and counters."""
+        return {
+            "pressure": PRESSURE_NAMES[self.level],
+            "loop_lag_ms": round(self.lag * 1000, 1),
+            "executor_queue_depth": self.queue_depth,
+            "deferred_pending": len(self._deferred),
+            "deferred_total": self.deferred_total,
+            "skipped_total": self.skipped_total,
+            "thresholds": {
+                "lag_elevated_ms": LOAD_LAG_ELEVATED * 1000,
+                "lag_severe_ms": LOAD_LAG_SEVERE * 1000,
+                "queue_elevated": LOAD_QUEUE_ELEVATED,
+                "queue_severe": LOAD_QUEUE_SEVERE,
+            },
+        }
@@ -0,0 +1,205 @@
+"""On-demand profiling of Universal Controller ticker code."""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import logging
+import pstats
+import threading
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from .const import PROFILE_TRACEMALLOC_FRAMES
+
+_LOGGER = logging.getLogger(__name__)
+
+# cProfile is process wide on Python 3.12+, so only one ticker is profiled at a time
+_profile_lock = threading.Lock()
+
+# tracemalloc is process wide, so concurrent profiles share one session
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+_tracemalloc_owned = False
+
+
+def _tracemalloc_acquire() -> None:
+    """Start tracemalloc for a profiled execution."""
+    global _tracemalloc_users, _tracemalloc_owned
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0:
+            # Leave tracing alone if someone else (e.g. -X tracemalloc) started it
+            _tracemalloc_owned = not tracemalloc.is_tracing()
+            if _tracemalloc_owned:
+                tracemalloc.start(PROFILE_TRACEMALLOC_FRAMES)
+        _tracemalloc_users += 1
+
+
+def _tracemalloc_release() -> None:
+    """Stop tracemalloc once no profiled execution needs it."""
+    global _tracemalloc_users
+    with _tracemalloc_lock:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0 and _tracemalloc_owned:
+            tracemalloc.stop()
+
+
+class TickerProfiler:
+    """Profiles the next executions of a ticker.
+
+    `run` is called from the executor for each profiled execution;
+    `async_execution_done` is called on the event loop afterwards and
+    resolves `done` once the requested number of executions was profiled.
+
+    Only one profiler can be active (see `acquire`). Results are limited to
+    the ticker's code and the functions it calls; a function that other
+    threads also call while profiling still includes their calls.
+    """
+
+    def __init__(
+        self,
+        ticker_id: str,
+        executions: int = 1,
+        trace_memory: bool = False,
+        top: int = 20,
+    ) -> None:
+        """Initialize the profiler."""
+        self._ticker_id = ticker_id
+        self._filename = f"<ticker {ticker_id}>"
+        self._requested = executions
+        self._trace_memory = trace_memory
+        self._top = top
+        self._stats: Optional[pstats.Stats] = None
+        self._allocations: Dict[str, List[int]] = {}
+        self._peak = 0
+        self._errors: List[str] = []
+        self._locked = False
+        self.profiled = 0
+        self.done: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def acquire(self) -> bool:
+        """Claim the profiling slot, return False if another profile is active."""
+        self._locked = _profile_lock.acquire(blocking=False)
+        return self._locked
+
+    def release(self) -> None:
+        """Free the profiling slot."""
+        if self._locked:
+            self._locked = False
+            _profile_lock.release()
+
+    def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run one execution under cProfile and optionally tracemalloc.
+
+        If profiling cannot start (e.g. another profiling tool is active),
+        the execution runs unprofiled and the failure is reported in the
+        results instead of failing the ticker.
+        """
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except Exception as e:  # pylint: disable=broad-except
+            _LOGGER.warning(f"Cannot profile ticker {self._ticker_id}: {e}")
+            self._errors.append(str(e))
+            return func(*args)
+
+        try:
+            if self._trace_memory:
+                _tracemalloc_acquire()
+                tracemalloc.reset_peak()
+        except Exception as e:  # pylint: disable=broad-except
+            profile.disable()
+            _LOGGER.warning(f"Cannot trace memory of ticker {self._ticker_id}: {e}")
+            self._errors.append(str(e))
+            return func(*args)
+
+        try:
+            return func(*args)
+        finally:
+            profile.disable()
+            if self._stats is None:
+                self._stats = pstats.Stats(profile)
+            else:
+                self._stats.add(profile)
+
+            if self._trace_memory:
+                self._record_allocations()
+                _tracemalloc_release()
+
+    def _record_allocations(self) -> None:
+        """Add memory still held by allocations made from the ticker code."""
+        self._peak = max(self._peak, tracemalloc.get_traced_memory()[1])
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(True, self._filename, all_frames=True)]
+        )
+        for stat in snapshot.statistics("lineno"):
+            frame = stat.traceback[0]
+            location = f"{frame.filename}:{frame.lineno}"
+            totals = self._allocations.setdefault(location, [0, 0])
+            totals[0] += stat.size
+            totals[1] += stat.count
+
+    def async_execution_done(self) -> None:
+        """Count a finished profiled execution (runs on the event loop)."""
+        self.profiled += 1
+        if self.profiled >= self._requested and not self.done.done():
+            self.done.set_result(None)
+
+    def _ticker_entries(self) -> Dict[tuple, tuple]:
+        """Return the stats of the ticker's code and everything it called.
+
+        Drops functions that only ran in other threads, which cProfile
+        records too on Python 3.12+.
+        """
+        stats = self._stats.stats
+        callees: Dict[tuple, List[tuple]] = {}
+        for func, (_, _, _, _, callers) in stats.items():
+            for caller in callers:
+                callees.setdefault(caller, []).append(func)
+
+        pending = [func for func in stats if func[0] == self._filename]
+        reachable = set(pending)
+        while pending:
+            for callee in callees.get(pending.pop(), []):
+                if callee not in reachable:
+                    reachable.add(callee)
+                    pending.append(callee)
+        return {func: stats[func] for func in reachable}
+
+    def results(self) -> Dict[str, Any]:
+        """Return the top functions and allocation sites."""
+        functions = []
+        total_ms = 0.0
+        if self._stats is not None:
+            ticker_stats = self._ticker_entries()
+            total_ms = round(sum(entry[2] for entry in ticker_stats.values()) * 1000, 3)
+            entries = sorted(
+                ticker_stats.items(), key=lambda item: item[1][3], reverse=True
+            )
+            for (filename, lineno, name), (_, calls, tottime, cumtime, _) in entries[: self._top]:
+                functions.append({
+                    "function": f"{filename}:{lineno}({name})",
+                    "calls": calls,
+                    "total_ms": round(tottime * 1000, 3),
+                    "cumulative_ms": round(cumtime * 1000, 3),
+                })
+
+        result: Dict[str, Any] = {
+            "ticker_id": self._ticker_id,
+            "executions": self.profiled,
+            "total_ms": total_ms,
+            "functions": functions,
+        }
+        if self._errors:
+            result["errors"] = sorted(set(self._errors))
+
+        if self._trace_memory:
+            allocations = sorted(
+                self._allocations.items(), key=lambda item: item[1][0], reverse=True
+            )
+            result["peak_kb"] = round(self._peak / 1024, 1)
+            result["allocations"] = [
+                {"location": location, "size_kb": round(size / 1024, 1), "count": count}
+                for location, (size, count) in allocations[: self._top]
+            ]
+
+        return result
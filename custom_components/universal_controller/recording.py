@@ -0,0 +1,157 @@
+"""Recording of the state change stream for offline ticker replay."""
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import gzip
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import RECORDING_FLUSH_LINES
+
+_LOGGER = logging.getLogger(__name__)
+
+RECORDING_VERSION = 1
+
+# [offset ms, entity_id, state or None when removed, attributes or None when unchanged]
+RecordedEvent = Tuple[int, str, Optional[str], Optional[Dict[str, Any]]]
+
+
+class StateStreamRecorder:
+    """Writes matching `state_changed` events to a compact gzip JSON lines file.
+
+    The first line is a header with a snapshot of the matching states;
+    attributes are only written when they differ from the last record of
+    the same entity.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str, entity_globs: Optional[List[str]] = None) -> None:
+        """Initialize the recorder."""
+        self.hass = hass
+        self.path = path
+        self._globs = entity_globs or ["*"]
+        self._file = None
+        self._buffer: List[str] = []
+        self._last_attributes: Dict[str, Dict[str, Any]] = {}
+        self._started = 0.0
+        self._unsub = None
+        self._cancel_stop = None
+        self._write_task: Optional[asyncio.Task] = None
+        self.events = 0
+
+    @property
+    def recording(self) -> bool:
+        """Return if the recorder is listening."""
+        return self._unsub is not None
+
+    def _matches(self, entity_id: str) -> bool:
+        """Return if an entity should be recorded."""
+        return any(fnmatch.fnmatchcase(entity_id, glob) for glob in self._globs)
+
+    async def async_start(self, duration: float) -> None:
+        """Start recording for `duration` seconds."""
+        initial = {
+            state.entity_id: [state.state, dict(state.attributes)]
+            for state in self.hass.states.async_all()
+            if self._matches(state.entity_id)
+        }
+        self._last_attributes = {entity_id: value[1] for entity_id, value in initial.items()}
+        header = {
+            "version": RECORDING_VERSION,
+            "started": dt_util.utcnow().isoformat(),
+            "initial": initial,
+        }
+
+        self._file = await self.hass.async_add_executor_job(self._open, header)
+        self._started = time.monotonic()
+        self._unsub = self.hass.bus.async_listen(EVENT_STATE_CHANGED, self._handle_event)
+        self._cancel_stop = async_call_later(self.hass, duration, self._async_stop_later)
+        _LOGGER.info(f"Recording state changes to {self.path} for {duration}s")
+
+    def _open(self, header: Dict[str, Any]):
+        """Create the recording file and write its header."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        handle = gzip.open(self.path, "wt", encoding="utf-8")
+        handle.write(json.dumps(header, default=str) + "\n")
+        return handle
+
+    @callback
+    def _handle_event(self, event: Event) -> None:
+        """Buffer one state change."""
+        entity_id = event.data["entity_id"]
+        if not self._matches(entity_id):
+            return
+
+        new_state = event.data.get("new_state")
+        state = new_state.state if new_state is not None else None
+        attributes = None
+        if new_state is not None and new_state.attributes != self._last_attributes.get(entity_id):
+            attributes = dict(new_state.attributes)
+            self._last_attributes[entity_id] = attributes
+
+        offset = int((time.monotonic() - self._started) * 1000)
+        self._buffer.append(
+            json.dumps([offset, entity_id, state, attributes], separators=(",", ":"), default=str)
+        )
+        self.events += 1
+
+        if len(self._buffer) >= RECORDING_FLUSH_LINES:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Hand buffered lines to the executor, keeping writes in order."""
+        if not self._buffer:
+            return
+        lines, self._buffer = self._buffer, []
+        self._write_task = self.hass.async_create_task(
+            self._async_write(lines, self._write_task)
+        )
+
+    async def _async_write(self, lines: List[str], previous: Optional[asyncio.Task]) -> None:
+        """Write lines after the previous write finished."""
+        if previous is not None:
+            await previous
+        await self.hass.async_add_executor_job(self._file.write, "\n".join(lines) + "\n")
+
+    async def _async_stop_later(self, _now=None) -> None:
+        """Stop when the recording duration elapsed."""
+        self._cancel_stop = None
+        await self.async_stop()
+
+    async def async_stop(self) -> int:
+        """Stop recording and close the file; returns the number of events."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        if self._cancel_stop is not None:
+            self._cancel_stop()
+            self._cancel_stop = None
+
+        self._flush()
+        if self._write_task is not None:
+            await self._write_task
+            self._write_task = None
+        if self._file is not None:
+            await self.hass.async_add_executor_job(self._file.close)
+            self._file = None
+            _LOGGER.info(f"Recorded {self.events} state changes to {self.path}")
+
+        return self.events
+
+
+def load_recording(path: str) -> Tuple[Dict[str, Any], List[RecordedEvent]]:
+    """Read a recording file (runs in the executor)."""
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        header = json.loads(handle.readline())
+        if header.get("version") != RECORDING_VERSION:
+            raise ValueError(f"Unsupported recording version: {header.get('version')}")
+        events = [tuple(json.loads(line)) for line in handle if line.strip()]
+    return header, events
@@ -0,0 +1,373 @@
+"""Record and replay state streams to load-test tickers offline.
+
+Record the live `state_changed` stream with the `record_states` service,
+then replay the recording into a local Home Assistant core running a
+ticker configuration (an export of `.storage/universal_controller_tickers`):
+
+    python -m custom_components.universal_controller.replay \\
+        recording.jsonl.gz universal_controller_tickers --speed 10
+
+`--speed 0` replays as fast as possible; `--tick-every N` additionally runs
+all tickers after every N replayed events so they keep up with the stream.
+Service calls and HTTP requests made by ticker code are counted in the
+report and never reach real devices.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .batch import build_base_context, current_ticker_id
+from .const import DOMAIN
+from .http_client import SharedHttpClient
+from .recording import RecordedEvent, load_recording
+from .ticker import UniversalControllerTicker
+from .ticker_manager import TICKER_STORAGE_KEY, TickerManager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _ReplayServices:
+    """Service registry stand-in that counts calls instead of executing them."""
+
+    def __init__(self, services: Any, report: ReplayReport) -> None:
+        """Wrap the real service registry."""
+        self._services = services
+        self._report = report
+
+    def call(self, domain: str, service: str, *args: Any, **kwargs: Any) -> None:
+        """Count a service call made from the worker thread."""
+        self._report.count_service_call(domain, service)
+
+    async def async_call(self, domain: str, service: str, *args: Any, **kwargs: Any) -> None:
+        """Count a service call made from the event loop."""
+        self._report.count_service_call(domain, service)
+
+    def has_service(self, domain: str, service: str) -> bool:
+        """Report every service as available, as the live instance may have it."""
+        return True
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the real registry."""
+        return getattr(self._services, name)
+
+
+class _ReplayStates:
+    """State machine proxy that attributes writes to the executing ticker."""
+
+    def __init__(self, states: Any, report: ReplayReport) -> None:
+        """Wrap the real state machine."""
+        self._states = states
+        self._report = report
+
+    def set(self, *args: Any, **kwargs: Any) -> None:
+        """Count and apply a state write from the worker thread."""
+        self._report.count_state_write()
+        self._states.set(*args, **kwargs)
+
+    def async_set(self, *args: Any, **kwargs: Any) -> None:
+        """Count and apply a state write from the event loop."""
+        self._report.count_state_write()
+        self._states.async_set(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the real state machine."""
+        return getattr(self._states, name)
+
+
+class _ReplayHttpClient(SharedHttpClient):
+    """HTTP client that counts requests and answers them without the network.
+
+    Caching and coalescing work as in production, so the report shows the
+    requests that would actually have been sent; each is answered with an
+    empty 200 response.
+    """
+
+    def __init__(self, hass: HomeAssistant, report: ReplayReport) -> None:
+        """Initialize the client."""
+        super().__init__(hass)
+        self._report = report
+
+    def request(self, method: str, url: str, timeout: float, **kwargs: Any) -> Tuple[Dict[str, Any], str]:
+        """Count a request made by ticker code and serve it."""
+        self._report.count_http_request(method, url)
+        return super().request(method, url, timeout, **kwargs)
+
+    async def _async_fetch(self, method: str, url: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Answer a request that would have gone to the network."""
+        return {"status": 200, "url": url, "headers": {}, "text": ""}
+
+
+class _ReplayHass:
+    """`hass` handed to ticker code during a replay."""
+
+    def __init__(self, hass: HomeAssistant, services: _ReplayServices, states: _ReplayStates) -> None:
+        """Wrap the core with the counting services and states."""
+        self._hass = hass
+        self.services = services
+        self.states = states
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the real core."""
+        return getattr(self._hass, name)
+
+
+class ReplayReport:
+    """Collects per-ticker metrics while a recording is replayed."""
+
+    def __init__(self) -> None:
+        """Initialize the report."""
+        self._tickers: Dict[str, Dict[str, Any]] = {}
+        self.events = 0
+
+    def _ticker(self, ticker_id: str) -> Dict[str, Any]:
+        """Return the counters of a ticker."""
+        if ticker_id not in self._tickers:
+            self._tickers[ticker_id] = {
+                "executions": 0,
+                "errors": 0,
+                "latencies": [],
+                "state_writes": 0,
+                "service_calls": 0,
+                "services": {},
+                "http_requests": 0,
+                "http": {},
+            }
+        return self._tickers[ticker_id]
+
+    def count_execution(self, ticker_id: str, duration_ms: Optional[float], error: bool) -> None:
+        """Record one finished execution."""
+        counters = self._ticker(ticker_id)
+        counters["executions"] += 1
+        if error:
+            counters["errors"] += 1
+        if duration_ms is not None:
+            counters["latencies"].append(duration_ms)
+
+    def count_entity_write(self, ticker_id: str) -> None:
+        """Record a state write of a ticker's own entity."""
+        self._ticker(ticker_id)["state_writes"] += 1
+
+    def count_state_write(self) -> None:
+        """Record a state write made by ticker code."""
+        ticker_id = current_ticker_id()
+        if ticker_id is not None:
+            self._ticker(ticker_id)["state_writes"] += 1
+
+    def count_service_call(self, domain: str, service: str) -> None:
+        """Record a service call made by ticker code."""
+        ticker_id = current_ticker_id()
+        if ticker_id is None:
+            return
+        counters = self._ticker(ticker_id)
+        counters["service_calls"] += 1
+        name = f"{domain}.{service}"
+        counters["services"][name] = counters["services"].get(name, 0) + 1
+
+    def count_http_request(self, method: str, url: str) -> None:
+        """Record an HTTP request made by ticker code."""
+        ticker_id = current_ticker_id()
+        if ticker_id is None:
+            return
+        counters = self._ticker(ticker_id)
+        counters["http_requests"] += 1
+        name = f"{method} {urlsplit(url).netloc}"
+        counters["http"][name] = counters["http"].get(name, 0) + 1
+
+    def as_dict(self, duration: float, speed: float) -> Dict[str, Any]:
+        """Return the report."""
+        tickers = {}
+        for ticker_id, counters in sorted(self._tickers.items()):
+            latencies = sorted(counters["latencies"])
+            summary = {
+                "executions": counters["executions"],
+                "errors": counters["errors"],
+                "throughput_per_s": round(counters["executions"] / duration, 3) if duration else None,
+                "state_writes": counters["state_writes"],
+                "service_calls": counters["service_calls"],
+                "services": counters["services"],
+                "http_requests": counters["http_requests"],
+                "http": counters["http"],
+            }
+            if latencies:
+                p95 = latencies[min(len(latencies) - 1, math.ceil(len(latencies) * 0.95) - 1)]
+                summary.update({
+                    "latency_ms_avg": round(sum(latencies) / len(latencies), 3),
+                    "latency_ms_p95": round(p95, 3),
+                    "latency_ms_max": round(latencies[-1], 3),
+                })
+            tickers[ticker_id] = summary
+
+        return {
+            "events": self.events,
+            "duration_s": round(duration, 3),
+            "speed": speed or "max",
+            "events_per_s": round(self.events / duration, 1) if duration else None,
+            "tickers": tickers,
+        }
+
+
+@callback
+def async_seed_states(hass: HomeAssistant, header: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Set the states captured when the recording started; returns their attributes."""
+    attributes: Dict[str, Dict[str, Any]] = {}
+    for entity_id, (state, attrs) in header.get("initial", {}).items():
+        attributes[entity_id] = attrs
+        hass.states.async_set(entity_id, state, attrs)
+    return attributes
+
+
+async def async_replay(
+    hass: HomeAssistant,
+    header: Dict[str, Any],
+    events: List[RecordedEvent],
+    speed: float = 1.0,
+    tick_every: int = 0,
+) -> Dict[str, Any]:
+    """Replay recorded events into `hass` while it runs the stored tickers.
+
+    The tickers are loaded only once the counting proxies are in place, so
+    their first runs are reported and never reach real services or hosts.
+    """
+    report = ReplayReport()
+
+    # Ticker code sees counting proxies; calls never reach real services
+    manager = TickerManager(hass, http_client=_ReplayHttpClient(hass, report))
+    replay_hass = _ReplayHass(
+        hass, _ReplayServices(hass.services, report), _ReplayStates(hass.states, report)
+    )
+    manager.batcher.context_factory = lambda _hass: {
+        **build_base_context(hass),
+        "hass": replay_hass,
+        "states": replay_hass.states,
+        "services": replay_hass.services,
+    }
+    entity_ids: Dict[str, str] = {}
+
+    @callback
+    def _count_entity_write(event: Event) -> None:
+        """Count state writes of the tickers' own entities."""
+        ticker_id = entity_ids.get(event.data["entity_id"])
+        if ticker_id is not None:
+            report.count_entity_write(ticker_id)
+
+    @callback
+    def _ticker_added(ticker_id: str, ticker: UniversalControllerTicker) -> None:
+        """Record the executions and entity writes of a loaded ticker."""
+        entity_ids[f"sensor.{DOMAIN}_ticker_{ticker_id}"] = ticker_id
+        ticker.register_update_callback(
+            lambda: report.count_execution(ticker_id, ticker.last_duration_ms, ticker.last_error is not None)
+        )
+
+    manager.register_ticker_added_callback(_ticker_added)
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _count_entity_write)
+    try:
+        await manager.async_setup()
+        return await _async_replay_events(hass, manager, report, header, events, speed, tick_every)
+    finally:
+        unsub()
+        await manager.async_unload()
+
+
+async def _async_replay_events(
+    hass: HomeAssistant,
+    manager: TickerManager,
+    report: ReplayReport,
+    header: Dict[str, Any],
+    events: List[RecordedEvent],
+    speed: float,
+    tick_every: int,
+) -> Dict[str, Any]:
+    """Feed the recorded events into the state machine at the given speed."""
+    tickers = manager.tickers
+    attributes = async_seed_states(hass, header)
+
+    started = hass.loop.time()
+    for index, (offset, entity_id, state, attrs) in enumerate(events):
+        if speed > 0:
+            delay = started + offset / 1000 / speed - hass.loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        elif index % 100 == 0:
+            await asyncio.sleep(0)
+
+        if attrs is not None:
+            attributes[entity_id] = attrs
+        if state is None:
+            hass.states.async_remove(entity_id)
+        else:
+            hass.states.async_set(entity_id, state, attributes.get(entity_id))
+        report.events += 1
+
+        if tick_every and (index + 1) % tick_every == 0:
+            await manager.batcher.async_execute(
+                [ticker for ticker in tickers.values() if ticker.scheduled]
+            )
+
+    # Let runs that are due or in flight finish
+    await asyncio.sleep(manager.batcher.window * 2)
+    await hass.async_block_till_done()
+
+    return report.as_dict(hass.loop.time() - started, speed)
+
+
+async def _async_main(args: argparse.Namespace) -> Dict[str, Any]:
+    """Set up a throwaway Home Assistant core and run the replay."""
+    config_dir = tempfile.mkdtemp(prefix="uc_replay_")
+    try:
+        with open(args.tickers, encoding="utf-8") as handle:
+            tickers = json.load(handle)
+        if "data" not in tickers:
+            tickers = {"version": 1, "key": TICKER_STORAGE_KEY, "data": tickers}
+
+        os.makedirs(os.path.join(config_dir, ".storage"))
+        with open(os.path.join(config_dir, ".storage", TICKER_STORAGE_KEY), "w", encoding="utf-8") as handle:
+            json.dump(tickers, handle)
+
+        try:
+            hass = HomeAssistant(config_dir)
+        except TypeError:
+            # Home Assistant before 2023.4 set the config dir afterwards
+            hass = HomeAssistant()
+            hass.config.config_dir = config_dir
+
+        header, events = await hass.async_add_executor_job(load_recording, args.recording)
+        # Tickers should see the recorded states from their first run on
+        async_seed_states(hass, header)
+
+        try:
+            return await async_replay(hass, header, events, args.speed, args.tick_every)
+        finally:
+            await hass.async_stop(force=True)
+    finally:
+        shutil.rmtree(config_dir, ignore_errors=True)
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Replay a recorded state stream against tickers")
+    parser.add_argument("recording", help="recording file written by the record_states service")
+    parser.add_argument("tickers", help="export of .storage/universal_controller_tickers")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed factor, 0 for as fast as possible")
+    parser.add_argument("--tick-every", type=int, default=0, help="also run all tickers after every N events")
+    parser.add_argument("--verbose", action="store_true", help="show integration logging")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+    report = asyncio.run(_async_main(args))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""Drift-free scheduling for Universal Controller tickers."""
+from __future__ import annotations
+
+import logging
+import math
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import CRON_SEARCH_DAYS, SCHEDULE_STATS_SAMPLES
+
+_LOGGER = logging.getLogger(__name__)
+
+# (name, minimum, maximum) of the supported cron fields, seconds first
+_CRON_FIELDS = (
+    ("second", 0, 59),
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day", 1, 31),
+    ("month", 1, 12),
+    ("weekday", 0, 7),
+)
+
+# Longest length of each month, counting leap years
+_MONTH_DAYS = {1: 31, 2: 29, 3: 31, 4: 30, 5: 31, 6: 30, 7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31}
+
+
+def _parse_cron_field(field: str, name: str, minimum: int, maximum: int) -> List[int]:
+    """Parse one cron field (`*`, `*/n`, `a`, `a-b`, `a-b/n` and lists)."""
+    values: Set[int] = set()
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_str = part.split("/", 1)
+            step = int(step_str)
+            if step < 1:
+                raise ValueError(f"Invalid step in cron {name} field: {field}")
+
+        if part == "*":
+            start, end = minimum, maximum
+        elif "-" in part:
+            start_str, end_str = part.split("-", 1)
+            start, end = int(start_str), int(end_str)
+        else:
+            start = int(part)
+            end = maximum if step > 1 else start
+
+        if start < minimum or end > maximum or start > end:
+            raise ValueError(f"Cron {name} field out of range: {field}")
+
+        values.update(range(start, end + 1, step))
+
+    return sorted(values)
+
+
+class CronSchedule:
+    """Minimal cron expression (5 fields, or 6 with leading seconds)."""
+
+    def __init__(self, expression: str) -> None:
+        """Parse the cron expression."""
+        fields = expression.split()
+        if len(fields) == 5:
+            fields = ["0"] + fields
+        if len(fields) != 6:
+            raise ValueError(f"Cron expression needs 5 or 6 fields: {expression}")
+
+        try:
+            parsed = [
+                _parse_cron_field(field, name, minimum, maximum)
+                for field, (name, minimum, maximum) in zip(fields, _CRON_FIELDS)
+            ]
+        except ValueError as e:
+            raise ValueError(f"Invalid cron expression '{expression}': {e}") from e
+
+        self.expression = expression
+        self._seconds, self._minutes, self._hours, self._days, self._months = parsed[:5]
+        self._weekdays = {0 if day == 7 else day for day in parsed[5]}
+        self._any_day = fields[3] == "*"
+        self._any_weekday = fields[5] == "*"
+
+        # Days of month only combine with months when the weekday isn't restricted
+        # (otherwise either field matches); e.g. "0 9 31 2 *" never fires
+        if not self._any_day and self._any_weekday and not any(
+            day <= _MONTH_DAYS[month] for month in self._months for day in self._days
+        ):
+            raise ValueError(f"Cron expression never matches: {expression}")
+
+    def _day_matches(self, day: datetime) -> bool:
+        """Return if a date matches the day-of-month/day-of-week fields."""
+        day_match = day.day in self._days
+        weekday_match = (day.weekday() + 1) % 7 in self._weekdays
+        if self._any_day or self._any_weekday:
+            return day_match and weekday_match
+        # Like cron, restricting both fields matches either of them
+        return day_match or weekday_match
+
+    def next_after(self, after: datetime) -> datetime:
+        """Return the first matching time strictly after `after`."""
+        start = after.replace(microsecond=0) + timedelta(seconds=1)
+        day = start.replace(hour=0, minute=0, second=0)
+
+        for _ in range(CRON_SEARCH_DAYS):
+            same_day = day.date() == start.date()
+            if day.month in self._months and self._day_matches(day):
+                for hour in self._hours:
+                    if same_day and hour < start.hour:
+                        continue
+                    same_hour = same_day and hour == start.hour
+                    for minute in self._minutes:
+                        if same_hour and minute < start.minute:
+                            continue
+                        same_minute = same_hour and minute == start.minute
+                        for second in self._seconds:
+                            if same_minute and second < start.second:
+                                continue
+                            return day.replace(hour=hour, minute=minute, second=second)
+            day = (day + timedelta(days=1)).replace(hour=0, minute=0, second=0)
+
+        raise ValueError(f"Cron expression never matches: {self.expression}")
+
+    def interval_after(self, after: datetime) -> float:
+        """Return the seconds between the first two matches after `after`."""
+        first = self.next_after(after)
+        return (self.next_after(first) - first).total_seconds()
+
+
+class ScheduleStats:
+    """Lateness statistics of a ticker schedule.
+
+    Lateness is measured when the loop timer fires, so it covers event loop
+    delays but not the batch window or the wait for an executor worker
+    (see the executor's `queue_wait_ms_*` statistics for that).
+    """
+
+    def __init__(self, samples: int = SCHEDULE_STATS_SAMPLES) -> None:
+        """Initialize the statistics."""
+        self._lateness: Deque[float] = deque(maxlen=samples)
+        self.runs = 0
+        self.missed = 0
+        self.max_late_ms = 0.0
+
+    def record(self, late_ms: float) -> None:
+        """Record how late a scheduled run fired."""
+        self.runs += 1
+        self._lateness.append(late_ms)
+        self.max_late_ms = max(self.max_late_ms, late_ms)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as state attributes."""
+        if not self._lateness:
+            return {"runs": self.runs, "missed": self.missed}
+
+        ordered = sorted(self._lateness)
+        p95 = ordered[min(len(ordered) - 1, math.ceil(len(ordered) * 0.95) - 1)]
+        return {
+            "runs": self.runs,
+            "missed": self.missed,
+            "late_ms_avg": round(sum(ordered) / len(ordered), 3),
+            "late_ms_p95": round(p95, 3),
+            "late_ms_max": round(self.max_late_ms, 3),
+        }
+
+
+class TickerScheduler:
+    """Fires a ticker on a monotonic, drift-corrected interval or a cron schedule.
+
+    Deadlines are computed from the previous deadline rather than from the
+    time the callback ran, so lateness never accumulates and a timer firing
+    slightly early cannot run a cron match twice. When the loop falls more
+    than one interval behind, missed runs are skipped; a cron schedule
+    skips to its next future match and counts that as one missed run.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        action: Callable[[], Awaitable[Any]],
+        interval: Optional[float] = None,
+        cron: Optional[CronSchedule] = None,
+    ) -> None:
+        """Initialize the scheduler."""
+        if interval is None and cron is None:
+            raise ValueError("Either an interval or a cron schedule is required")
+
+        self.hass = hass
+        self._action = action
+        self._interval = interval
+        self._cron = cron
+        self._deadline = 0.0
+        # Wall clock time of the pending cron match
+        self._next_run: Optional[datetime] = None
+        self._handle = None
+        self.stats = ScheduleStats()
+
+    @property
+    def interval(self) -> float:
+        """Return the seconds between runs.
+
+        For a cron schedule this is the gap between the pending match and
+        the one after it.
+        """
+        if self._cron is None:
+            return self._interval
+        if self._next_run is None:
+            return self._cron.interval_after(dt_util.now())
+        return (self._cron.next_after(self._next_run) - self._next_run).total_seconds()
+
+    @callback
+    def async_start(self) -> None:
+        """Schedule the first run."""
+        self._deadline = self.hass.loop.time()
+        self._next_run = None
+        self._schedule_next()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop scheduling runs."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _schedule_next(self) -> None:
+        """Compute the next deadline and arm the loop timer."""
+        now = self.hass.loop.time()
+
+        if self._cron is not None:
+            wall_now = dt_util.now()
+            next_run = self._cron.next_after(self._next_run or wall_now)
+            if next_run <= wall_now:
+                self.stats.missed += 1
+                next_run = self._cron.next_after(wall_now)
+            self._next_run = next_run
+            delay = (dt_util.as_utc(next_run) - dt_util.as_utc(wall_now)).total_seconds()
+            self._deadline = now + delay
+        else:
+            self._deadline += self._interval
+            if self._deadline <= now:
+                missed = math.floor((now - self._deadline) / self._interval) + 1
+                self.stats.missed += missed
+                self._deadline += missed * self._interval
+
+        self._handle = self.hass.loop.call_at(self._deadline, self._fire)
+
+    @callback
+    def _fire(self) -> None:
+        """Run the action and arm the next deadline."""
+        self.stats.record((self.hass.loop.time() - self._deadline) * 1000)
+        self._schedule_next()
+        self.hass.async_create_task(self._action())
@@ -0,0 +1,206 @@
+"""Sensors derived from Universal Controller ticker results."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DATA_RESULT_SENSORS, DATA_TICKER_MANAGER, DOMAIN
+from .ticker import UniversalControllerTicker
+from .ticker_manager import TickerManager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up sensors for the numeric result fields of tickers."""
+    domain_data = hass.data[DOMAIN]
+
+    # Tickers are shared by all entries, so one entry at a time provides their
+    # sensors; when it unloads, another entry takes over (see async_unload_entry)
+    if DATA_RESULT_SENSORS in domain_data:
+        return
+
+    sensors = ResultSensors(domain_data[DATA_TICKER_MANAGER], entry.entry_id, async_add_entities)
+    domain_data[DATA_RESULT_SENSORS] = sensors
+    sensors.async_setup()
+
+
+class ResultSensors:
+    """Keeps the result sensor entities in sync with the ticker definitions."""
+
+    def __init__(
+        self, manager: TickerManager, entry_id: str, async_add_entities: AddEntitiesCallback
+    ) -> None:
+        """Initialize the sensor set."""
+        self.entry_id = entry_id
+        self._manager = manager
+        self._async_add_entities = async_add_entities
+        self._entities: Dict[str, TickerResultSensor] = {}
+        self._active = True
+
+    @callback
+    def async_setup(self) -> None:
+        """Add sensors for the loaded tickers and follow ticker changes."""
+        for ticker in self._manager.tickers.values():
+            self._async_sync(ticker)
+
+        self._manager.register_ticker_added_callback(self._ticker_changed)
+        self._manager.register_ticker_updated_callback(self._ticker_changed)
+        self._manager.register_ticker_removed_callback(self._ticker_removed)
+
+    @callback
+    def async_unload(self) -> None:
+        """Stop following ticker changes; the platform removes the entities."""
+        self._active = False
+        self._entities.clear()
+        self._manager.unregister_ticker_added_callback(self._ticker_changed)
+        self._manager.unregister_ticker_updated_callback(self._ticker_changed)
+        self._manager.unregister_ticker_removed_callback(self._ticker_removed)
+
+    @callback
+    def _ticker_changed(self, ticker_id: str, ticker: UniversalControllerTicker) -> None:
+        """Sync the sensors of a created or updated ticker."""
+        if self._active:
+            self._async_sync(ticker)
+
+    @callback
+    def _ticker_removed(self, ticker_id: str, ticker: UniversalControllerTicker) -> None:
+        """Remove the sensors of a deleted ticker."""
+        if not self._active:
+            return
+        for unique_id in [uid for uid, entity in self._entities.items() if entity.ticker is ticker]:
+            self._async_remove_entity(self._entities.pop(unique_id))
+
+    @callback
+    def _async_sync(self, ticker: UniversalControllerTicker) -> None:
+        """Add, update and remove sensors to match a ticker's definitions."""
+        wanted = {
+            TickerResultSensor.unique_id_for(ticker, definition): definition
+            for definition in ticker.sensors
+        }
+
+        for unique_id in [
+            uid for uid, entity in self._entities.items()
+            if entity.ticker is ticker and uid not in wanted
+        ]:
+            self._async_remove_entity(self._entities.pop(unique_id))
+
+        new_entities: List[TickerResultSensor] = []
+        for unique_id, definition in wanted.items():
+            if unique_id in self._entities:
+                self._entities[unique_id].async_set_definition(definition)
+            else:
+                entity = TickerResultSensor(ticker, definition)
+                self._entities[unique_id] = entity
+                new_entities.append(entity)
+
+        if new_entities:
+            self._async_add_entities(new_entities)
+
+    @staticmethod
+    @callback
+    def _async_remove_entity(entity: TickerResultSensor) -> None:
+        """Remove an entity that is no longer defined, with its registry entry."""
+        if entity.hass is None:
+            return
+        if entity.registry_entry is not None:
+            # Removing the registry entry also removes the entity
+            er.async_get(entity.hass).async_remove(entity.entity_id)
+        else:
+            entity.hass.async_create_task(entity.async_remove())
+
+
+class TickerResultSensor(SensorEntity):
+    """Numeric sensor mirroring one field of a ticker's result.
+
+    Changes smaller than the sensor's threshold are not written, so the
+    recorder only stores significant changes.
+    """
+
+    _attr_should_poll = False
+
+    def __init__(self, ticker: UniversalControllerTicker, definition: Dict[str, Any]) -> None:
+        """Initialize the sensor."""
+        self.ticker = ticker
+        self.suppressed_writes = 0
+        self._path: List[str] = []
+        self._threshold = 0.0
+        self._attr_unique_id = self.unique_id_for(ticker, definition)
+        self._apply_definition(definition)
+
+    @staticmethod
+    def unique_id_for(ticker: UniversalControllerTicker, definition: Dict[str, Any]) -> str:
+        """Return the unique id of a ticker's result sensor.
+
+        Keys only contain word characters, so the last `:` separates them
+        from the ticker id.
+        """
+        return f"{DOMAIN}_ticker_{ticker.ticker_id}:{definition['key']}"
+
+    def _apply_definition(self, definition: Dict[str, Any]) -> None:
+        """Apply a normalized sensor definition."""
+        self._definition = definition
+        self._path = definition["path"].split(".")[1:]
+        self._threshold = definition["threshold"]
+        self._attr_name = f"{self.ticker.name} {definition['name']}"
+        self._attr_native_unit_of_measurement = definition["unit_of_measurement"]
+        self._attr_device_class = definition["device_class"]
+        self._attr_state_class = definition["state_class"]
+
+    @callback
+    def async_set_definition(self, definition: Dict[str, Any]) -> None:
+        """Update the sensor after its ticker's definition changed."""
+        if definition == self._definition:
+            return
+        self._apply_definition(definition)
+        if self.hass is not None:
+            self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the ticker's executions."""
+        self.ticker.register_update_callback(self._handle_execution)
+        self._handle_execution()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop following the ticker."""
+        self.ticker.unregister_update_callback(self._handle_execution)
+
+    def _resolve(self) -> Optional[float]:
+        """Return the numeric value of the field in the last result."""
+        value: Any = self.ticker.last_result
+        for key in self._path:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        if value is None or isinstance(value, bool):
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    @callback
+    def _handle_execution(self) -> None:
+        """Write the new value if it changed significantly."""
+        if self.ticker.last_error is not None:
+            return
+
+        value = self._resolve()
+        if value is None:
+            return
+
+        current = self._attr_native_value
+        if current is not None and abs(value - current) < self._threshold:
+            self.suppressed_writes += 1
+            return
+
+        self._attr_native_value = value
+        self.async_write_ha_state()
@@ -0,0 +1,187 @@
+"""Persistent per-ticker key/value store for Universal Controller."""
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import storage
+
+from .const import DOMAIN, STATE_SAVE_DELAY, STATE_STORE_MAX_BYTES
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_STORAGE_VERSION = 1
+STATE_STORAGE_KEY = f"{DOMAIN}_ticker_state"
+
+
+class TickerStore:
+    """Key/value store exposed to ticker code as `store`.
+
+    Values must be JSON serializable and the serialized size of all keys and
+    values is capped at STATE_STORE_MAX_BYTES. Values are copied in and out,
+    so changes only take effect through `set`. Access is locked because
+    ticker code writes from the executor while saves read from the event loop.
+    """
+
+    def __init__(
+        self,
+        data: Optional[Dict[str, Any]] = None,
+        parent: Optional[TickerStateStore] = None,
+    ) -> None:
+        """Initialize the store."""
+        self._lock = threading.Lock()
+        self._data: Dict[str, Any] = {}
+        self._sizes: Dict[str, int] = {}
+        self._parent = parent
+        self.dirty = False
+        for key, value in (data or {}).items():
+            self._data[key] = value
+            self._sizes[key] = self._entry_size(key, json.dumps(value))
+
+    @staticmethod
+    def _entry_size(key: str, serialized: str) -> int:
+        """Return the stored size of a key and its serialized value."""
+        return len(json.dumps(key)) + len(serialized)
+
+    @property
+    def size(self) -> int:
+        """Return the serialized size of all values in bytes."""
+        with self._lock:
+            return sum(self._sizes.values())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a copy of a stored value."""
+        with self._lock:
+            if key not in self._data:
+                return default
+            return copy.deepcopy(self._data[key])
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a copy of a value."""
+        if not isinstance(key, str):
+            raise ValueError(f"store keys must be strings, not {type(key).__name__}")
+        try:
+            serialized = json.dumps(value)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"store value for '{key}' is not JSON serializable: {e}") from e
+        size = self._entry_size(key, serialized)
+        # Keep the value as it will be saved, detached from the caller's object
+        value = json.loads(serialized)
+
+        with self._lock:
+            total = sum(self._sizes.values()) - self._sizes.get(key, 0) + size
+            if total > STATE_STORE_MAX_BYTES:
+                raise ValueError(
+                    f"store size limit of {STATE_STORE_MAX_BYTES} bytes exceeded by '{key}'"
+                )
+            self._data[key] = value
+            self._sizes[key] = size
+            self.dirty = True
+
+    def delete(self, key: str) -> None:
+        """Remove a value."""
+        with self._lock:
+            if key in self._data:
+                del self._data[key]
+                del self._sizes[key]
+                self.dirty = True
+
+    def keys(self) -> List[str]:
+        """Return the stored keys."""
+        with self._lock:
+            return list(self._data)
+
+    def clear(self) -> None:
+        """Remove all values."""
+        with self._lock:
+            if self._data:
+                self._data.clear()
+                self._sizes.clear()
+                self.dirty = True
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a snapshot of the stored values."""
+        with self._lock:
+            return dict(self._data)
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            return copy.deepcopy(self._data[key])
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self.delete(key)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    @callback
+    def async_save_if_dirty(self) -> None:
+        """Schedule a debounced save after ticker code changed the store."""
+        if not self.dirty:
+            return
+        self.dirty = False
+        if self._parent is not None:
+            self._parent.async_schedule_save()
+
+
+class TickerStateStore:
+    """Loads, holds and persists the stores of all tickers."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the state store."""
+        self.hass = hass
+        self._store = storage.Store(hass, STATE_STORAGE_VERSION, STATE_STORAGE_KEY)
+        self._stores: Dict[str, TickerStore] = {}
+
+    async def async_load(self) -> None:
+        """Restore ticker stores from storage."""
+        try:
+            data = await self._store.async_load() or {}
+            for ticker_id, values in data.items():
+                self._stores[ticker_id] = TickerStore(values, parent=self)
+        except Exception as e:
+            _LOGGER.error(f"Error loading ticker state: {e}")
+
+    def get(self, ticker_id: str) -> TickerStore:
+        """Return the store of a ticker, creating it if needed."""
+        if ticker_id not in self._stores:
+            self._stores[ticker_id] = TickerStore(parent=self)
+        return self._stores[ticker_id]
+
+    @callback
+    def async_remove(self, ticker_id: str) -> None:
+        """Drop the store of a deleted ticker."""
+        if self._stores.pop(ticker_id, None) is not None:
+            self.async_schedule_save()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save all stores after STATE_SAVE_DELAY seconds of quiet."""
+        self._store.async_delay_save(self._data_to_save, STATE_SAVE_DELAY)
+
+    def _data_to_save(self) -> Dict[str, Dict[str, Any]]:
+        """Return the data to persist."""
+        return {
+            ticker_id: store.as_dict()
+            for ticker_id, store in self._stores.items()
+            if len(store)
+        }
+
+    async def async_flush(self) -> None:
+        """Write all stores immediately."""
+        try:
+            await self._store.async_save(self._data_to_save())
+        except Exception as e:
+            _LOGGER.error(f"Error saving ticker state: {e}")
@@ -3,19 +3,41 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
-import json
+from typing import Any, Dict, List, Optional, Tuple
 
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import Entity
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .analysis import BLOCKING_HAZARDS, HAZARD_SYNTAX, analyze_code
+from .batch import TickerBatcher
+from .console import ConsoleBuffer, ConsoleRing
+from .const import (
+    DOMAIN,
+    ERROR_BACKOFF_MAX,
+    ERROR_CIRCUIT_THRESHOLD,
+    MIN_INTERVAL_MS,
+    PRECISE_STATE_WRITE_INTERVAL,
+    PRIORITIES,
+    PRIORITY_NORMAL,
+)
+from .guard import TickerGuard
+from .load_shedding import LoadMonitor
+from .scheduler import CronSchedule, TickerScheduler
+from .http_client import SharedHttpClient
+from .profiler import TickerProfiler
+from .state_store import TickerStore
 
 _LOGGER = logging.getLogger(__name__)
 
+# Result path of a derived sensor, e.g. data.power or data.meter.total
+_SENSOR_PATH = re.compile(r"(data\.)?(\w+(\.\w+)*)")
+
 
 class UniversalControllerTicker(Entity):
     """Universal Controller Ticker that runs code periodically in the background."""
@@ -30,16 +52,47 @@ class UniversalControllerTicker(Entity):
         css_styles: str = "",
         update_interval: int = 30,
         enabled: bool = True,
+        batcher: Optional[TickerBatcher] = None,
+        update_interval_ms: Optional[int] = None,
+        schedule: Optional[str] = None,
+        state_store: Optional[TickerStore] = None,
+        http_client: Optional[SharedHttpClient] = None,
+        priority: str = PRIORITY_NORMAL,
+        load_monitor: Optional[LoadMonitor] = None,
+        sensors: Optional[List[Dict[str, Any]]] = None,
+        guard: Optional[Any] = None,
+        strict_analysis: bool = False,
+        auto_disabled: bool = False,
+        restored: bool = False,
     ) -> None:
         """Initialize the ticker."""
         self.hass = hass
         self._ticker_id = ticker_id
         self._name = name
+        self._code_warnings = self._analyze_code(user_code, strict_analysis)
+        # Warnings of code loaded from storage were already reported when it was saved
+        self._log_code_warnings(logging.DEBUG if restored else logging.WARNING)
         self._user_code = user_code
         self._html_template = html_template
         self._css_styles = css_styles
         self._update_interval = update_interval
+        self._update_interval_ms = None
+        self._schedule = None
+        self._update_interval_ms, self._schedule = self._resolve_precise_schedule(
+            update_interval_ms, schedule
+        )
         self._enabled = enabled
+        self._priority = self._validate_priority(priority)
+        self._sensors = self._normalize_sensors(sensors or [])
+        self._guard = self._build_guard(guard)
+        self._batcher = batcher
+        self._load_monitor = load_monitor
+        self._compiled_code = None
+        
+        # Values ticker code keeps across executions
+        self._state_store = state_store if state_store is not None else TickerStore()
+        self._http = http_client.for_ticker(ticker_id) if http_client is not None else None
+        self._profiler: Optional[TickerProfiler] = None
         
         # State management
         self._state = "idle"
@@ -48,12 +101,41 @@ class UniversalControllerTicker(Entity):
         self._last_result = None
         self._last_error = None
         self._cancel_interval = None
+        self._scheduler: Optional[TickerScheduler] = None
+        self._executing = False
+        self._execution_started = 0.0
+        self._last_duration_ms: Optional[float] = None
+        self._overruns = 0
+        # Throttling of the state writes of high-frequency tickers
+        self._written_state: Optional[str] = None
+        self._last_state_write = 0.0
+        self._cancel_state_write = None
+        
+        # Load shedding counters
+        self.shed_deferred = 0
+        self.shed_skipped = 0
+        self.executor_rejected = 0
+        
+        # Runs skipped because the guard was false
+        self.guard_skipped = 0
+        
+        # Error handling
+        self._consecutive_errors = 0
+        self._backoff_until = 0.0
+        # Restored from storage, so a tripped circuit survives restarts
+        self._auto_disabled = auto_disabled
+        if auto_disabled:
+            self._state = "auto_disabled"
+        
+        # Console output of recent executions
+        self._console = ConsoleRing(ticker_id)
         
         # Callback management
         self._update_callbacks = []
         
         # Entity attributes
         self._attr_unique_id = f"{DOMAIN}_ticker_{ticker_id}"
+        self.entity_id = f"sensor.{DOMAIN}_ticker_{ticker_id}"
         self._attr_name = f"Universal Controller Ticker: {name}"
         self._attr_icon = "mdi:timer-cog"
         
@@ -71,11 +153,28 @@ class UniversalControllerTicker(Entity):
             "html_template": self._html_template,
             "css_styles": self._css_styles,
             "update_interval": self._update_interval,
+            "update_interval_ms": self._update_interval_ms,
+            "schedule": self._schedule,
             "enabled": self._enabled,
+            "priority": self._priority,
             "last_execution": self._last_execution.isoformat() if self._last_execution else None,
             "execution_count": self._execution_count,
+            "last_duration_ms": self._last_duration_ms,
             "last_result": self._last_result,
             "last_error": self._last_error,
+            "schedule_stats": self.schedule_stats,
+            "shed_deferred": self.shed_deferred,
+            "shed_skipped": self.shed_skipped,
+            "executor_rejected": self.executor_rejected,
+            "guard": self.guard,
+            "guard_skipped": self.guard_skipped,
+            "code_warnings": self._code_warnings,
+            "isolated": self.isolated,
+            "store_size": self._state_store.size,
+            "http_stats": self._http.stats() if self._http is not None else None,
+            "consecutive_errors": self._consecutive_errors,
+            "backoff_seconds": self._backoff_delay(),
+            "auto_disabled": self._auto_disabled,
         }
     
     def register_update_callback(self, callback) -> None:
@@ -116,11 +215,67 @@ class UniversalControllerTicker(Entity):
         """Return the update interval."""
         return self._update_interval
     
+    @property
+    def priority(self) -> str:
+        """Return the priority class used for load shedding."""
+        return self._priority
+    
+    @property
+    def code_warnings(self) -> List[Dict[str, Any]]:
+        """Return the hazards static analysis found in the user code."""
+        return self._code_warnings
+    
+    @property
+    def isolated(self) -> bool:
+        """Return if the code may block, so it runs alone instead of in a batch."""
+        return any(warning["code"] in BLOCKING_HAZARDS for warning in self._code_warnings)
+    
+    @property
+    def guard(self) -> Optional[Any]:
+        """Return the guard condition configuration."""
+        return self._guard.config if self._guard is not None else None
+    
+    @property
+    def sensors(self) -> List[Dict[str, Any]]:
+        """Return the sensor definitions derived from result fields."""
+        return self._sensors
+    
+    @property
+    def interval_seconds(self) -> float:
+        """Return the effective interval in seconds.
+        
+        For a cron schedule this is the gap between its next two matches.
+        """
+        if self._schedule:
+            if self._scheduler is not None:
+                return self._scheduler.interval
+            return CronSchedule(self._schedule).interval_after(dt_util.now())
+        if self._update_interval_ms:
+            return self._update_interval_ms / 1000
+        return self._update_interval
+    
+    @property
+    def precise(self) -> bool:
+        """Return if the ticker uses the high-frequency scheduler."""
+        return bool(self._update_interval_ms or self._schedule)
+    
+    @property
+    def schedule_stats(self) -> Optional[Dict[str, Any]]:
+        """Return lateness statistics of the high-frequency scheduler."""
+        if self._scheduler is None:
+            return None
+        return {**self._scheduler.stats.as_dict(), "overruns": self._overruns}
+    
     @property
     def last_execution(self) -> Optional[datetime]:
         """Return the last execution time."""
         return self._last_execution
     
+    @property
+    def last_duration_ms(self) -> Optional[float]:
+        """Return how long the last execution took, including executor wait."""
+        return self._last_duration_ms
+    
     @property
     def last_result(self) -> Any:
         """Return the last execution result."""
@@ -136,11 +291,45 @@ class UniversalControllerTicker(Entity):
         """Return the execution count."""
         return self._execution_count
     
+    @property
+    def state_store(self) -> TickerStore:
+        """Return the store that persists across executions."""
+        return self._state_store
+    
+    @property
+    def profiler(self) -> Optional[TickerProfiler]:
+        """Return the profiler attached to upcoming executions, if any."""
+        return self._profiler
+    
+    @property
+    def scheduled(self) -> bool:
+        """Return if the ticker runs periodically."""
+        return self._cancel_interval is not None
+    
+    @property
+    def console(self) -> ConsoleRing:
+        """Return the console ring of recent executions."""
+        return self._console
+    
+    @property
+    def auto_disabled(self) -> bool:
+        """Return if the circuit breaker has disabled the ticker."""
+        return self._auto_disabled
+    
     @property
     def user_code(self) -> str:
         """Return the user code."""
         return self._user_code
     
+    @property
+    def compiled_code(self) -> Any:
+        """Return the user code compiled once and cached until it changes."""
+        if self._compiled_code is None:
+            self._compiled_code = compile(
+                f"result = {self._user_code}", f"<ticker {self._ticker_id}>", "exec"
+            )
+        return self._compiled_code
+    
     @property
     def html_template(self) -> str:
         """Return the HTML template."""
@@ -167,20 +356,36 @@ class UniversalControllerTicker(Entity):
         if self._cancel_interval:
             self._cancel_interval()
         
-        if not self._enabled or self._update_interval <= 0:
+        if not self._enabled or self._auto_disabled or (not self._schedule and self.interval_seconds <= 0):
             return
-            
-        _LOGGER.info(f"Starting ticker {self._ticker_id} with {self._update_interval}s interval")
+        
+        if self._schedule:
+            _LOGGER.info(f"Starting ticker {self._ticker_id} on schedule '{self._schedule}'")
+        else:
+            _LOGGER.info(f"Starting ticker {self._ticker_id} with {self.interval_seconds}s interval")
         
         # Execute immediately on start
-        await self._execute_code()
+        if self._guard_allows():
+            await self._execute_code()
+        if self._auto_disabled:
+            return
         
         # Schedule periodic execution
-        self._cancel_interval = async_track_time_interval(
-            self.hass,
-            self._periodic_execution,
-            timedelta(seconds=self._update_interval)
-        )
+        if self.precise:
+            self._scheduler = TickerScheduler(
+                self.hass,
+                lambda: self._periodic_execution(None),
+                interval=None if self._schedule else self.interval_seconds,
+                cron=CronSchedule(self._schedule) if self._schedule else None,
+            )
+            self._scheduler.async_start()
+            self._cancel_interval = self._scheduler.async_cancel
+        else:
+            self._cancel_interval = async_track_time_interval(
+                self.hass,
+                self._periodic_execution,
+                timedelta(seconds=self._update_interval)
+            )
         
         self._state = "running"
         self.async_write_ha_state()
@@ -190,6 +395,9 @@ class UniversalControllerTicker(Entity):
         if self._cancel_interval:
             self._cancel_interval()
             self._cancel_interval = None
+        if self._cancel_state_write:
+            self._cancel_state_write()
+            self._cancel_state_write = None
         
         self._state = "stopped"
         self.async_write_ha_state()
@@ -197,89 +405,326 @@ class UniversalControllerTicker(Entity):
     @callback
     async def _periodic_execution(self, now) -> None:
         """Periodic execution callback."""
-        await self._execute_code()
+        # Half an interval of slack so tick jitter doesn't skip an extra run
+        if time.monotonic() + self.interval_seconds / 2 < self._backoff_until:
+            _LOGGER.debug(f"Ticker {self._ticker_id} in error backoff, skipping execution")
+            return
+        
+        # Never queue a run behind one that is still executing
+        if self._executing:
+            self._overruns += 1
+            _LOGGER.debug(f"Ticker {self._ticker_id} still executing, skipping run")
+            return
+        
+        # Skip the run entirely while the guard condition is false
+        if not self._guard_allows():
+            return
+        
+        # Defer or skip low-priority runs while the event loop is under pressure
+        if self._load_monitor is not None and not self._load_monitor.async_admit(self):
+            return
+        
+        # High-frequency tickers run on their deadline instead of waiting for a batch,
+        # code that may block runs alone so it cannot delay the rest of a batch
+        if self._batcher is not None and not self.precise and not self.isolated:
+            self._batcher.async_submit(self)
+        else:
+            await self._execute_code()
+    
+    def _guard_allows(self) -> bool:
+        """Return if the guard permits a scheduled run, counting skips."""
+        if self._guard is None or self._guard.async_check(self.hass):
+            return True
+        self.guard_skipped += 1
+        _LOGGER.debug(f"Ticker {self._ticker_id} guard is false, skipping execution")
+        return False
     
     async def _execute_code(self) -> Dict[str, Any]:
         """Execute the user code."""
-        if not self._user_code.strip():
-            return {"error": "No code to execute"}
-        
+        batcher = self._batcher or TickerBatcher(self.hass)
+        results = await batcher.async_execute([self])
+        return results[self._ticker_id]
+    
+    def attach_profiler(self, profiler: TickerProfiler) -> None:
+        """Profile upcoming executions until the profiler is detached."""
+        self._profiler = profiler
+    
+    def detach_profiler(self, profiler: TickerProfiler) -> None:
+        """Stop profiling executions."""
+        if self._profiler is profiler:
+            self._profiler = None
+    
+    def execution_context(self) -> Dict[str, Any]:
+        """Return the context entries specific to this ticker."""
+        context = {"store": self._state_store}
+        if self._http is not None:
+            context["http"] = self._http
+        return context
+    
+    def _begin_execution(self) -> None:
+        """Mark the ticker as executing before its code is dispatched."""
+        _LOGGER.debug(f"Executing code for ticker {self._ticker_id}")
+        self._executing = True
+        self._execution_started = time.monotonic()
         self._state = "executing"
+        # High-frequency tickers skip this write, it would double their state writes
+        if not self.precise:
+            self.async_write_ha_state()
+    
+    def _abort_execution(self) -> None:
+        """Undo `_begin_execution` for a run the executor never accepted.
+        
+        The ticker's code did not run, so error counters are left alone.
+        """
+        self._executing = False
+        if self._auto_disabled:
+            self._state = "auto_disabled"
+        elif self._last_error is not None:
+            self._state = "error"
+        else:
+            self._state = "running" if self._execution_count else "idle"
         self.async_write_ha_state()
+    
+    def _complete_execution(
+        self, success: bool, value: Any, console: Optional[ConsoleBuffer] = None
+    ) -> Dict[str, Any]:
+        """Apply an execution outcome to the ticker state."""
+        self._executing = False
+        self._last_duration_ms = round((time.monotonic() - self._execution_started) * 1000, 3)
+        if console is not None:
+            self._console.add(console)
+        if self._profiler is not None:
+            self._profiler.async_execution_done()
+        self._state_store.async_save_if_dirty()
         
         try:
-            _LOGGER.debug(f"Executing code for ticker {self._ticker_id}")
-            
-            # Create execution context with Home Assistant access
-            context = {
-                "hass": self.hass,
-                "states": self.hass.states,
-                "services": self.hass.services,
-                "console": {
-                    "log": lambda *args: _LOGGER.info(f"Ticker {self._ticker_id}: {' '.join(str(arg) for arg in args)}"),
-                    "error": lambda *args: _LOGGER.error(f"Ticker {self._ticker_id}: {' '.join(str(arg) for arg in args)}"),
-                    "warn": lambda *args: _LOGGER.warning(f"Ticker {self._ticker_id}: {' '.join(str(arg) for arg in args)}"),
-                },
-                "Date": datetime,
-                "JSON": json,
-            }
-            
-            # Execute the code
-            result = await self.hass.async_add_executor_job(
-                self._execute_javascript, self._user_code, context
-            )
-            
-            self._last_result = result
-            self._last_error = None
-            self._execution_count += 1
-            self._last_execution = dt_util.utcnow()
-            self._state = "running"
-            
-            # Fire event with execution result
-            self.hass.bus.async_fire(f"universal_controller_ticker_executed", {
-                "ticker_id": self._ticker_id,
-                "result": result,
-                "timestamp": self._last_execution.isoformat(),
-                "execution_count": self._execution_count,
-            })
-            
-            _LOGGER.debug(f"Ticker {self._ticker_id} executed successfully: {result}")
-            
-        except Exception as e:
-            self._last_error = str(e)
-            self._last_result = None
-            self._state = "error"
-            _LOGGER.error(f"Error executing ticker {self._ticker_id}: {e}")
-            
-            # Fire error event
-            self.hass.bus.async_fire(f"universal_controller_ticker_error", {
-                "ticker_id": self._ticker_id,
-                "error": str(e),
-                "timestamp": dt_util.utcnow().isoformat(),
-            })
+            if success:
+                if self._consecutive_errors:
+                    _LOGGER.info(
+                        f"Ticker {self._ticker_id} recovered after {self._consecutive_errors} consecutive errors"
+                    )
+                self._reset_error_state()
+                self._last_result = value
+                self._last_error = None
+                self._execution_count += 1
+                self._last_execution = dt_util.utcnow()
+                self._state = "running"
+                
+                # Fire event with execution result
+                self.hass.bus.async_fire(f"universal_controller_ticker_executed", {
+                    "ticker_id": self._ticker_id,
+                    "result": value,
+                    "timestamp": self._last_execution.isoformat(),
+                    "execution_count": self._execution_count,
+                })
+                
+                _LOGGER.debug(f"Ticker {self._ticker_id} executed successfully: {value}")
+            else:
+                repeated = self._consecutive_errors > 0 and str(value) == self._last_error
+                self._last_error = str(value)
+                self._last_result = None
+                self._state = "error"
+                self._consecutive_errors += 1
+                self._backoff_until = time.monotonic() + self._backoff_delay()
+                
+                # Only log the first occurrence of an identical error at ERROR level
+                if repeated:
+                    _LOGGER.debug(
+                        f"Error executing ticker {self._ticker_id} "
+                        f"(repeated {self._consecutive_errors}x): {value}"
+                    )
+                else:
+                    _LOGGER.error(f"Error executing ticker {self._ticker_id}: {value}")
+                
+                # Fire error event
+                self.hass.bus.async_fire(f"universal_controller_ticker_error", {
+                    "ticker_id": self._ticker_id,
+                    "error": self._last_error,
+                    "consecutive_errors": self._consecutive_errors,
+                    "timestamp": dt_util.utcnow().isoformat(),
+                })
+                
+                if self._consecutive_errors >= ERROR_CIRCUIT_THRESHOLD:
+                    self._trip_circuit()
         
         finally:
-            self.async_write_ha_state()
+            self._async_write_run_state()
             self._notify_update_callbacks()
         
         return self._last_result or {"error": self._last_error}
     
-    def _execute_javascript(self, code: str, context: Dict[str, Any]) -> Any:
-        """Execute JavaScript/TypeScript code in a controlled environment."""
-        # For now, we'll use a simple eval approach
-        # In production, you might want to use a more secure sandbox
-        try:
-            # Simple JavaScript-like execution
-            # This is a basic implementation - you might want to use a proper JS engine
-            exec_globals = context.copy()
-            exec_locals = {}
+    @callback
+    def _async_write_run_state(self) -> None:
+        """Write the state after a run.
+        
+        High-frequency tickers write a changed state right away but an
+        unchanged one at most every PRECISE_STATE_WRITE_INTERVAL seconds,
+        with a trailing write so the latest result is never lost.
+        """
+        if not self.precise or self._state != self._written_state:
+            self._async_write_state_now()
+            return
+        if self._cancel_state_write is not None:
+            return
+        
+        delay = self._last_state_write + PRECISE_STATE_WRITE_INTERVAL - time.monotonic()
+        if delay <= 0:
+            self._async_write_state_now()
+        else:
+            self._cancel_state_write = async_call_later(self.hass, delay, self._async_write_state_now)
+    
+    @callback
+    def _async_write_state_now(self, _now=None) -> None:
+        """Write the state and remember when it was written."""
+        if self._cancel_state_write is not None:
+            if _now is None:
+                self._cancel_state_write()
+            self._cancel_state_write = None
+        self._written_state = self._state
+        self._last_state_write = time.monotonic()
+        self.async_write_ha_state()
+    
+    def _backoff_delay(self) -> float:
+        """Return the current error backoff delay in seconds."""
+        if not self._consecutive_errors:
+            return 0
+        delay = self.interval_seconds * 2 ** (self._consecutive_errors - 1)
+        return min(delay, ERROR_BACKOFF_MAX)
+    
+    def _resolve_precise_schedule(
+        self, update_interval_ms: Optional[int], schedule: Optional[str]
+    ) -> Tuple[Optional[int], Optional[str]]:
+        """Validate the millisecond interval and cron schedule.
+        
+        Returns the resulting (update_interval_ms, schedule); None arguments
+        keep the current value.
+        """
+        if update_interval_ms and update_interval_ms < MIN_INTERVAL_MS:
+            raise ValueError(f"update_interval_ms must be at least {MIN_INTERVAL_MS}")
+        
+        resolved_schedule = self._schedule
+        if schedule is not None:
+            schedule = schedule.strip()
+            if schedule:
+                CronSchedule(schedule)
+            resolved_schedule = schedule or None
+        
+        resolved_interval_ms = self._update_interval_ms
+        if update_interval_ms is not None:
+            resolved_interval_ms = update_interval_ms or None
+        
+        return resolved_interval_ms, resolved_schedule
+    
+    @staticmethod
+    def _validate_priority(priority: str) -> str:
+        """Validate the priority class."""
+        if priority not in PRIORITIES:
+            raise ValueError(f"priority must be one of {', '.join(PRIORITIES)}")
+        return priority
+    
+    def _analyze_code(self, user_code: str, strict: bool) -> List[Dict[str, Any]]:
+        """Analyze user code for performance hazards; strict mode rejects them."""
+        warnings = analyze_code(user_code)
+        hazards = [warning for warning in warnings if warning["code"] != HAZARD_SYNTAX]
+        if strict and hazards:
+            raise ValueError(
+                "user_code rejected by strict analysis: "
+                + "; ".join(f"line {hazard['line']}: {hazard['message']}" for hazard in hazards)
+            )
+        return warnings
+    
+    def _log_code_warnings(self, level: int) -> None:
+        """Log the analysis warnings of the current code."""
+        for warning in self._code_warnings:
+            _LOGGER.log(
+                level, f"Ticker {self._ticker_id} code line {warning['line']}: {warning['message']}"
+            )
+    
+    @staticmethod
+    def _build_guard(guard: Optional[Any]) -> Optional[TickerGuard]:
+        """Validate and compile the guard condition; empty means no guard."""
+        return TickerGuard(guard) if guard else None
+    
+    @staticmethod
+    def _normalize_sensors(sensors: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Validate derived sensor definitions and fill in defaults."""
+        if not isinstance(sensors, list):
+            raise ValueError("sensors must be a list")
+        
+        normalized = []
+        keys = set()
+        for sensor in sensors:
+            path = sensor.get("path") if isinstance(sensor, dict) else None
+            match = _SENSOR_PATH.fullmatch(str(path or ""))
+            if not match:
+                raise ValueError(f"invalid sensor path: {path}")
             
-            # Execute the code
-            exec(f"result = {code}", exec_globals, exec_locals)
-            return exec_locals.get("result", None)
+            key = match.group(2).replace(".", "_")
+            if key in keys:
+                raise ValueError(f"duplicate sensor path: {path}")
+            keys.add(key)
             
-        except Exception as e:
-            raise Exception(f"Code execution error: {e}")
+            device_class = sensor.get("device_class")
+            state_class = sensor.get("state_class", SensorStateClass.MEASUREMENT.value)
+            threshold = float(sensor.get("threshold") or 0)
+            if device_class is not None:
+                SensorDeviceClass(device_class)
+            if state_class is not None:
+                SensorStateClass(state_class)
+            if threshold < 0:
+                raise ValueError(f"sensor threshold must not be negative: {path}")
+            
+            normalized.append({
+                "path": f"data.{match.group(2)}",
+                "key": key,
+                "name": sensor.get("name") or key.replace("_", " ").capitalize(),
+                "unit_of_measurement": sensor.get("unit_of_measurement"),
+                "device_class": device_class,
+                "state_class": state_class,
+                "threshold": threshold,
+            })
+        return normalized
+    
+    def _reset_error_state(self) -> None:
+        """Clear error counters, backoff and the circuit breaker."""
+        self._consecutive_errors = 0
+        self._backoff_until = 0.0
+        self._auto_disabled = False
+    
+    async def async_reset(self) -> None:
+        """Clear the error backoff and circuit breaker and restart the ticker."""
+        was_disabled = self._auto_disabled
+        self._reset_error_state()
+        if was_disabled:
+            _LOGGER.info(f"Ticker {self._ticker_id} re-enabled after reset")
+            await self._stop_ticker()
+            if self._enabled:
+                await self._start_ticker()
+        self.async_write_ha_state()
+    
+    def _trip_circuit(self) -> None:
+        """Stop scheduling a ticker that keeps failing."""
+        if self._auto_disabled:
+            # Manual executions of a disabled ticker don't trip it again
+            return
+        
+        if self._cancel_interval:
+            self._cancel_interval()
+            self._cancel_interval = None
+        
+        self._auto_disabled = True
+        self._state = "auto_disabled"
+        _LOGGER.error(
+            f"Ticker {self._ticker_id} auto-disabled after {self._consecutive_errors} "
+            f"consecutive errors; update its code or call reset_ticker to re-enable it"
+        )
+        
+        self.hass.bus.async_fire(f"universal_controller_ticker_auto_disabled", {
+            "ticker_id": self._ticker_id,
+            "error": self._last_error,
+            "consecutive_errors": self._consecutive_errors,
+            "timestamp": dt_util.utcnow().isoformat(),
+        })
     
     async def update_config(
         self,
@@ -289,16 +734,47 @@ class UniversalControllerTicker(Entity):
         css_styles: Optional[str] = None,
         update_interval: Optional[int] = None,
         enabled: Optional[bool] = None,
+        update_interval_ms: Optional[int] = None,
+        schedule: Optional[str] = None,
+        priority: Optional[str] = None,
+        sensors: Optional[List[Dict[str, Any]]] = None,
+        guard: Optional[Any] = None,
+        strict_analysis: bool = False,
     ) -> None:
         """Update ticker configuration."""
         restart_needed = False
         
+        # Validate everything first so a rejected update leaves the ticker untouched
+        code_changed = user_code is not None and user_code != self._user_code
+        if code_changed:
+            code_warnings = self._analyze_code(user_code, strict_analysis)
+        new_guard = self._build_guard(guard) if guard is not None else self._guard
+        new_sensors = self._normalize_sensors(sensors) if sensors is not None else self._sensors
+        new_priority = self._validate_priority(priority) if priority is not None else self._priority
+        new_interval_ms, new_schedule = self._resolve_precise_schedule(update_interval_ms, schedule)
+        
+        self._guard = new_guard
+        self._sensors = new_sensors
+        self._priority = new_priority
+        if (new_interval_ms, new_schedule) != (self._update_interval_ms, self._schedule):
+            self._update_interval_ms = new_interval_ms
+            self._schedule = new_schedule
+            restart_needed = True
+        
         if name is not None:
             self._name = name
             self._attr_name = f"Universal Controller Ticker: {name}"
         
-        if user_code is not None:
+        if code_changed:
             self._user_code = user_code
+            self._code_warnings = code_warnings
+            self._compiled_code = None
+            self._log_code_warnings(logging.WARNING)
+            
+            # New code gets a fresh start from the circuit breaker
+            if self._auto_disabled:
+                restart_needed = True
+            self._reset_error_state()
         
         if html_template is not None:
             self._html_template = html_template
@@ -313,6 +789,8 @@ class UniversalControllerTicker(Entity):
         if enabled is not None and enabled != self._enabled:
             self._enabled = enabled
             restart_needed = True
+            if enabled:
+                self._reset_error_state()
         
         # Restart ticker if needed
         if restart_needed:
@@ -331,10 +809,18 @@ class UniversalControllerTicker(Entity):
             "html_template": self._html_template,
             "css_styles": self._css_styles,
             "update_interval": self._update_interval,
+            "update_interval_ms": self._update_interval_ms,
+            "schedule": self._schedule,
+            "priority": self._priority,
+            "sensors": self._sensors,
+            "guard": self.guard,
+            "code_warnings": self._code_warnings,
             "enabled": self._enabled,
             "state": self._state,
             "last_execution": self._last_execution.isoformat() if self._last_execution else None,
             "execution_count": self._execution_count,
             "last_result": self._last_result,
             "last_error": self._last_error,
+            "consecutive_errors": self._consecutive_errors,
+            "auto_disabled": self._auto_disabled,
         }
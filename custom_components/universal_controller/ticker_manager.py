@@ -1,14 +1,27 @@
 """Ticker Manager for Universal Controller."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers import storage
 
+from .batch import TickerBatcher
+from .executor import TickerExecutor
+from .http_client import SharedHttpClient
+from .load_shedding import LoadMonitor
+from .profiler import TickerProfiler
+from .state_store import TickerStateStore
 from .ticker import UniversalControllerTicker
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    EXECUTOR_QUEUE_SIZE,
+    EXECUTOR_WORKERS,
+    PRIORITY_NORMAL,
+    PROFILE_TIMEOUT,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,40 +32,105 @@ TICKER_STORAGE_KEY = f"{DOMAIN}_tickers"
 class TickerManager:
     """Manages Universal Controller ticker instances."""
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        executor_workers: int = EXECUTOR_WORKERS,
+        executor_queue_size: int = EXECUTOR_QUEUE_SIZE,
+        strict_analysis: bool = False,
+        http_client: Optional[SharedHttpClient] = None,
+    ) -> None:
         """Initialize the ticker manager."""
         self.hass = hass
+        # Reject saved code with performance hazards instead of only warning
+        self._strict_analysis = strict_analysis
         self._tickers: Dict[str, UniversalControllerTicker] = {}
         self._store = storage.Store(hass, TICKER_STORAGE_VERSION, TICKER_STORAGE_KEY)
         self._ticker_added_callbacks = []
+        self._ticker_updated_callbacks = []
+        self._ticker_removed_callbacks = []
+        # Ticker code runs on its own threads, apart from Home Assistant's executor
+        self._executor = TickerExecutor(hass, executor_workers, executor_queue_size)
+        self._batcher = TickerBatcher(hass, executor=self._executor)
+        self._state_store = TickerStateStore(hass)
+        self._http_client = http_client or SharedHttpClient(hass)
+        self._load_monitor = LoadMonitor(hass, self._executor)
+        self._unsub_auto_disabled: Optional[Callable[[], None]] = None
+        # Stored configs that failed validation on load, saved back unchanged
+        self._invalid_configs: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def tickers(self) -> Dict[str, UniversalControllerTicker]:
+        """Return the loaded tickers by id."""
+        return self._tickers
+
+    @property
+    def batcher(self) -> TickerBatcher:
+        """Return the batcher executing ticker code."""
+        return self._batcher
 
     async def async_setup(self) -> None:
         """Set up the ticker manager."""
+        # Restore ticker stores before any ticker runs
+        await self._state_store.async_load()
+        self._load_monitor.async_start()
+
+        # Store circuit breaker trips so they survive a restart
+        self._unsub_auto_disabled = self.hass.bus.async_listen(
+            "universal_controller_ticker_auto_disabled", self._handle_auto_disabled
+        )
+
         # Load existing tickers from storage
         await self._load_tickers()
 
+    async def _handle_auto_disabled(self, event: Event) -> None:
+        """Save the tickers after one was auto-disabled."""
+        if event.data.get("ticker_id") in self._tickers:
+            await self._save_tickers()
+
     async def _load_tickers(self) -> None:
         """Load tickers from storage."""
         try:
             data = await self._store.async_load() or {}
             
             for ticker_id, config in data.items():
-                ticker = UniversalControllerTicker(
-                    self.hass,
-                    ticker_id=ticker_id,
-                    name=config.get("name", "Unknown Ticker"),
-                    user_code=config.get("user_code", ""),
-                    html_template=config.get("html_template", ""),
-                    css_styles=config.get("css_styles", ""),
-                    update_interval=config.get("update_interval", 30),
-                    enabled=config.get("enabled", True),
-                )
+                try:
+                    ticker = UniversalControllerTicker(
+                        self.hass,
+                        ticker_id=ticker_id,
+                        name=config.get("name", "Unknown Ticker"),
+                        user_code=config.get("user_code", ""),
+                        html_template=config.get("html_template", ""),
+                        css_styles=config.get("css_styles", ""),
+                        update_interval=config.get("update_interval", 30),
+                        enabled=config.get("enabled", True),
+                        batcher=self._batcher,
+                        update_interval_ms=config.get("update_interval_ms"),
+                        schedule=config.get("schedule"),
+                        state_store=self._state_store.get(ticker_id),
+                        http_client=self._http_client,
+                        priority=config.get("priority", PRIORITY_NORMAL),
+                        load_monitor=self._load_monitor,
+                        sensors=config.get("sensors"),
+                        guard=config.get("guard"),
+                        auto_disabled=config.get("auto_disabled", False),
+                        restored=True,
+                    )
+                except ValueError as e:
+                    # Stricter validation must never delete a stored ticker
+                    _LOGGER.error(
+                        f"Stored ticker {ticker_id} is invalid and was not loaded: {e}; "
+                        f"its configuration is kept until it is deleted"
+                    )
+                    self._invalid_configs[ticker_id] = config
+                    continue
                 
                 self._tickers[ticker_id] = ticker
                 
                 # Add entity to Home Assistant
                 entity_id = f"sensor.{DOMAIN}_ticker_{ticker_id}"
                 self.hass.states.async_set(entity_id, ticker.state, ticker.extra_state_attributes)
+                self._notify_ticker_added(ticker_id, ticker)
                 
                 # Start the ticker if enabled
                 if ticker._enabled:
@@ -66,7 +144,7 @@ class TickerManager:
     async def _save_tickers(self) -> None:
         """Save tickers to storage."""
         try:
-            data = {}
+            data = dict(self._invalid_configs)
             for ticker_id, ticker in self._tickers.items():
                 data[ticker_id] = ticker.get_config()
             
@@ -80,6 +158,11 @@ class TickerManager:
         """Register a callback for when a ticker is added."""
         self._ticker_added_callbacks.append(callback)
 
+    def unregister_ticker_added_callback(self, callback) -> None:
+        """Unregister a ticker added callback."""
+        if callback in self._ticker_added_callbacks:
+            self._ticker_added_callbacks.remove(callback)
+
     def _notify_ticker_added(self, ticker_id: str, ticker: UniversalControllerTicker) -> None:
         """Notify all callbacks that a ticker was added."""
         for callback in self._ticker_added_callbacks:
@@ -88,6 +171,40 @@ class TickerManager:
             except Exception as e:
                 _LOGGER.error(f"Error calling ticker added callback: {e}")
 
+    def register_ticker_updated_callback(self, callback) -> None:
+        """Register a callback for when a ticker's configuration changed."""
+        self._ticker_updated_callbacks.append(callback)
+
+    def unregister_ticker_updated_callback(self, callback) -> None:
+        """Unregister a ticker updated callback."""
+        if callback in self._ticker_updated_callbacks:
+            self._ticker_updated_callbacks.remove(callback)
+
+    def _notify_ticker_updated(self, ticker_id: str, ticker: UniversalControllerTicker) -> None:
+        """Notify all callbacks that a ticker was updated."""
+        for callback in self._ticker_updated_callbacks:
+            try:
+                callback(ticker_id, ticker)
+            except Exception as e:
+                _LOGGER.error(f"Error calling ticker updated callback: {e}")
+
+    def register_ticker_removed_callback(self, callback) -> None:
+        """Register a callback for when a ticker is deleted."""
+        self._ticker_removed_callbacks.append(callback)
+
+    def unregister_ticker_removed_callback(self, callback) -> None:
+        """Unregister a ticker removed callback."""
+        if callback in self._ticker_removed_callbacks:
+            self._ticker_removed_callbacks.remove(callback)
+
+    def _notify_ticker_removed(self, ticker_id: str, ticker: UniversalControllerTicker) -> None:
+        """Notify all callbacks that a ticker was deleted."""
+        for callback in self._ticker_removed_callbacks:
+            try:
+                callback(ticker_id, ticker)
+            except Exception as e:
+                _LOGGER.error(f"Error calling ticker removed callback: {e}")
+
     async def create_ticker(
         self,
         ticker_id: str,
@@ -97,22 +214,41 @@ class TickerManager:
         css_styles: str = "",
         update_interval: int = 30,
         enabled: bool = True,
+        update_interval_ms: Optional[int] = None,
+        schedule: Optional[str] = None,
+        priority: str = PRIORITY_NORMAL,
+        sensors: Optional[List[Dict[str, Any]]] = None,
+        guard: Optional[Any] = None,
     ) -> bool:
         """Create a new ticker."""
-        if ticker_id in self._tickers:
+        if ticker_id in self._tickers or ticker_id in self._invalid_configs:
             _LOGGER.error(f"Ticker {ticker_id} already exists")
             return False
 
-        ticker = UniversalControllerTicker(
-            self.hass,
-            ticker_id=ticker_id,
-            name=name,
-            user_code=user_code,
-            html_template=html_template,
-            css_styles=css_styles,
-            update_interval=update_interval,
-            enabled=enabled,
-        )
+        try:
+            ticker = UniversalControllerTicker(
+                self.hass,
+                ticker_id=ticker_id,
+                name=name,
+                user_code=user_code,
+                html_template=html_template,
+                css_styles=css_styles,
+                update_interval=update_interval,
+                enabled=enabled,
+                batcher=self._batcher,
+                update_interval_ms=update_interval_ms,
+                schedule=schedule,
+                state_store=self._state_store.get(ticker_id),
+                http_client=self._http_client,
+                priority=priority,
+                load_monitor=self._load_monitor,
+                sensors=sensors,
+                guard=guard,
+                strict_analysis=self._strict_analysis,
+            )
+        except ValueError as e:
+            _LOGGER.error(f"Invalid configuration for ticker {ticker_id}: {e}")
+            return False
 
         self._tickers[ticker_id] = ticker
         
@@ -138,6 +274,11 @@ class TickerManager:
         css_styles: Optional[str] = None,
         update_interval: Optional[int] = None,
         enabled: Optional[bool] = None,
+        update_interval_ms: Optional[int] = None,
+        schedule: Optional[str] = None,
+        priority: Optional[str] = None,
+        sensors: Optional[List[Dict[str, Any]]] = None,
+        guard: Optional[Any] = None,
     ) -> bool:
         """Update an existing ticker."""
         if ticker_id not in self._tickers:
@@ -145,18 +286,29 @@ class TickerManager:
             return False
 
         ticker = self._tickers[ticker_id]
-        await ticker.update_config(
-            name=name,
-            user_code=user_code,
-            html_template=html_template,
-            css_styles=css_styles,
-            update_interval=update_interval,
-            enabled=enabled,
-        )
+        try:
+            await ticker.update_config(
+                name=name,
+                user_code=user_code,
+                html_template=html_template,
+                css_styles=css_styles,
+                update_interval=update_interval,
+                enabled=enabled,
+                update_interval_ms=update_interval_ms,
+                schedule=schedule,
+                priority=priority,
+                sensors=sensors,
+                guard=guard,
+                strict_analysis=self._strict_analysis,
+            )
+        except ValueError as e:
+            _LOGGER.error(f"Invalid configuration for ticker {ticker_id}: {e}")
+            return False
 
         # Update entity state
         entity_id = f"sensor.{DOMAIN}_ticker_{ticker_id}"
         self.hass.states.async_set(entity_id, ticker.state, ticker.extra_state_attributes)
+        self._notify_ticker_updated(ticker_id, ticker)
 
         # Save to storage
         await self._save_tickers()
@@ -166,6 +318,11 @@ class TickerManager:
 
     async def delete_ticker(self, ticker_id: str) -> bool:
         """Delete a ticker."""
+        if self._invalid_configs.pop(ticker_id, None) is not None:
+            await self._save_tickers()
+            _LOGGER.info(f"Deleted invalid stored ticker: {ticker_id}")
+            return True
+
         if ticker_id not in self._tickers:
             _LOGGER.error(f"Ticker {ticker_id} does not exist")
             return False
@@ -174,6 +331,9 @@ class TickerManager:
         
         # Stop the ticker
         await ticker._stop_ticker()
+        self._batcher.discard(ticker_id)
+        self._state_store.async_remove(ticker_id)
+        self._load_monitor.discard(ticker_id)
 
         # Remove from tickers
         del self._tickers[ticker_id]
@@ -181,6 +341,7 @@ class TickerManager:
         # Remove entity from Home Assistant
         entity_id = f"sensor.{DOMAIN}_ticker_{ticker_id}"
         self.hass.states.async_remove(entity_id)
+        self._notify_ticker_removed(ticker_id, ticker)
 
         # Save to storage
         await self._save_tickers()
@@ -203,6 +364,24 @@ class TickerManager:
 
         return result
 
+    async def reset_ticker(self, ticker_id: str) -> bool:
+        """Clear a ticker's error backoff and circuit breaker."""
+        if ticker_id not in self._tickers:
+            _LOGGER.error(f"Ticker {ticker_id} does not exist")
+            return False
+
+        ticker = self._tickers[ticker_id]
+        await ticker.async_reset()
+
+        # Update entity state
+        entity_id = f"sensor.{DOMAIN}_ticker_{ticker_id}"
+        self.hass.states.async_set(entity_id, ticker.state, ticker.extra_state_attributes)
+
+        # Save to storage so the circuit stays closed after a restart
+        await self._save_tickers()
+
+        return True
+
     def get_ticker(self, ticker_id: str) -> Optional[Dict[str, Any]]:
         """Get ticker configuration and status."""
         if ticker_id not in self._tickers:
@@ -217,10 +396,93 @@ class TickerManager:
             for ticker_id, ticker in self._tickers.items()
         }
 
+    async def profile_ticker(
+        self,
+        ticker_id: str,
+        executions: int = 1,
+        trace_memory: bool = False,
+        top: int = 20,
+    ) -> Optional[Dict[str, Any]]:
+        """Profile the next executions of a ticker and return the results."""
+        if ticker_id not in self._tickers:
+            _LOGGER.error(f"Ticker {ticker_id} does not exist")
+            return None
+
+        ticker = self._tickers[ticker_id]
+        profiler = TickerProfiler(ticker_id, executions, trace_memory, top)
+        if not profiler.acquire():
+            _LOGGER.warning(f"Cannot profile ticker {ticker_id}: another profile is running")
+            return {"ticker_id": ticker_id, "busy": True}
+        ticker.attach_profiler(profiler)
+
+        try:
+            if ticker.scheduled:
+                # Wait for the scheduled executions
+                timeout = min(PROFILE_TIMEOUT, executions * ticker.interval_seconds * 2 + 30)
+                await asyncio.wait_for(asyncio.shield(profiler.done), timeout)
+            else:
+                # Stopped tickers are executed directly
+                for _ in range(executions):
+                    await ticker._execute_code()
+        except asyncio.TimeoutError:
+            _LOGGER.warning(
+                f"Profiling ticker {ticker_id} timed out after "
+                f"{profiler.profiled} of {executions} executions"
+            )
+        finally:
+            # Profiling never outlives the request
+            ticker.detach_profiler(profiler)
+            profiler.release()
+
+        return profiler.results()
+
+    def get_load_stats(self) -> Dict[str, Any]:
+        """Get load shedding state, counters and per-ticker shed counts."""
+        return {
+            **self._load_monitor.stats(),
+            "executor": self._executor.stats(),
+            "guard_skipped_total": sum(ticker.guard_skipped for ticker in self._tickers.values()),
+            "tickers": {
+                ticker_id: {
+                    "priority": ticker.priority,
+                    "deferred": ticker.shed_deferred,
+                    "skipped": ticker.shed_skipped,
+                    "rejected": ticker.executor_rejected,
+                    "guard_skipped": ticker.guard_skipped,
+                    "isolated": ticker.isolated,
+                }
+                for ticker_id, ticker in self._tickers.items()
+            },
+        }
+
+    def get_console(self, ticker_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Get the buffered console output of a ticker."""
+        if ticker_id not in self._tickers:
+            return None
+
+        return self._tickers[ticker_id].console.entries()
+
+    def subscribe_console(
+        self, ticker_id: str, subscriber: Callable[[List[Dict[str, Any]]], None]
+    ) -> Optional[Callable[[], None]]:
+        """Stream console output of a ticker to a subscriber."""
+        if ticker_id not in self._tickers:
+            return None
+
+        return self._tickers[ticker_id].console.subscribe(subscriber)
+
     async def async_unload(self) -> None:
         """Unload all tickers."""
+        self._load_monitor.async_stop()
+        if self._unsub_auto_disabled:
+            self._unsub_auto_disabled()
+            self._unsub_auto_disabled = None
+        await self._batcher.async_shutdown()
         for ticker in self._tickers.values():
             await ticker._stop_ticker()
+        await self._executor.async_shutdown()
         
+        await self._state_store.async_flush()
+        self._http_client.clear()
         self._tickers.clear()
         _LOGGER.info("All tickers unloaded")
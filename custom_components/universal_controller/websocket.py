@@ -0,0 +1,62 @@
+"""Websocket API for Universal Controller."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List, Optional
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_TICKER_MANAGER, DOMAIN
+from .ticker_manager import TickerManager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _find_ticker_manager(hass: HomeAssistant, ticker_id: str) -> Optional[TickerManager]:
+    """Return the shared ticker manager if it owns the ticker."""
+    manager = hass.data.get(DOMAIN, {}).get(DATA_TICKER_MANAGER)
+    if manager is not None and manager.get_ticker(ticker_id) is not None:
+        return manager
+    return None
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "universal_controller/subscribe_console",
+        vol.Required("ticker_id"): str,
+    }
+)
+@callback
+def websocket_subscribe_console(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: Dict[str, Any],
+) -> None:
+    """Stream a ticker's console output, starting with the buffered entries."""
+    ticker_id = msg["ticker_id"]
+    manager = _find_ticker_manager(hass, ticker_id)
+
+    if manager is None:
+        connection.send_error(msg["id"], "not_found", f"Ticker {ticker_id} not found")
+        return
+
+    @callback
+    def forward_entries(entries: List[Dict[str, Any]]) -> None:
+        """Forward new console entries to the client."""
+        connection.send_message(
+            websocket_api.event_message(msg["id"], {"ticker_id": ticker_id, "entries": entries})
+        )
+
+    connection.subscriptions[msg["id"]] = manager.subscribe_console(ticker_id, forward_entries)
+    connection.send_result(msg["id"])
+    forward_entries(manager.get_console(ticker_id) or [])
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the Universal Controller websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe_console)
+    _LOGGER.debug("Universal Controller websocket commands registered")
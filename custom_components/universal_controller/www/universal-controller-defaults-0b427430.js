@@ -0,0 +1,53 @@
+// Default templates, only fetched when a card has no code of its own or is
+// added from the card picker
+export const DEFAULT_USER_CODE = `// TypeScript/JavaScript code that runs periodically
+// Full access to Home Assistant API
+
+const lights = Object.values(hass.states).filter(entity =>
+    entity.entity_id.startsWith('light.')
+);
+
+console.log(\`Found \${lights.length} lights\`);
+
+return {
+    lights_count: lights.length,
+    current_time: new Date().toISOString()
+};`;
+export const DEFAULT_HTML_TEMPLATE = `<div class="universal-controller">
+  <h3>Universal Controller</h3>
+  <p>Lights found: {{lights_count}}</p>
+  <p>Current time: {{current_time}}</p>
+</div>`;
+export const DEFAULT_CSS_STYLES = `.universal-controller {
+  background: var(--card-background-color);
+  border-radius: 8px;
+  padding: 16px;
+  color: var(--primary-text-color);
+}
+
+.universal-controller h3 {
+  margin-top: 0;
+  color: var(--primary-color);
+}`;
+export function stubConfig(cardName) {
+  return {
+    type: `custom:${cardName}`,
+    name: 'Universal Controller',
+    user_code: DEFAULT_USER_CODE,
+    html_template: `<div class='custom-content'>
+  <h3>Universal Controller</h3>
+  <p>Lights: {{ data.lights_count }}</p>
+  <p>Time: {{ data.current_time }}</p>
+</div>`,
+    css_styles: `.custom-content {
+  padding: 16px;
+  background: var(--card-background-color);
+  border-radius: 8px;
+}
+
+.custom-content h3 {
+  margin: 0 0 8px 0;
+  color: var(--primary-text-color);
+}`
+  };
+}
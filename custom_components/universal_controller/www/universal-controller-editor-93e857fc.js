@@ -0,0 +1,143 @@
+function _ts_decorate(decorators, target, key, desc) {
+  var c = arguments.length, r = c < 3 ? target : desc === null ? desc = Object.getOwnPropertyDescriptor(target, key) : desc, d;
+  if (typeof Reflect === "object" && typeof Reflect.decorate === "function") r = Reflect.decorate(decorators, target, key, desc);
+  else for(var i = decorators.length - 1; i >= 0; i--)if (d = decorators[i]) r = (c < 3 ? d(r) : c > 3 ? d(target, key, r) : d(target, key)) || r;
+  return c > 3 && r && Object.defineProperty(target, key, r), r;
+}
+import { LitElement, html, css } from './universal-controller-lit-76b968cb.js';
+import { customElement, property } from './universal-controller-lit-76b968cb.js';
+export class UniversalControllerCardEditor extends LitElement {
+  setConfig(config) {
+    this._config = config;
+  }
+  render() {
+    if (!this.hass || !this._config) {
+      return html``;
+    }
+    return html`
+      <div class="card-config">
+        <div class="option">
+          <ha-textfield
+            label="Card Name"
+            .value=${this._config.name || ''}
+            .configValue=${'name'}
+            @input=${this._valueChanged}
+          ></ha-textfield>
+        </div>
+
+        <div class="option">
+          <label>Card Width:</label>
+          <ha-select
+            .value=${this._config.card_width || '2/4'}
+            .configValue=${'card_width'}
+            @selected=${this._valueChanged}
+          >
+            <mwc-list-item value="1/4">Quarter (25%)</mwc-list-item>
+            <mwc-list-item value="2/4">Half (50%)</mwc-list-item>
+            <mwc-list-item value="3/4">Three Quarters (75%)</mwc-list-item>
+            <mwc-list-item value="4/4">Full Width (100%)</mwc-list-item>
+          </ha-select>
+        </div>
+
+        <div class="option">
+          <ha-textfield
+            label="Card Height (grid rows)"
+            type="number"
+            min="1"
+            max="10"
+            .value=${this._config.card_height || 3}
+            .configValue=${'card_height'}
+            @input=${this._valueChanged}
+          ></ha-textfield>
+        </div>
+
+        <div class="option">
+          <ha-textfield
+            label="Update Interval (seconds)"
+            type="number"
+            min="1"
+            max="300"
+            .value=${(this._config.update_interval || 30000) / 1000}
+            .configValue=${'update_interval_seconds'}
+            @input=${this._valueChanged}
+          ></ha-textfield>
+        </div>
+
+        <div class="option">
+          <ha-formfield label="Show Code Editor">
+            <ha-checkbox
+              .checked=${this._config.show_code_editor !== false}
+              .configValue=${'show_code_editor'}
+              @change=${this._valueChanged}
+            ></ha-checkbox>
+          </ha-formfield>
+        </div>
+      </div>
+    `;
+  }
+  _valueChanged(ev) {
+    if (!this._config || !this.hass) {
+      return;
+    }
+    const target = ev.target;
+    const configValue = target.configValue;
+    let value = target.type === 'checkbox' ? target.checked : target.value;
+    // Convert update interval from seconds to milliseconds
+    if (configValue === 'update_interval_seconds') {
+      value = parseInt(value) * 1000;
+      this._config = {
+        ...this._config,
+        update_interval: value
+      };
+    } else if (configValue === 'card_height') {
+      value = parseInt(value);
+      this._config = {
+        ...this._config,
+        [configValue]: value
+      };
+    } else {
+      this._config = {
+        ...this._config,
+        [configValue]: value
+      };
+    }
+    const event = new CustomEvent('config-changed', {
+      detail: {
+        config: this._config
+      },
+      bubbles: true,
+      composed: true
+    });
+    this.dispatchEvent(event);
+  }
+  static get styles() {
+    return css`
+      .card-config {
+        display: flex;
+        flex-direction: column;
+        gap: 16px;
+      }
+
+      .option {
+        display: flex;
+        flex-direction: column;
+      }
+
+      .option label {
+        margin-bottom: 4px;
+        font-weight: 500;
+      }
+    `;
+  }
+}
+_ts_decorate([
+  property({
+    attribute: false
+  })
+], UniversalControllerCardEditor.prototype, "hass", void 0);
+_ts_decorate([
+  property()
+], UniversalControllerCardEditor.prototype, "_config", void 0);
+UniversalControllerCardEditor = _ts_decorate([
+  customElement('universal-controller-card-editor')
+], UniversalControllerCardEditor);
@@ -0,0 +1,216 @@
+// Card templates compiled once into DOM plus bindings.
+//
+// `{{ data.path }}` expressions in text and attribute values become bindings
+// indexed by the path they read. On each result only paths whose value
+// changed are re-applied, so unchanged nodes keep their identity, scroll
+// position and focus. An element with `data-each="data.items"` is repeated
+// for every item of the list (available as `item`, or the name given in
+// `data-as`); with `data-key="id"` items are reconciled by key, so
+// reordered or inserted items move their existing nodes instead of
+// rebuilding the list.
+const EXPRESSION = /\{\{\s*([\w$]+(?:\.[\w$]+)*)\s*\}\}/g;
+function parseParts(text) {
+  if (!text.includes('{{')) {
+    return null;
+  }
+  const parts = [];
+  let last = 0;
+  for (const match of text.matchAll(EXPRESSION)){
+    if (match.index > last) {
+      parts.push(text.slice(last, match.index));
+    }
+    parts.push({
+      source: match[1],
+      path: match[1].split('.')
+    });
+    last = match.index + match[0].length;
+  }
+  if (last === 0) {
+    return null;
+  }
+  if (last < text.length) {
+    parts.push(text.slice(last));
+  }
+  return parts;
+}
+function resolve(scope, path) {
+  let value = scope;
+  for (const key of path){
+    if (value === null || value === undefined) {
+      return undefined;
+    }
+    value = value[key];
+  }
+  return value;
+}
+function stringify(value) {
+  if (value === null || value === undefined) {
+    return '';
+  }
+  if (typeof value === 'object') {
+    return JSON.stringify(value);
+  }
+  return String(value);
+}
+export class TemplateInstance {
+  constructor(root){
+    this._dependencies = new Map();
+    this._lists = [];
+    if (root.nodeType === Node.ELEMENT_NODE) {
+      this._bindElement(root);
+    } else {
+      this._bindChildren(root);
+    }
+  }
+  _bindChildren(node) {
+    for (const child of Array.from(node.childNodes)){
+      if (child.nodeType === Node.TEXT_NODE) {
+        const text = child;
+        const parts = parseParts(text.data);
+        if (parts) {
+          text.data = '';
+          this._bind(parts, (value)=>{
+            text.data = value;
+          });
+        }
+      } else if (child.nodeType === Node.ELEMENT_NODE) {
+        const element = child;
+        if (element.hasAttribute('data-each')) {
+          this._lists.push(new ListBinding(element));
+        } else {
+          this._bindElement(element);
+        }
+      }
+    }
+  }
+  _bindElement(element) {
+    for (const attribute of Array.from(element.attributes)){
+      const parts = parseParts(attribute.value);
+      if (parts) {
+        const name = attribute.name;
+        element.setAttribute(name, '');
+        this._bind(parts, (value)=>element.setAttribute(name, value));
+      }
+    }
+    // <template> content is inert and not part of the rendered output
+    if (element.localName !== 'template') {
+      this._bindChildren(element);
+    }
+  }
+  _bind(parts, apply) {
+    const binding = {
+      parts,
+      apply
+    };
+    for (const part of parts){
+      if (typeof part === 'string') {
+        continue;
+      }
+      let dependency = this._dependencies.get(part.source);
+      if (!dependency) {
+        dependency = {
+          path: part.path,
+          bindings: []
+        };
+        this._dependencies.set(part.source, dependency);
+      }
+      dependency.bindings.push(binding);
+    }
+  }
+  // Apply a new scope, touching only bindings whose paths changed
+  update(scope) {
+    const values = new Map();
+    const changed = new Set();
+    for (const [source, dependency] of this._dependencies){
+      const value = stringify(resolve(scope, dependency.path));
+      values.set(source, value);
+      if (value !== dependency.last) {
+        dependency.last = value;
+        dependency.bindings.forEach((binding)=>changed.add(binding));
+      }
+    }
+    for (const binding of changed){
+      binding.apply(binding.parts.map((part)=>typeof part === 'string' ? part : values.get(part.source)).join(''));
+    }
+    for (const list of this._lists){
+      list.update(scope);
+    }
+  }
+}
+// A repeated element, reconciled by key
+class ListBinding {
+  constructor(element){
+    this._items = new Map();
+    this._positional = new Map();
+    const source = element.getAttribute('data-each').trim();
+    const key = element.getAttribute('data-key');
+    this._path = source.split('.');
+    this._keyPath = key ? key.trim().split('.') : null;
+    this._alias = element.getAttribute('data-as') || 'item';
+    element.removeAttribute('data-each');
+    element.removeAttribute('data-key');
+    element.removeAttribute('data-as');
+    this._prototype = element;
+    this._anchor = document.createComment(` each ${source} `);
+    element.replaceWith(this._anchor);
+  }
+  update(scope) {
+    const list = resolve(scope, this._path);
+    const items = Array.isArray(list) ? list : [];
+    const parent = this._anchor.parentNode;
+    const next = new Map();
+    const nextPositional = new Map();
+    let previous = this._anchor;
+    items.forEach((value, index)=>{
+      const key = this._keyPath ? resolve(value, this._keyPath) : undefined;
+      // Unkeyed lists, missing and duplicate keys fall back to the position
+      const keyed = key !== undefined && !next.has(key);
+      let item = keyed ? this._items.get(key) : this._positional.get(index);
+      if (!item) {
+        const node = this._prototype.cloneNode(true);
+        item = {
+          node,
+          instance: new TemplateInstance(node)
+        };
+      }
+      item.instance.update({
+        ...scope,
+        [this._alias]: value
+      });
+      if (previous.nextSibling !== item.node) {
+        parent.insertBefore(item.node, previous.nextSibling);
+      }
+      previous = item.node;
+      if (keyed) {
+        next.set(key, item);
+      } else {
+        nextPositional.set(index, item);
+      }
+    });
+    for (const [key, item] of this._items){
+      if (!next.has(key)) {
+        item.node.remove();
+      }
+    }
+    for (const [index, item] of this._positional){
+      if (!nextPositional.has(index)) {
+        item.node.remove();
+      }
+    }
+    this._items = next;
+    this._positional = nextPositional;
+  }
+}
+export function compileTemplate(source) {
+  const template = document.createElement('template');
+  template.innerHTML = source;
+  const host = document.createElement('div');
+  host.style.display = 'contents';
+  host.appendChild(document.importNode(template.content, true));
+  const instance = new TemplateInstance(host);
+  return {
+    source,
+    host,
+    update: (scope)=>instance.update(scope)
+  };
+}
@@ -0,0 +1 @@
+"""Tests for the Universal Controller integration."""
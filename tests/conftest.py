@@ -0,0 +1,21 @@
+"""Fixtures for the Universal Controller tests."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.universal_controller.ticker_manager import TickerManager
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable loading the integration from custom_components."""
+    yield
+
+
+@pytest.fixture
+async def manager(hass):
+    """Return a ticker manager, unloaded (and its workers stopped) after the test."""
+    ticker_manager = TickerManager(hass, executor_workers=2)
+    await ticker_manager.async_setup()
+    yield ticker_manager
+    await ticker_manager.async_unload()
@@ -0,0 +1,98 @@
+"""Tests for the static analysis of ticker code."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.universal_controller.analysis import (
+    HAZARD_BLOCKING,
+    HAZARD_OVERSIZED_RESULT,
+    HAZARD_STATE_SCAN,
+    HAZARD_SYNTAX,
+    HAZARD_UNBOUNDED_LOOP,
+    analyze_code,
+)
+from custom_components.universal_controller.const import (
+    ANALYSIS_MAX_REPEAT,
+    ANALYSIS_MAX_RESULT_BYTES,
+)
+
+
+def _codes(code: str):
+    """Return the hazard codes found in code."""
+    return [hazard["code"] for hazard in analyze_code(code)]
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "",
+        "   ",
+        "{'on': states.get('sun.sun').state == 'above_horizon'}",
+        "len(states.async_all('light'))",
+        "[0] * 10",
+        "1\nwhile True:\n    break",
+        "1\nwhile True:\n    for i in range(3):\n        pass\n    break",
+        "1\nfor i in range(3):\n    pass",
+    ],
+)
+def test_clean_code(code: str) -> None:
+    """Test that harmless code has no hazards."""
+    assert _codes(code) == []
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "1\nimport time\ntime.sleep(1)",
+        "1\nfrom time import sleep as pause\npause(1)",
+        "1\nimport requests as r\nr.get('http://example.com')",
+        "1\nimport subprocess\nsubprocess.run(['ls'])",
+        "1\nwith open('/tmp/file') as f:\n    pass",
+        "1\nimport pathlib\npathlib.Path('/tmp/file').read_text()",
+    ],
+)
+def test_blocking_calls(code: str) -> None:
+    """Test that blocking calls are flagged, also through import aliases."""
+    assert HAZARD_BLOCKING in _codes(code)
+
+
+@pytest.mark.parametrize(
+    "code",
+    ["len(states.async_all())", "len(hass.states.async_entity_ids())", "hass.states.all()"],
+)
+def test_state_scans(code: str) -> None:
+    """Test that scans over every entity are flagged."""
+    assert _codes(code) == [HAZARD_STATE_SCAN]
+
+
+def test_oversized_results() -> None:
+    """Test that large literals and repeated sequences are flagged."""
+    assert _codes(f"[0] * {ANALYSIS_MAX_REPEAT + 1}") == [HAZARD_OVERSIZED_RESULT]
+    assert _codes(f"{ANALYSIS_MAX_REPEAT + 1} * (0,)") == [HAZARD_OVERSIZED_RESULT]
+    assert _codes("{'text': '" + "x" * ANALYSIS_MAX_RESULT_BYTES + "'}") == [HAZARD_OVERSIZED_RESULT]
+
+
+def test_unbounded_loops() -> None:
+    """Test that constant loops without an exit are flagged."""
+    assert _codes("1\nwhile True:\n    x = 1") == [HAZARD_UNBOUNDED_LOOP]
+    # A break inside a nested loop doesn't end the outer loop
+    assert _codes("1\nwhile 1:\n    for i in range(3):\n        break") == [HAZARD_UNBOUNDED_LOOP]
+    assert _codes("1\nwhile True:\n    raise ValueError") == []
+
+
+def test_syntax_errors() -> None:
+    """Test that code which can't run is reported with its line."""
+    hazards = analyze_code("{'a': 1")
+    assert [hazard["code"] for hazard in hazards] == [HAZARD_SYNTAX]
+
+    # JavaScript-style code parses, but fails to compile
+    assert _codes("console.log('x');\nreturn {a: 1};") == [HAZARD_SYNTAX]
+
+
+def test_hazards_are_sorted_by_line() -> None:
+    """Test that each hazard carries its line and they come in order."""
+    hazards = analyze_code("len(states.async_all())\nimport time\ntime.sleep(1)")
+    assert [(hazard["code"], hazard["line"]) for hazard in hazards] == [
+        (HAZARD_STATE_SCAN, 1),
+        (HAZARD_BLOCKING, 3),
+    ]
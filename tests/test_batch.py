@@ -0,0 +1,61 @@
+"""Tests for batched ticker execution."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.universal_controller.batch import run_batch
+from custom_components.universal_controller.ticker_manager import TickerManager
+
+
+def _job(ticker_id: str, code: str):
+    """Return a batch job for ticker code."""
+    return (ticker_id, compile(f"result = {code}", f"<ticker {ticker_id}>", "exec"), {}, None)
+
+
+def test_jobs_are_isolated() -> None:
+    """A failing job, even one calling exit(), doesn't affect the rest of the batch."""
+    outcomes = run_batch(
+        [_job("a", "1"), _job("b", "1 / 0"), _job("c", "exit(3)"), _job("d", "2")], {}
+    )
+
+    assert [(success, value) for success, value, _ in outcomes] == [
+        (True, 1),
+        (False, "Code execution error: division by zero"),
+        (False, "Code execution error: SystemExit(3)"),
+        (True, 2),
+    ]
+    # Every job gets its own console buffer
+    assert len({id(console) for _, _, console in outcomes}) == 4
+
+
+async def test_exit_in_a_batch(manager: TickerManager) -> None:
+    """exit() in ticker code fails only that ticker."""
+    for ticker_id, code in (("ok", "1"), ("bye", "exit()")):
+        await manager.create_ticker(ticker_id, ticker_id, user_code=code, update_interval=3600, enabled=False)
+    tickers = [manager.tickers["ok"], manager.tickers["bye"]]
+
+    results = await manager.batcher.async_execute(tickers)
+
+    assert results["ok"] == 1
+    assert results["bye"] == {"error": "Code execution error: SystemExit(None)"}
+    assert [ticker.state for ticker in tickers] == ["running", "error"]
+
+
+class _Interrupted(BaseException):
+    """Stands in for an error nothing in the batcher expects."""
+
+
+async def test_unexpected_error_leaves_no_ticker_executing(manager: TickerManager, monkeypatch) -> None:
+    """Tickers of a batch that ended in an unexpected error aren't stuck executing."""
+    await manager.create_ticker("t", "T", user_code="1", update_interval=3600, enabled=False)
+    ticker = manager.tickers["t"]
+
+    async def _interrupted(*args):
+        raise _Interrupted
+
+    monkeypatch.setattr(manager._executor, "async_run", _interrupted)
+    with pytest.raises(_Interrupted):
+        await manager.batcher.async_execute([ticker])
+
+    assert ticker.state == "idle"
+    assert ticker.extra_state_attributes["consecutive_errors"] == 0
@@ -0,0 +1,83 @@
+"""Tests for console capture."""
+from __future__ import annotations
+
+from custom_components.universal_controller.console import ConsoleBuffer, ConsoleRing
+from custom_components.universal_controller.const import (
+    CONSOLE_MAX_ENTRIES,
+    CONSOLE_MAX_MESSAGE_LENGTH,
+    CONSOLE_SAMPLE_RATE,
+)
+
+
+def test_buffer_keeps_entries_up_to_the_limit() -> None:
+    """Test that every call is kept until the limit is reached."""
+    buffer = ConsoleBuffer()
+    console = buffer.as_context()
+
+    for i in range(CONSOLE_MAX_ENTRIES):
+        console["log"]("line", i)
+
+    assert len(buffer.entries) == CONSOLE_MAX_ENTRIES
+    assert buffer.dropped == 0
+    assert buffer.entries[1]["message"] == "line 1"
+    assert buffer.entries[1]["level"] == "log"
+
+
+def test_buffer_samples_past_the_limit() -> None:
+    """Test that only one in CONSOLE_SAMPLE_RATE calls is kept past the limit."""
+    buffer = ConsoleBuffer()
+    console = buffer.as_context()
+    extra = CONSOLE_SAMPLE_RATE * 5
+
+    for i in range(CONSOLE_MAX_ENTRIES + extra):
+        console["info"](i)
+
+    assert len(buffer.entries) == CONSOLE_MAX_ENTRIES + 5
+    assert buffer.dropped == extra - 5
+    assert buffer.calls == CONSOLE_MAX_ENTRIES + extra
+
+
+def test_buffer_keeps_errors_until_hard_cap() -> None:
+    """Test that errors skip sampling but not the hard cap of twice the limit."""
+    buffer = ConsoleBuffer()
+    console = buffer.as_context()
+
+    for i in range(CONSOLE_MAX_ENTRIES):
+        console["debug"](i)
+    for i in range(CONSOLE_MAX_ENTRIES * 2):
+        console["error"](i)
+
+    assert len(buffer.entries) == 2 * CONSOLE_MAX_ENTRIES
+    assert buffer.dropped == CONSOLE_MAX_ENTRIES
+    assert buffer.entries[-1]["level"] == "error"
+
+
+def test_buffer_truncates_long_messages() -> None:
+    """Test that long messages are cut at CONSOLE_MAX_MESSAGE_LENGTH."""
+    buffer = ConsoleBuffer()
+    buffer.as_context()["warn"]("x" * (CONSOLE_MAX_MESSAGE_LENGTH + 50))
+
+    message = buffer.entries[0]["message"]
+    assert len(message) == CONSOLE_MAX_MESSAGE_LENGTH + 1
+    assert message.endswith("…")
+
+
+def test_ring_keeps_recent_entries() -> None:
+    """Test that the ring keeps the most recent entries of all executions."""
+    ring = ConsoleRing("t", size=3)
+    received = []
+    unsubscribe = ring.subscribe(received.append)
+
+    for run in range(2):
+        buffer = ConsoleBuffer()
+        console = buffer.as_context()
+        console["log"](f"run {run} a")
+        console["log"](f"run {run} b")
+        ring.add(buffer)
+
+    assert [entry["message"] for entry in ring.entries()] == ["run 0 b", "run 1 a", "run 1 b"]
+    assert len(received) == 2
+
+    unsubscribe()
+    ring.add(buffer)
+    assert len(received) == 2
@@ -0,0 +1,98 @@
+"""Tests for ticker guard conditions."""
+from __future__ import annotations
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.universal_controller.guard import TickerGuard
+
+
+@pytest.fixture
+def states(hass: HomeAssistant) -> HomeAssistant:
+    """Seed the state machine."""
+    hass.states.async_set("sun.sun", "below_horizon", {"elevation": -10.5})
+    hass.states.async_set("sensor.power", "1200")
+    hass.states.async_set("sensor.broken", "unavailable")
+    hass.states.async_set("binary_sensor.door", "off")
+    hass.states.async_set("binary_sensor.window", "on")
+    return hass
+
+
+@pytest.mark.parametrize(
+    ("config", "expected"),
+    [
+        ({"entity_id": "sun.sun", "state": "below_horizon"}, True),
+        ({"entity_id": "sun.sun", "state": ["above_horizon"]}, False),
+        ({"entity_id": "sun.sun", "not_state": "above_horizon"}, True),
+        ({"entity_id": "Sun.Sun", "state": "below_horizon"}, True),
+        ({"entity_id": "sensor.power", "above": 1000}, True),
+        ({"entity_id": "sensor.power", "above": 1000, "below": 1200}, False),
+        ({"entity_id": "sensor.power", "below": "1500"}, True),
+        ({"entity_id": "sensor.broken", "above": 0}, False),
+        ({"entity_id": "sun.sun", "attribute": "elevation", "below": 0}, True),
+        ({"entity_id": "sun.sun", "attribute": "elevation", "state": "-10.5"}, True),
+        ({"entity_id": "sun.sun", "attribute": "missing", "above": 0}, False),
+        ({"entity_id": "sensor.missing", "not_state": "on"}, False),
+        # Every listed entity has to match
+        ({"entity_id": ["binary_sensor.door", "binary_sensor.window"], "state": "off"}, False),
+        ({"entity_id": ["binary_sensor.door", "binary_sensor.window"], "state": ["off", "on"]}, True),
+        # A list means all of its conditions
+        (
+            [
+                {"entity_id": "sun.sun", "state": "below_horizon"},
+                {"entity_id": "binary_sensor.door", "state": "on"},
+            ],
+            False,
+        ),
+        (
+            {
+                "any": [
+                    {"entity_id": "binary_sensor.door", "state": "on"},
+                    {"all": [
+                        {"entity_id": "binary_sensor.window", "state": "on"},
+                        {"entity_id": "sensor.power", "above": 500},
+                    ]},
+                ]
+            },
+            True,
+        ),
+    ],
+)
+def test_guard_check(states: HomeAssistant, config, expected: bool) -> None:
+    """Test guard evaluation against the state machine."""
+    assert TickerGuard(config).async_check(states) is expected
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        "sun.sun",
+        {},
+        {"state": "on"},
+        {"entity_id": "sun.sun"},
+        {"entity_id": "sun.sun", "state": "on", "unknown": 1},
+        {"entity_id": [], "state": "on"},
+        {"entity_id": "sun.sun", "state": 1},
+        {"entity_id": "sun.sun", "above": "high"},
+        {"entity_id": "sun.sun", "above": True},
+        {"entity_id": "sun.sun", "attribute": 5, "state": "on"},
+        {"all": []},
+        {"any": {"entity_id": "sun.sun", "state": "on"}},
+        {"all": [{"entity_id": "sun.sun", "state": "on"}], "entity_id": "sun.sun"},
+        {"any": [{"entity_id": "sun.sun"}]},
+    ],
+)
+def test_invalid_guard(config) -> None:
+    """Test that invalid guards are rejected when compiled."""
+    with pytest.raises(ValueError):
+        TickerGuard(config)
+
+
+def test_guard_follows_state_changes(states: HomeAssistant) -> None:
+    """Test that the guard reads the current state on every check."""
+    guard = TickerGuard({"entity_id": "binary_sensor.door", "state": "on"})
+    assert not guard.async_check(states)
+
+    states.states.async_set("binary_sensor.door", "on")
+    assert guard.async_check(states)
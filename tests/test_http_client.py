@@ -0,0 +1,212 @@
+"""Tests for the shared HTTP client, against a local stand-in server."""
+from __future__ import annotations
+
+import asyncio
+import time
+
+from aiohttp import web
+import pytest
+
+from custom_components.universal_controller import http_client
+from custom_components.universal_controller.http_client import (
+    SharedHttpClient,
+    TickerHttpError,
+)
+
+
+class StandInServer:
+    """Counts requests and how many were in flight at once."""
+
+    def __init__(self, delay: float = 0.1) -> None:
+        """Initialize the counters."""
+        self.delay = delay
+        self.hits = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Answer after a delay, echoing the query."""
+        self.hits += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return web.json_response({"query": dict(request.query), "hit": self.hits})
+
+    async def fail(self, request: web.Request) -> web.Response:
+        """Answer with a server error."""
+        self.hits += 1
+        return web.json_response({"error": "boom"}, status=500)
+
+
+@pytest.fixture
+def stand_in():
+    """Return the request counters of the stand-in server."""
+    return StandInServer()
+
+
+@pytest.fixture
+async def base_url(socket_enabled, aiohttp_server, stand_in):
+    """Start the stand-in server on localhost and return its URL."""
+    app = web.Application()
+    app.router.add_get("/data", stand_in.handle)
+    app.router.add_post("/data", stand_in.handle)
+    app.router.add_get("/fail", stand_in.fail)
+    server = await aiohttp_server(app)
+    return str(server.make_url(""))
+
+
+async def _in_workers(hass, *calls):
+    """Run blocking calls concurrently on worker threads, as ticker code does."""
+    return await asyncio.gather(*(hass.async_add_executor_job(call) for call in calls))
+
+
+async def test_identical_gets_are_coalesced(hass, base_url, stand_in) -> None:
+    """Concurrent identical GETs from worker threads share one request."""
+    http = SharedHttpClient(hass).for_ticker("t")
+
+    responses = await _in_workers(
+        hass, *[lambda: http.get(f"{base_url}/data", params={"a": 1}, ttl=0)] * 5
+    )
+
+    assert stand_in.hits == 1
+    assert [response["json"]["hit"] for response in responses] == [1] * 5
+    assert http.stats()["coalesced"] == 4
+
+    # Each caller gets its own parsed body
+    responses[0]["json"]["hit"] = 99
+    assert responses[1]["json"]["hit"] == 1
+
+
+async def test_different_gets_and_posts_are_not_coalesced(hass, base_url, stand_in) -> None:
+    """Only identical GETs are shared."""
+    http = SharedHttpClient(hass).for_ticker("t")
+
+    await _in_workers(
+        hass,
+        lambda: http.get(f"{base_url}/data", params={"a": 1}, ttl=0),
+        lambda: http.get(f"{base_url}/data", params={"a": 2}, ttl=0),
+        lambda: http.get(f"{base_url}/data", params={"a": 1}, headers={"X-Key": "k"}, ttl=0),
+        lambda: http.post(f"{base_url}/data", json={"a": 1}),
+        lambda: http.post(f"{base_url}/data", json={"a": 1}),
+    )
+
+    assert stand_in.hits == 5
+    assert http.stats()["coalesced"] == 0
+
+
+class _Clock:
+    """Monotonic clock that can be moved forward without touching the event loop."""
+
+    def __init__(self) -> None:
+        """Start at the real time."""
+        self.offset = 0.0
+
+    def monotonic(self) -> float:
+        """Return the shifted monotonic time."""
+        return time.monotonic() + self.offset
+
+
+async def test_cached_get_expires_after_ttl(hass, base_url, stand_in, monkeypatch) -> None:
+    """A fresh response is served from the cache until its ttl passes."""
+    clock = _Clock()
+    monkeypatch.setattr(http_client, "time", clock)
+    http = SharedHttpClient(hass).for_ticker("t")
+    url = f"{base_url}/data"
+
+    await _in_workers(hass, lambda: http.get(url, ttl=5))
+    await _in_workers(hass, lambda: http.get(url, ttl=5))
+    assert stand_in.hits == 1
+    assert http.stats()["cache_hits"] == 1
+
+    clock.offset = 6
+    await _in_workers(hass, lambda: http.get(url, ttl=5))
+    assert stand_in.hits == 2
+
+
+async def test_cache_evicts_least_recently_used(hass, base_url, stand_in, monkeypatch) -> None:
+    """The cache keeps the HTTP_CACHE_SIZE most recently used responses."""
+    monkeypatch.setattr(http_client, "HTTP_CACHE_SIZE", 2)
+    http = SharedHttpClient(hass).for_ticker("t")
+
+    def get(name: str):
+        return lambda: http.get(f"{base_url}/data", params={"n": name}, ttl=60)
+
+    await _in_workers(hass, get("a"))
+    await _in_workers(hass, get("b"))
+    await _in_workers(hass, get("a"))  # cached, now most recently used
+    await _in_workers(hass, get("c"))  # evicts b
+    assert stand_in.hits == 3
+
+    await _in_workers(hass, get("a"))
+    assert stand_in.hits == 3
+    await _in_workers(hass, get("b"))
+    assert stand_in.hits == 4
+
+
+async def test_error_responses_are_not_cached(hass, base_url, stand_in) -> None:
+    """Only successful responses are cached."""
+    http = SharedHttpClient(hass).for_ticker("t")
+
+    first, second = [
+        (await _in_workers(hass, lambda: http.get(f"{base_url}/fail", ttl=60)))[0]
+        for _ in range(2)
+    ]
+
+    assert first["status"] == second["status"] == 500
+    assert stand_in.hits == 2
+
+
+async def test_host_concurrency_is_limited(hass, base_url, stand_in, monkeypatch) -> None:
+    """No more than HTTP_HOST_CONCURRENCY requests run against one host."""
+    monkeypatch.setattr(http_client, "HTTP_HOST_CONCURRENCY", 2)
+    http = SharedHttpClient(hass).for_ticker("t")
+
+    await _in_workers(
+        hass,
+        *[
+            (lambda n=n: http.get(f"{base_url}/data", params={"n": n}, ttl=0))
+            for n in range(6)
+        ],
+    )
+
+    assert stand_in.hits == 6
+    assert stand_in.max_active == 2
+
+
+async def test_timeout_raises_ticker_http_error(hass, base_url, stand_in) -> None:
+    """A request exceeding its timeout fails with TickerHttpError."""
+    stand_in.delay = 1
+    http = SharedHttpClient(hass).for_ticker("t")
+
+    def slow_get() -> None:
+        with pytest.raises(TickerHttpError):
+            http.get(f"{base_url}/data", timeout=0.1, ttl=0)
+
+    await _in_workers(hass, slow_get)
+    assert http.stats()["errors"] == 1
+
+
+async def test_request_from_event_loop_is_refused(hass, base_url) -> None:
+    """The blocking bridge must not be used on the loop it waits for."""
+    http = SharedHttpClient(hass).for_ticker("t")
+
+    with pytest.raises(RuntimeError):
+        http.get(f"{base_url}/data")
+
+
+async def test_ticker_code_uses_the_bridge(hass, manager, base_url, stand_in) -> None:
+    """Ticker code running on the executor reaches the server through `http`."""
+    await manager.create_ticker(
+        "net",
+        "Net",
+        user_code=f"http.get('{base_url}/data', params={{'from': 'ticker'}})['json']",
+        update_interval=0,
+    )
+
+    result = await manager.execute_ticker("net")
+
+    assert result == {"query": {"from": "ticker"}, "hit": 1}
+    assert manager.tickers["net"].extra_state_attributes["http_stats"]["requests"] == 1
@@ -0,0 +1,72 @@
+"""Tests for setting up the integration from config entries."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.universal_controller.const import DATA_TICKER_MANAGER, DOMAIN
+from custom_components.universal_controller.ticker_manager import (
+    TICKER_STORAGE_KEY,
+    TICKER_STORAGE_VERSION,
+    TickerManager,
+)
+
+
+@pytest.fixture
+def stored_ticker(hass_storage, monkeypatch) -> None:
+    """Store a ticker with a result sensor and make loading it slow."""
+    hass_storage[TICKER_STORAGE_KEY] = {
+        "version": TICKER_STORAGE_VERSION,
+        "key": TICKER_STORAGE_KEY,
+        "data": {
+            "t": {
+                "name": "T",
+                "user_code": "{'power': 5}",
+                "enabled": False,
+                "sensors": [{"path": "power"}],
+            },
+        },
+    }
+
+    load_tickers = TickerManager._load_tickers
+
+    async def _load_tickers(self) -> None:
+        # Reading real storage takes a while and lets other entries run meanwhile
+        await asyncio.sleep(0.1)
+        await load_tickers(self)
+
+    monkeypatch.setattr(TickerManager, "_load_tickers", _load_tickers)
+
+
+def _result_sensors(hass: HomeAssistant):
+    """Return the registered result sensor unique ids."""
+    return [
+        entry.unique_id
+        for entry in er.async_get(hass).entities.values()
+        if entry.platform == DOMAIN and ":" in entry.unique_id
+    ]
+
+
+@pytest.mark.parametrize("entries", [1, 2])
+async def test_entries_share_one_manager(hass: HomeAssistant, stored_ticker, entries: int) -> None:
+    """Entries set up together share the manager and loaded tickers get their sensors."""
+    config_entries = [MockConfigEntry(domain=DOMAIN, data={"name": f"UC {i}"}) for i in range(entries)]
+    for entry in config_entries:
+        entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(config_entries[0].entry_id)
+    await hass.async_block_till_done()
+
+    manager = hass.data[DOMAIN][DATA_TICKER_MANAGER]
+    assert list(manager.tickers) == ["t"]
+    assert _result_sensors(hass) == [f"{DOMAIN}_ticker_t:power"]
+
+    for entry in config_entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert DOMAIN not in hass.data
@@ -0,0 +1,41 @@
+"""Tests for replaying recorded state streams against tickers."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.universal_controller.replay import async_replay
+from custom_components.universal_controller.ticker_manager import (
+    TICKER_STORAGE_KEY,
+    TICKER_STORAGE_VERSION,
+)
+
+
+async def test_replay_never_touches_services_or_hosts(hass: HomeAssistant, hass_storage) -> None:
+    """Service calls and HTTP requests are counted, from the first run on."""
+    hass_storage[TICKER_STORAGE_KEY] = {
+        "version": TICKER_STORAGE_VERSION,
+        "key": TICKER_STORAGE_KEY,
+        "data": {
+            "t1": {
+                "name": "T1",
+                "user_code": (
+                    "services.call('light', 'turn_on', {'entity_id': 'light.desk'}) "
+                    "or http.get('http://device.invalid/state', ttl=0)['status']"
+                ),
+                "update_interval": 3600,
+            },
+        },
+    }
+    header = {"initial": {"sensor.power": ["100", {"unit_of_measurement": "W"}]}}
+    events = [(10, "sensor.power", "120", None), (20, "sensor.power", "140", None)]
+
+    report = await async_replay(hass, header, events, speed=0, tick_every=1)
+
+    ticker = report["tickers"]["t1"]
+    # The run on start plus one after each event
+    assert ticker["executions"] == 3
+    assert ticker["errors"] == 0
+    assert ticker["services"] == {"light.turn_on": 3}
+    assert ticker["http"] == {"GET device.invalid": 3}
+    assert report["events"] == 2
+    assert hass.states.get("sensor.power").state == "140"
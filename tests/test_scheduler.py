@@ -0,0 +1,181 @@
+"""Tests for cron parsing and the ticker scheduler."""
+from __future__ import annotations
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.universal_controller.scheduler import (
+    CronSchedule,
+    ScheduleStats,
+    TickerScheduler,
+)
+
+
+@pytest.mark.parametrize(
+    ("expression", "after", "expected"),
+    [
+        # Five fields fire at second 0
+        ("* * * * *", datetime(2026, 3, 1, 12, 0, 30), datetime(2026, 3, 1, 12, 1, 0)),
+        # Six fields start with seconds
+        ("*/15 * * * * *", datetime(2026, 3, 1, 12, 0, 14), datetime(2026, 3, 1, 12, 0, 15)),
+        # Strictly after: a match at `after` itself is skipped
+        ("0 9 * * *", datetime(2026, 3, 1, 9, 0, 0), datetime(2026, 3, 2, 9, 0, 0)),
+        ("30 8-10/2 * * *", datetime(2026, 3, 1, 8, 31), datetime(2026, 3, 1, 10, 30)),
+        ("0 0 1,15 * *", datetime(2026, 3, 2), datetime(2026, 3, 15)),
+        ("0 0 1 */3 *", datetime(2026, 2, 1), datetime(2026, 4, 1)),
+        # 2026-03-01 is a Sunday; 0 and 7 both mean Sunday
+        ("0 12 * * 0", datetime(2026, 3, 2), datetime(2026, 3, 8, 12)),
+        ("0 12 * * 7", datetime(2026, 3, 2), datetime(2026, 3, 8, 12)),
+        ("0 12 * * 1-5", datetime(2026, 3, 6, 13), datetime(2026, 3, 9, 12)),
+        # Restricting day and weekday matches either, like cron
+        ("0 0 10 * 1", datetime(2026, 3, 1), datetime(2026, 3, 2)),
+        # Leap days are found in the next leap year
+        ("0 0 29 2 *", datetime(2026, 1, 1), datetime(2028, 2, 29)),
+    ],
+)
+def test_next_after(expression: str, after: datetime, expected: datetime) -> None:
+    """Test the next match of cron expressions."""
+    assert CronSchedule(expression).next_after(after) == expected
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "* * * *",
+        "* * * * * * *",
+        "60 * * * *",
+        "* 24 * * *",
+        "* * 0 * *",
+        "* * * 13 *",
+        "* * * * 8",
+        "5-1 * * * *",
+        "*/0 * * * *",
+        "a * * * *",
+        # Valid fields, but no date ever matches
+        "0 9 31 2 *",
+        "0 9 30,31 2 *",
+        "0 9 31 4,6,9,11 *",
+    ],
+)
+def test_invalid_expressions(expression: str) -> None:
+    """Test that invalid and impossible expressions are rejected when parsed."""
+    with pytest.raises(ValueError):
+        CronSchedule(expression)
+
+
+def test_impossible_day_allowed_with_weekday() -> None:
+    """A restricted weekday still matches, so the day of month can't rule it out."""
+    schedule = CronSchedule("0 9 31 2 1")
+    assert schedule.next_after(datetime(2026, 2, 1)) == datetime(2026, 2, 2, 9)
+
+
+def test_schedule_stats() -> None:
+    """Test lateness statistics."""
+    stats = ScheduleStats(samples=3)
+    assert stats.as_dict() == {"runs": 0, "missed": 0}
+
+    for late_ms in (1.0, 2.0, 3.0, 10.0):
+        stats.record(late_ms)
+    stats.missed = 2
+
+    assert stats.as_dict() == {
+        "runs": 4,
+        "missed": 2,
+        "late_ms_avg": 5.0,
+        "late_ms_p95": 10.0,
+        "late_ms_max": 10.0,
+    }
+
+
+class _FakeLoop:
+    """Loop clock and timer that the test moves by hand."""
+
+    def __init__(self) -> None:
+        """Start the clock."""
+        self.now = 100.0
+        self.timers = []
+
+    def time(self) -> float:
+        """Return the loop time."""
+        return self.now
+
+    def call_at(self, when: float, callback):
+        """Record a timer instead of arming it."""
+        self.timers.append((when, callback))
+        return SimpleNamespace(cancel=lambda: None)
+
+    def fire_at(self, now: float) -> float:
+        """Run the last armed timer at the given time and return its deadline."""
+        when, callback = self.timers[-1]
+        self.now = now
+        callback()
+        return when
+
+
+@pytest.fixture
+def fake_hass():
+    """Return a hass stand-in with a hand-driven loop that counts created tasks."""
+    tasks = []
+
+    def create_task(coro):
+        tasks.append(coro)
+        coro.close()
+
+    return SimpleNamespace(loop=_FakeLoop(), async_create_task=create_task, tasks=tasks)
+
+
+async def _action() -> None:
+    """Scheduled action; never awaited by the fake loop."""
+
+
+def test_interval_deadlines_are_drift_corrected(fake_hass) -> None:
+    """Deadlines follow the previous deadline, not the time a run fired."""
+    scheduler = TickerScheduler(fake_hass, _action, interval=1.0)
+    scheduler.async_start()
+    loop = fake_hass.loop
+
+    assert loop.fire_at(101.3) == 101.0
+    # Firing late doesn't push the next deadline back
+    assert loop.timers[-1][0] == 102.0
+    assert loop.fire_at(102.05) == 102.0
+    assert loop.timers[-1][0] == 103.0
+    assert scheduler.stats.missed == 0
+
+    # A 2.5 s stall skips the runs that are already overdue
+    loop.fire_at(105.5)
+    assert loop.timers[-1][0] == 106.0
+    assert scheduler.stats.missed == 2
+
+    stats = scheduler.stats.as_dict()
+    assert stats["runs"] == 3
+    assert stats["late_ms_max"] == pytest.approx(2500)
+    assert len(fake_hass.tasks) == 3
+    scheduler.async_cancel()
+
+
+def test_cron_runs_chain_off_the_last_match(fake_hass, monkeypatch) -> None:
+    """A cron schedule runs every match once and counts a stall as one missed run."""
+    wall = {"now": datetime(2026, 3, 1, 12, 0, 30, tzinfo=dt_util.UTC)}
+    monkeypatch.setattr(dt_util, "now", lambda: wall["now"])
+    scheduler = TickerScheduler(fake_hass, _action, cron=CronSchedule("* * * * *"))
+    loop = fake_hass.loop
+
+    scheduler.async_start()
+    assert loop.timers[-1][0] == pytest.approx(130.0)
+
+    # The timer fires a little early; the same match must not run twice
+    wall["now"] = datetime(2026, 3, 1, 12, 0, 59, 999000, tzinfo=dt_util.UTC)
+    loop.fire_at(129.999)
+    assert loop.timers[-1][0] == pytest.approx(190.0)
+    assert scheduler.stats.missed == 0
+
+    # Stalled past the 12:02 match: skip to 12:05 and count one missed run
+    wall["now"] = datetime(2026, 3, 1, 12, 4, 10, tzinfo=dt_util.UTC)
+    loop.fire_at(350.0)
+    assert loop.timers[-1][0] == pytest.approx(400.0)
+    assert scheduler.stats.missed == 1
+    scheduler.async_cancel()
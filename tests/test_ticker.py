@@ -0,0 +1,220 @@
+"""Tests for ticker error handling and restoring tickers from storage."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.universal_controller.const import (
+    ERROR_BACKOFF_MAX,
+    ERROR_CIRCUIT_THRESHOLD,
+    PRECISE_STATE_WRITE_INTERVAL,
+)
+from custom_components.universal_controller.ticker_manager import (
+    TICKER_STORAGE_KEY,
+    TICKER_STORAGE_VERSION,
+    TickerManager,
+)
+
+FAILING_CODE = "1 / 0"
+
+
+async def _fail(manager: TickerManager, ticker_id: str, times: int) -> None:
+    """Execute a failing ticker a number of times."""
+    for _ in range(times):
+        await manager.execute_ticker(ticker_id)
+
+
+async def test_backoff_doubles_up_to_the_cap(manager: TickerManager) -> None:
+    """Each consecutive error doubles the backoff, up to ERROR_BACKOFF_MAX."""
+    await manager.create_ticker("t", "T", user_code=FAILING_CODE, update_interval=100, enabled=False)
+    ticker = manager.tickers["t"]
+    assert ticker.extra_state_attributes["backoff_seconds"] == 0
+
+    delays = []
+    for _ in range(5):
+        await _fail(manager, "t", 1)
+        delays.append(ticker.extra_state_attributes["backoff_seconds"])
+
+    assert delays == [100, 200, 400, 800, ERROR_BACKOFF_MAX]
+
+    # A successful run clears the backoff
+    await manager.update_ticker("t", user_code="1")
+    await manager.execute_ticker("t")
+    assert ticker.extra_state_attributes["consecutive_errors"] == 0
+    assert ticker.extra_state_attributes["backoff_seconds"] == 0
+
+
+async def test_circuit_trips_once(hass: HomeAssistant, manager: TickerManager) -> None:
+    """The ticker is auto-disabled at the threshold, with a single event."""
+    events = []
+    hass.bus.async_listen("universal_controller_ticker_auto_disabled", events.append)
+    await manager.create_ticker("t", "T", user_code=FAILING_CODE, update_interval=3600)
+    ticker = manager.tickers["t"]
+
+    # Creating the ticker already ran it once
+    await _fail(manager, "t", ERROR_CIRCUIT_THRESHOLD - 2)
+    await hass.async_block_till_done()
+    assert not ticker.auto_disabled
+
+    await _fail(manager, "t", 1)
+    await hass.async_block_till_done()
+    assert ticker.auto_disabled
+    assert ticker.state == "auto_disabled"
+    assert len(events) == 1
+
+    # Manual runs of a disabled ticker don't fire the event again
+    await _fail(manager, "t", 3)
+    await hass.async_block_till_done()
+    assert len(events) == 1
+
+
+async def test_reset_and_code_update_close_the_circuit(hass: HomeAssistant, manager: TickerManager) -> None:
+    """reset_ticker and new code both re-enable an auto-disabled ticker."""
+    await manager.create_ticker("t", "T", user_code=FAILING_CODE, update_interval=3600, enabled=False)
+    ticker = manager.tickers["t"]
+
+    await _fail(manager, "t", ERROR_CIRCUIT_THRESHOLD)
+    assert ticker.auto_disabled
+
+    assert await manager.reset_ticker("t")
+    assert not ticker.auto_disabled
+    assert ticker.extra_state_attributes["consecutive_errors"] == 0
+
+    await _fail(manager, "t", ERROR_CIRCUIT_THRESHOLD)
+    assert ticker.auto_disabled
+
+    await manager.update_ticker("t", user_code="2")
+    assert not ticker.auto_disabled
+
+    assert not await manager.reset_ticker("missing")
+
+
+async def test_auto_disabled_survives_reload(hass: HomeAssistant, manager: TickerManager) -> None:
+    """A tripped circuit is restored and the ticker isn't started again."""
+    await manager.create_ticker("t", "T", user_code=FAILING_CODE, update_interval=3600)
+    await _fail(manager, "t", ERROR_CIRCUIT_THRESHOLD - 1)
+    await hass.async_block_till_done()
+    assert manager.tickers["t"].auto_disabled
+    await manager.async_unload()
+
+    reloaded = TickerManager(hass, executor_workers=1)
+    await reloaded.async_setup()
+    try:
+        ticker = reloaded.tickers["t"]
+        assert ticker.auto_disabled
+        assert ticker.last_error is None
+        assert ticker.execution_count == 0
+    finally:
+        await reloaded.async_unload()
+
+
+async def test_executor_shutdown_is_not_an_error(manager: TickerManager) -> None:
+    """A run refused by a shut down executor leaves the error counters alone."""
+    await manager.create_ticker("t", "T", user_code="1", update_interval=3600, enabled=False)
+    ticker = manager.tickers["t"]
+
+    await manager._executor.async_shutdown()
+    result = await manager.execute_ticker("t")
+
+    assert "error" in result
+    assert ticker.last_error is None
+    assert ticker.extra_state_attributes["consecutive_errors"] == 0
+    assert ticker.state == "idle"
+
+
+async def test_invalid_stored_ticker_is_kept(hass: HomeAssistant, hass_storage) -> None:
+    """A stored ticker failing validation doesn't stop the others loading or get dropped."""
+    hass_storage[TICKER_STORAGE_KEY] = {
+        "version": TICKER_STORAGE_VERSION,
+        "key": TICKER_STORAGE_KEY,
+        "data": {
+            "bad": {"name": "Bad", "user_code": "1", "schedule": "0 9 31 2 *", "enabled": False},
+            "good": {"name": "Good", "user_code": "1", "enabled": False},
+        },
+    }
+    manager = TickerManager(hass, executor_workers=1)
+    await manager.async_setup()
+    try:
+        assert list(manager.tickers) == ["good"]
+        assert not await manager.create_ticker("bad", "Other")
+
+        await manager.create_ticker("new", "New", enabled=False)
+        stored = hass_storage[TICKER_STORAGE_KEY]["data"]
+        assert sorted(stored) == ["bad", "good", "new"]
+        assert stored["bad"]["schedule"] == "0 9 31 2 *"
+
+        assert await manager.delete_ticker("bad")
+        assert sorted(hass_storage[TICKER_STORAGE_KEY]["data"]) == ["good", "new"]
+    finally:
+        await manager.async_unload()
+
+
+async def test_precise_ticker_state_writes_are_throttled(hass: HomeAssistant, manager: TickerManager) -> None:
+    """High-frequency runs write an unchanged state at most every PRECISE_STATE_WRITE_INTERVAL."""
+    await manager.create_ticker("fast", "Fast", user_code="1", enabled=False, update_interval_ms=100)
+    ticker = manager.tickers["fast"]
+    writes = []
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED,
+        lambda event: writes.append(event.data["new_state"].state)
+        if event.data["entity_id"] == ticker.entity_id else None,
+    )
+
+    for _ in range(5):
+        await manager.batcher.async_execute([ticker])
+    await hass.async_block_till_done()
+    # No separate `executing` write, and later unchanged runs wait for the trailing write
+    assert writes == ["running"]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=PRECISE_STATE_WRITE_INTERVAL + 1))
+    await hass.async_block_till_done()
+    assert writes == ["running", "running"]
+    assert ticker.execution_count == 5
+
+    await manager.batcher.async_execute([ticker])
+    await manager.update_ticker("fast", user_code=FAILING_CODE)
+    writes.clear()
+    await manager.batcher.async_execute([ticker])
+    await hass.async_block_till_done()
+    # A changed state is written right away and replaces the pending write
+    assert writes == ["error"]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2 * PRECISE_STATE_WRITE_INTERVAL + 2))
+    await hass.async_block_till_done()
+    assert writes == ["error"]
+
+
+async def test_interval_ticker_writes_every_run(hass: HomeAssistant, manager: TickerManager) -> None:
+    """Tickers on a normal interval still report `executing` and every result."""
+    await manager.create_ticker("slow", "Slow", user_code="1", enabled=False)
+    ticker = manager.tickers["slow"]
+    writes = []
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED,
+        lambda event: writes.append(event.data["new_state"].state)
+        if event.data["entity_id"] == ticker.entity_id else None,
+    )
+
+    for _ in range(2):
+        await manager.batcher.async_execute([ticker])
+    await hass.async_block_till_done()
+    assert writes == ["executing", "running"] * 2
+
+
+async def test_cron_backoff_follows_the_schedule(manager: TickerManager) -> None:
+    """The error backoff of a cron ticker is based on its cadence, not update_interval."""
+    await manager.create_ticker("hourly", "Hourly", user_code=FAILING_CODE, schedule="0 * * * *", enabled=False)
+    await manager.create_ticker("second", "Second", user_code=FAILING_CODE, schedule="* * * * * *", enabled=False)
+
+    await _fail(manager, "hourly", 2)
+    await _fail(manager, "second", 2)
+
+    assert manager.tickers["hourly"].interval_seconds == 3600
+    assert manager.tickers["hourly"].extra_state_attributes["backoff_seconds"] == ERROR_BACKOFF_MAX
+    assert manager.tickers["second"].interval_seconds == 1
+    assert manager.tickers["second"].extra_state_attributes["backoff_seconds"] == 2
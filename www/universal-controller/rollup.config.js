@@ -1,13 +1,45 @@
+import { copyFileSync, mkdirSync, readdirSync, rmSync } from 'fs';
+import { join } from 'path';
 import resolve from '@rollup/plugin-node-resolve';
 import commonjs from '@rollup/plugin-commonjs';
 import typescript from '@rollup/plugin-typescript';
 
+const FRONTEND_DIR = '../../custom_components/universal_controller/www';
+
+// Replace the bundle served by the integration, dropping chunks of older builds
+function copyToFrontend() {
+  return {
+    name: 'copy-to-frontend',
+    writeBundle(options, bundle) {
+      mkdirSync(FRONTEND_DIR, { recursive: true });
+      for (const file of readdirSync(FRONTEND_DIR)) {
+        if (file.endsWith('.js')) {
+          rmSync(join(FRONTEND_DIR, file));
+        }
+      }
+      for (const file of Object.keys(bundle)) {
+        copyFileSync(join(options.dir, file), join(FRONTEND_DIR, file));
+      }
+    },
+  };
+}
+
 export default {
   input: 'src/universal-controller-card.ts',
   output: {
-    file: 'dist/universal-controller-card.js',
+    dir: 'dist',
     format: 'es',
     sourcemap: false, // Disable sourcemap for production
+    // The loader keeps a stable name for add_extra_js_url; chunks are
+    // content-hashed so the integration can serve them as immutable
+    entryFileNames: 'universal-controller-card.js',
+    chunkFileNames: 'universal-controller-[name]-[hash].js',
+    manualChunks(id) {
+      // lit is shared by the card, the code editors and the card editor
+      if (id.includes('node_modules')) {
+        return 'lit';
+      }
+    },
   },
   plugins: [
     resolve({
@@ -17,6 +49,7 @@ export default {
     typescript({
       tsconfig: './tsconfig.json',
     }),
+    copyToFrontend(),
   ],
   // Bundle everything for Home Assistant
   external: [],
@@ -0,0 +1,512 @@
+import { LitElement, html, css, PropertyValues } from 'lit';
+import { customElement, property, state } from 'lit/decorators.js';
+import { compileTemplate, CompiledTemplate } from './template';
+import { CodeEditorTab, ExecutionResult, HomeAssistant, UniversalControllerConfig } from './types';
+
+const TABS: Array<['preview' | CodeEditorTab, string]> = [
+  ['preview', 'Preview'],
+  ['code', 'TypeScript'],
+  ['html', 'HTML'],
+  ['css', 'CSS'],
+];
+
+// Render path of the card, loaded once a card is placed on a dashboard
+@customElement('universal-controller-card-content')
+export class UniversalControllerCardContent extends LitElement {
+  @property({ attribute: false }) public hass!: HomeAssistant;
+  @property({ attribute: false }) public config!: UniversalControllerConfig;
+  
+  @state() private _userCode: string = '';
+  @state() private _htmlTemplate: string = '';
+  @state() private _cssStyles: string = '';
+  @state() private _executionResult: ExecutionResult | null = null;
+  @state() private _isExecuting: boolean = false;
+  @state() private _showCodeEditor: boolean = false;
+  @state() private _activeTab: 'preview' | CodeEditorTab = 'preview';
+
+  // Compiled html_template, patched in place with each execution result
+  private _template?: CompiledTemplate;
+  @state() private _cardId: string = '';
+
+  constructor() {
+    super();
+    // Generate unique ID for this card instance
+    this._cardId = `uc_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+    console.log(`Universal Controller Card created with ID: ${this._cardId}`);
+  }
+
+  static get styles() {
+    return css`
+      :host {
+        display: block;
+        padding: 16px;
+        /* Dynamic width based on configuration */
+        width: var(--card-width, auto);
+      }
+
+      :host([data-width="1/4"]) {
+        width: 25%;
+      }
+
+      :host([data-width="2/4"]) {
+        width: 50%;
+      }
+
+      :host([data-width="3/4"]) {
+        width: 75%;
+      }
+
+      :host([data-width="4/4"]) {
+        width: 100%;
+      }
+
+      .card-header {
+        display: flex;
+        align-items: center;
+        justify-content: space-between;
+        margin-bottom: 16px;
+        padding-bottom: 8px;
+        border-bottom: 1px solid var(--divider-color);
+      }
+
+      .card-title {
+        margin: 0;
+        font-size: 1.2rem;
+        font-weight: 500;
+        color: var(--primary-text-color);
+      }
+
+      .status-indicator {
+        width: 12px;
+        height: 12px;
+        border-radius: 50%;
+        background: var(--disabled-text-color);
+        transition: background 0.3s ease;
+      }
+
+      .status-indicator.success {
+        background: var(--success-color);
+        box-shadow: 0 0 8px rgba(76, 175, 80, 0.4);
+      }
+
+      .status-indicator.error {
+        background: var(--error-color);
+        box-shadow: 0 0 8px rgba(244, 67, 54, 0.4);
+      }
+
+      .tabs {
+        display: flex;
+        border-bottom: 1px solid var(--divider-color);
+        margin-bottom: 16px;
+      }
+
+      .tab {
+        flex: 1;
+        padding: 8px 16px;
+        background: none;
+        border: none;
+        cursor: pointer;
+        font-size: 14px;
+        color: var(--secondary-text-color);
+        transition: all 0.3s ease;
+      }
+
+      .tab.active {
+        color: var(--primary-color);
+        border-bottom: 2px solid var(--primary-color);
+      }
+
+      .tab:hover {
+        background: var(--hover-color);
+      }
+
+      .content-section {
+        margin-bottom: 16px;
+      }
+
+      .execution-result {
+        margin-top: 16px;
+        padding: 12px;
+        border-radius: 4px;
+        font-family: monospace;
+        font-size: 14px;
+      }
+
+      .execution-result.success {
+        background: var(--success-color-light);
+        color: var(--success-color-dark);
+        border: 1px solid var(--success-color);
+      }
+
+      .execution-result.error {
+        background: var(--error-color-light);
+        color: var(--error-color-dark);
+        border: 1px solid var(--error-color);
+      }
+
+      .rendered-content {
+        border: 1px solid var(--divider-color);
+        border-radius: 4px;
+        padding: 16px;
+        margin-top: 12px;
+      }
+    `;
+  }
+
+  public setConfig(config: UniversalControllerConfig): void {
+    this.config = config;
+    this._showCodeEditor = config.show_code_editor ?? true;
+    
+    // If we have a ticker_id, load from ticker, otherwise use legacy system
+    if (config.ticker_id) {
+      this._loadTickerConfiguration();
+    } else {
+      this._loadConfiguration();
+    }
+  }
+
+  protected firstUpdated(): void {
+    // Set up periodic updates
+    const interval = this.config.update_interval || 30000;
+    setInterval(() => {
+      if (this._userCode.trim()) {
+        this._executeCode();
+      }
+    }, interval);
+  }
+
+  protected updated(changedProps: PropertyValues): void {
+    // Card is self-contained, no entity updates needed
+    
+    if (changedProps.has('config')) {
+      // Update width attribute for CSS styling
+      if (this.config?.card_width) {
+        this.setAttribute('data-width', this.config.card_width);
+      }
+    }
+    
+    if (changedProps.has('_htmlTemplate') || changedProps.has('_executionResult') || changedProps.has('_activeTab')) {
+      this._patchTemplate();
+    }
+  }
+
+  private _patchTemplate(): void {
+    const root = this.shadowRoot?.querySelector('.template-root');
+    if (!root || !this._htmlTemplate || !this._executionResult?.success) {
+      return;
+    }
+    
+    // Compile once per template; results only patch the changed bindings
+    if (!this._template || this._template.source !== this._htmlTemplate) {
+      this._template = compileTemplate(this._htmlTemplate);
+    }
+    const template = this._template;
+    if (template.host.parentNode !== root) {
+      root.replaceChildren(template.host);
+    }
+    template.update({ data: this._executionResult.result ?? {} });
+  }
+
+  private _loadConfiguration(): void {
+    console.log(`Loading configuration for card: ${this._cardId}`);
+    
+    // Set up event listener for service response
+    const handleConfigLoaded = (event: any) => {
+      if (event.detail.card_id === this._cardId) {
+        const config = event.detail.config;
+        console.log('Received saved config:', config);
+        
+        if (config && Object.keys(config).length > 0) {
+          // Use saved configuration
+          this._userCode = config.user_code || '';
+          this._htmlTemplate = config.html_template || '';
+          this._cssStyles = config.css_styles || '';
+          console.log(`✅ Loaded SAVED configuration for card: ${this._cardId}`);
+          this.requestUpdate();
+        } else {
+          // Use defaults from config
+          this._applyDefaults().then(() => this.requestUpdate());
+        }
+        
+        // Remove event listener after handling
+        this.hass.connection?.removeEventListener('universal_controller_config_loaded', handleConfigLoaded);
+      }
+    };
+    
+    try {
+      // Try to load via service first
+      if (this.hass && this.hass.callService) {
+        // Add event listener for the service response
+        this.hass.connection?.addEventListener('universal_controller_config_loaded', handleConfigLoaded);
+        
+        // Add timeout fallback
+        setTimeout(() => {
+          console.warn('Config load timeout, applying defaults');
+          this._applyDefaults().then(() => this.requestUpdate());
+        }, 5000);
+        
+        this.hass.callService('universal_controller', 'load_config', {
+          card_id: this._cardId
+        }).catch((error: any) => {
+          console.warn('Service load failed, trying localStorage:', error);
+          this._loadFromLocalStorage();
+        });
+      } else {
+        this._loadFromLocalStorage();
+      }
+    } catch (error) {
+      console.warn('Failed to load via service, trying localStorage:', error);
+      this._loadFromLocalStorage();
+    }
+  }
+  
+  private async _loadTickerConfiguration(): Promise<void> {
+    console.log(`Loading ticker configuration for ticker_id: ${this.config.ticker_id}`);
+    
+    try {
+      if (this.hass && this.hass.callService && this.config.ticker_id) {
+        // Call the new get_ticker service
+        const response = await this.hass.callService('universal_controller', 'get_ticker', {
+          ticker_id: this.config.ticker_id
+        });
+        
+        if (response && response.config) {
+          const tickerConfig = response.config;
+          this._userCode = tickerConfig.user_code || '';
+          this._htmlTemplate = tickerConfig.html_template || '';
+          this._cssStyles = tickerConfig.css_styles || '';
+          console.log(`✅ Loaded ticker configuration for: ${this.config.ticker_id}`);
+        } else {
+          console.warn(`No configuration found for ticker: ${this.config.ticker_id}`);
+          await this._applyDefaults();
+        }
+        
+        this.requestUpdate();
+      }
+    } catch (error) {
+      console.error('Failed to load ticker configuration:', error);
+      await this._applyDefaults();
+      this.requestUpdate();
+    }
+  }
+  
+  private async _applyDefaults(): Promise<void> {
+    console.log('Applying default configuration values');
+    const defaults = await import('./defaults');
+    this._userCode = this.config.user_code || defaults.DEFAULT_USER_CODE;
+    this._htmlTemplate = this.config.html_template || defaults.DEFAULT_HTML_TEMPLATE;
+    this._cssStyles = this.config.css_styles || defaults.DEFAULT_CSS_STYLES;
+  }
+  
+  private _loadFromLocalStorage(): void {
+    // Fallback to localStorage
+    try {
+      const storageKey = `universal_controller_${this._cardId}`;
+      const saved = localStorage.getItem(storageKey);
+      if (saved) {
+        const data = JSON.parse(saved);
+        this._userCode = data.userCode || '';
+        this._htmlTemplate = data.htmlTemplate || '';
+        this._cssStyles = data.cssStyles || '';
+        console.log(`✅ Loaded configuration from localStorage for card: ${this._cardId}`);
+        this.requestUpdate();
+      } else {
+        // No saved data, use defaults
+        this._applyDefaults().then(() => this.requestUpdate());
+      }
+    } catch (error) {
+      console.error('Failed to load from localStorage:', error);
+      this._applyDefaults().then(() => this.requestUpdate());
+    }
+  }
+
+  private async _executeCode(): Promise<void> {
+    if (!this._userCode.trim() || this._isExecuting) return;
+    
+    this._isExecuting = true;
+    
+    try {
+      // Create execution context
+      const context = {
+        hass: this.hass,
+        states: this.hass.states,
+        console: {
+          log: (...args: any[]) => console.log('[Universal Controller]', ...args),
+          error: (...args: any[]) => console.error('[Universal Controller]', ...args),
+        }
+      };
+      
+      // Execute the TypeScript/JavaScript code
+      const result = await this._executeUserCode(this._userCode, context);
+      
+      this._executionResult = {
+        success: true,
+        result,
+        timestamp: Date.now()
+      };
+      
+    } catch (error) {
+      this._executionResult = {
+        success: false,
+        error: error instanceof Error ? error.message : String(error),
+        timestamp: Date.now()
+      };
+    } finally {
+      this._isExecuting = false;
+    }
+  }
+
+  private async _executeUserCode(code: string, context: any): Promise<any> {
+    // Create a safe execution environment
+    const AsyncFunction = Object.getPrototypeOf(async function(){}).constructor;
+    
+    // Prepare the code with context variables
+    const contextKeys = Object.keys(context);
+    const contextValues = Object.values(context);
+    
+    const wrappedCode = `
+      "use strict";
+      ${code}
+    `;
+    
+    // Execute the code with the provided context
+    const func = new AsyncFunction(...contextKeys, wrappedCode);
+    return await func(...contextValues);
+  }
+
+  private async _saveConfiguration(): Promise<void> {
+    try {
+      // If we have a ticker_id, update the ticker, otherwise use legacy save
+      if (this.config.ticker_id) {
+        await this.hass.callService('universal_controller', 'update_ticker', {
+          ticker_id: this.config.ticker_id,
+          user_code: this._userCode,
+          html_template: this._htmlTemplate,
+          css_styles: this._cssStyles
+        });
+        console.log(`Ticker configuration updated for: ${this.config.ticker_id}`);
+      } else {
+        // Legacy save_config for backwards compatibility
+        await this.hass.callService('universal_controller', 'save_config', {
+          card_id: this._cardId,
+          user_code: this._userCode,
+          html_template: this._htmlTemplate,
+          css_styles: this._cssStyles
+        });
+        console.log(`Configuration saved via legacy service for card: ${this._cardId}`);
+      }
+      
+      // Show success notification
+      if (this.hass.connection) {
+        await this.hass.connection.sendMessagePromise({
+          type: 'persistent_notification/create',
+          notification_id: `universal_controller_save_${this._cardId}`,
+          title: 'Universal Controller',
+          message: 'Configuration saved successfully!'
+        });
+      }
+      
+    } catch (error) {
+      console.error('Failed to save configuration:', error);
+      
+      // Show error notification
+      if (this.hass.connection) {
+        await this.hass.connection.sendMessagePromise({
+          type: 'persistent_notification/create',
+          notification_id: `universal_controller_error_${this._cardId}`,
+          title: 'Universal Controller Error',
+          message: `Failed to save: ${error}`
+        });
+      }
+    }
+  }
+
+  private _resetToDefaults(): void {
+    this._userCode = this.config.user_code || '';
+    this._htmlTemplate = this.config.html_template || '';
+    this._cssStyles = this.config.css_styles || '';
+    this._executionResult = null;
+  }
+
+  private _renderCustomContent(): any {
+    const hasContent = !!this._htmlTemplate && !!this._executionResult?.success;
+    
+    // The template root is left to _patchTemplate, lit never re-renders its children
+    return html`
+      <div class="rendered-content">
+        ${hasContent ? '' : 'No content to display'}
+        <style>${this._cssStyles}</style>
+        <div class="template-root" ?hidden="${!hasContent}"></div>
+      </div>
+    `;
+  }
+
+  render() {
+    return html`
+      <div class="card-header">
+        <h2 class="card-title">${this.config.name || 'Universal Controller'}</h2>
+        <div class="status-indicator ${this._executionResult?.success ? 'success' : this._executionResult ? 'error' : ''}"></div>
+      </div>
+
+      ${this._showCodeEditor ? html`
+        <div class="tabs">
+          ${TABS.map(([tab, label]) => html`
+            <button class="tab ${this._activeTab === tab ? 'active' : ''}" @click="${() => this._setActiveTab(tab)}">${label}</button>
+          `)}
+        </div>
+      ` : ''}
+
+      ${this._activeTab === 'preview' ? html`
+        <div class="content-section" id="preview-section">
+          ${this._renderCustomContent()}
+          
+          ${this._executionResult ? html`
+            <div class="execution-result ${this._executionResult.success ? 'success' : 'error'}">
+              ${this._executionResult.success 
+                ? html`<strong>Execution successful:</strong><br>${JSON.stringify(this._executionResult.result, null, 2)}`
+                : html`<strong>Error:</strong> ${this._executionResult.error}`
+              }
+            </div>
+          ` : ''}
+        </div>
+      ` : html`
+        <universal-controller-code-editor
+          .tab="${this._activeTab}"
+          .userCode="${this._userCode}"
+          .htmlTemplate="${this._htmlTemplate}"
+          .cssStyles="${this._cssStyles}"
+          .executing="${this._isExecuting}"
+          @code-changed="${this._codeChanged}"
+          @execute="${this._executeCode}"
+          @save="${this._saveConfiguration}"
+          @reset="${this._resetToDefaults}"
+        ></universal-controller-code-editor>
+      `}
+    `;
+  }
+
+  private async _setActiveTab(tab: 'preview' | CodeEditorTab): Promise<void> {
+    if (tab !== 'preview') {
+      // The editors are a separate chunk, fetched the first time they are opened
+      await import('./code-editor');
+    }
+    this._activeTab = tab;
+  }
+
+  private _codeChanged(e: CustomEvent): void {
+    const { field, value } = e.detail;
+    if (field === 'userCode') {
+      this._userCode = value;
+    } else if (field === 'htmlTemplate') {
+      this._htmlTemplate = value;
+    } else if (field === 'cssStyles') {
+      this._cssStyles = value;
+    }
+  }
+}
+
+declare global {
+  interface HTMLElementTagNameMap {
+    'universal-controller-card-content': UniversalControllerCardContent;
+  }
+}
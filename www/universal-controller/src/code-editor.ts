@@ -0,0 +1,224 @@
+import { LitElement, html, css } from 'lit';
+import { customElement, property } from 'lit/decorators.js';
+import { CodeEditorTab } from './types';
+
+// Code, template and style editors of the card, loaded the first time one
+// of the editor tabs is opened
+@customElement('universal-controller-code-editor')
+export class UniversalControllerCodeEditor extends LitElement {
+  @property() public tab: CodeEditorTab = 'code';
+  @property() public userCode: string = '';
+  @property() public htmlTemplate: string = '';
+  @property() public cssStyles: string = '';
+  @property({ type: Boolean }) public executing: boolean = false;
+
+  static get styles() {
+    return css`
+      :host {
+        display: block;
+        margin-bottom: 16px;
+      }
+
+      .code-editor,
+      .html-editor,
+      .css-editor {
+        width: 100%;
+        padding: 12px;
+        border: 1px solid var(--border-color);
+        border-radius: 4px;
+        font-family: 'Monaco', 'Consolas', 'Courier New', monospace;
+        font-size: 14px;
+        line-height: 1.4;
+        background: var(--code-editor-background, #f8f9fa);
+        color: var(--primary-text-color);
+        resize: vertical;
+      }
+
+      .code-editor {
+        min-height: 200px;
+      }
+
+      .html-editor {
+        min-height: 150px;
+      }
+
+      .css-editor {
+        min-height: 120px;
+      }
+
+      .button-group {
+        display: flex;
+        gap: 8px;
+        margin-top: 12px;
+      }
+
+      .execute-btn {
+        padding: 8px 16px;
+        background: var(--primary-color);
+        color: white;
+        border: none;
+        border-radius: 4px;
+        cursor: pointer;
+        font-weight: 500;
+        transition: all 0.3s ease;
+      }
+
+      .execute-btn:hover:not(:disabled) {
+        background: var(--primary-color-dark);
+        transform: translateY(-1px);
+      }
+
+      .execute-btn:disabled {
+        opacity: 0.6;
+        cursor: not-allowed;
+      }
+
+      .save-btn {
+        padding: 8px 16px;
+        background: var(--success-color);
+        color: white;
+        border: none;
+        border-radius: 4px;
+        cursor: pointer;
+        font-weight: 500;
+      }
+
+      .save-btn:hover {
+        background: var(--success-color-dark);
+      }
+
+      .reset-btn {
+        padding: 8px 16px;
+        background: var(--warning-color);
+        color: white;
+        border: none;
+        border-radius: 4px;
+        cursor: pointer;
+        font-weight: 500;
+      }
+
+      .loading {
+        display: inline-flex;
+        align-items: center;
+        gap: 8px;
+      }
+
+      .spinner {
+        width: 16px;
+        height: 16px;
+        border: 2px solid var(--disabled-text-color);
+        border-top: 2px solid var(--primary-color);
+        border-radius: 50%;
+        animation: spin 1s linear infinite;
+      }
+
+      @keyframes spin {
+        0% { transform: rotate(0deg); }
+        100% { transform: rotate(360deg); }
+      }
+
+      /* Dark theme support */
+      @media (prefers-color-scheme: dark) {
+        .code-editor,
+        .html-editor,
+        .css-editor {
+          background: var(--code-editor-background, #2d2d2d);
+          border-color: var(--border-color, #444);
+        }
+      }
+    `;
+  }
+
+  private _fire(type: string, detail?: any): void {
+    this.dispatchEvent(new CustomEvent(type, { detail, bubbles: true, composed: true }));
+  }
+
+  private _changed(field: 'userCode' | 'htmlTemplate' | 'cssStyles', e: any): void {
+    this._fire('code-changed', { field, value: e.target.value });
+  }
+
+  private _renderCode() {
+    return html`
+      <h3>TypeScript/JavaScript Code</h3>
+      <textarea
+        class="code-editor"
+        .value="${this.userCode}"
+        @input="${(e: any) => this._changed('userCode', e)}"
+        placeholder="// TypeScript/JavaScript code that runs periodically
+// Full access to Home Assistant API
+
+const lights = Object.values(hass.states).filter(entity =>
+    entity.entity_id.startsWith('light.')
+);
+
+console.log(\`Found \${lights.length} lights\`);
+
+return {
+    lights_count: lights.length,
+    current_time: new Date().toISOString()
+};"
+      ></textarea>
+
+      <div class="button-group">
+        <button class="execute-btn" @click="${() => this._fire('execute')}" ?disabled="${this.executing}">
+          ${this.executing ? html`<span class="loading"><span class="spinner"></span>Executing...</span>` : 'Execute'}
+        </button>
+        <button class="save-btn" @click="${() => this._fire('save')}">Save</button>
+        <button class="reset-btn" @click="${() => this._fire('reset')}">Reset</button>
+      </div>
+    `;
+  }
+
+  private _renderHtml() {
+    return html`
+      <h3>HTML Template</h3>
+      <textarea
+        class="html-editor"
+        .value="${this.htmlTemplate}"
+        @input="${(e: any) => this._changed('htmlTemplate', e)}"
+        placeholder="<div class='custom-content'>
+  <h3>{{ data.title }}</h3>
+  <p>Lights: {{ data.lights_count }}</p>
+</div>"
+      ></textarea>
+    `;
+  }
+
+  private _renderCss() {
+    return html`
+      <h3>CSS Styles</h3>
+      <textarea
+        class="css-editor"
+        .value="${this.cssStyles}"
+        @input="${(e: any) => this._changed('cssStyles', e)}"
+        placeholder=".custom-content {
+  padding: 16px;
+  background: var(--card-background-color);
+  border-radius: 8px;
+}
+
+.custom-content h3 {
+  margin: 0 0 8px 0;
+  color: var(--primary-text-color);
+}"
+      ></textarea>
+    `;
+  }
+
+  render() {
+    switch (this.tab) {
+      case 'html':
+        return this._renderHtml();
+      case 'css':
+        return this._renderCss();
+      default:
+        return this._renderCode();
+    }
+  }
+}
+
+declare global {
+  interface HTMLElementTagNameMap {
+    'universal-controller-code-editor': UniversalControllerCodeEditor;
+  }
+}
@@ -0,0 +1,144 @@
+import { LitElement, html, css } from 'lit';
+import { customElement, property } from 'lit/decorators.js';
+import { HomeAssistant, UniversalControllerConfig } from './types';
+
+// Configuration editor for the card, loaded when the card editor is opened
+@customElement('universal-controller-card-editor')
+export class UniversalControllerCardEditor extends LitElement {
+  @property({ attribute: false }) public hass!: HomeAssistant;
+  @property() private _config!: UniversalControllerConfig;
+
+  public setConfig(config: UniversalControllerConfig): void {
+    this._config = config;
+  }
+
+  protected render() {
+    if (!this.hass || !this._config) {
+      return html``;
+    }
+
+    return html`
+      <div class="card-config">
+        <div class="option">
+          <ha-textfield
+            label="Card Name"
+            .value=${this._config.name || ''}
+            .configValue=${'name'}
+            @input=${this._valueChanged}
+          ></ha-textfield>
+        </div>
+
+        <div class="option">
+          <label>Card Width:</label>
+          <ha-select
+            .value=${this._config.card_width || '2/4'}
+            .configValue=${'card_width'}
+            @selected=${this._valueChanged}
+          >
+            <mwc-list-item value="1/4">Quarter (25%)</mwc-list-item>
+            <mwc-list-item value="2/4">Half (50%)</mwc-list-item>
+            <mwc-list-item value="3/4">Three Quarters (75%)</mwc-list-item>
+            <mwc-list-item value="4/4">Full Width (100%)</mwc-list-item>
+          </ha-select>
+        </div>
+
+        <div class="option">
+          <ha-textfield
+            label="Card Height (grid rows)"
+            type="number"
+            min="1"
+            max="10"
+            .value=${this._config.card_height || 3}
+            .configValue=${'card_height'}
+            @input=${this._valueChanged}
+          ></ha-textfield>
+        </div>
+
+        <div class="option">
+          <ha-textfield
+            label="Update Interval (seconds)"
+            type="number"
+            min="1"
+            max="300"
+            .value=${(this._config.update_interval || 30000) / 1000}
+            .configValue=${'update_interval_seconds'}
+            @input=${this._valueChanged}
+          ></ha-textfield>
+        </div>
+
+        <div class="option">
+          <ha-formfield label="Show Code Editor">
+            <ha-checkbox
+              .checked=${this._config.show_code_editor !== false}
+              .configValue=${'show_code_editor'}
+              @change=${this._valueChanged}
+            ></ha-checkbox>
+          </ha-formfield>
+        </div>
+      </div>
+    `;
+  }
+
+  private _valueChanged(ev: any): void {
+    if (!this._config || !this.hass) {
+      return;
+    }
+
+    const target = ev.target;
+    const configValue = target.configValue;
+    let value = target.type === 'checkbox' ? target.checked : target.value;
+
+    // Convert update interval from seconds to milliseconds
+    if (configValue === 'update_interval_seconds') {
+      value = parseInt(value) * 1000;
+      this._config = {
+        ...this._config,
+        update_interval: value,
+      };
+    } else if (configValue === 'card_height') {
+      value = parseInt(value);
+      this._config = {
+        ...this._config,
+        [configValue]: value,
+      };
+    } else {
+      this._config = {
+        ...this._config,
+        [configValue]: value,
+      };
+    }
+
+    const event = new CustomEvent('config-changed', {
+      detail: { config: this._config },
+      bubbles: true,
+      composed: true,
+    });
+    this.dispatchEvent(event);
+  }
+
+  static get styles() {
+    return css`
+      .card-config {
+        display: flex;
+        flex-direction: column;
+        gap: 16px;
+      }
+
+      .option {
+        display: flex;
+        flex-direction: column;
+      }
+
+      .option label {
+        margin-bottom: 4px;
+        font-weight: 500;
+      }
+    `;
+  }
+}
+
+declare global {
+  interface HTMLElementTagNameMap {
+    'universal-controller-card-editor': UniversalControllerCardEditor;
+  }
+}
@@ -0,0 +1,265 @@
+// Card templates compiled once into DOM plus bindings.
+//
+// `{{ data.path }}` expressions in text and attribute values become bindings
+// indexed by the path they read. On each result only paths whose value
+// changed are re-applied, so unchanged nodes keep their identity, scroll
+// position and focus. An element with `data-each="data.items"` is repeated
+// for every item of the list (available as `item`, or the name given in
+// `data-as`); with `data-key="id"` items are reconciled by key, so
+// reordered or inserted items move their existing nodes instead of
+// rebuilding the list.
+
+type Scope = Record<string, any>;
+
+interface Expression {
+  source: string;
+  path: string[];
+}
+
+// Literal text or an expression to substitute
+type Part = string | Expression;
+
+interface Binding {
+  parts: Part[];
+  apply: (value: string) => void;
+}
+
+interface Dependency {
+  path: string[];
+  last?: string;
+  bindings: Binding[];
+}
+
+const EXPRESSION = /\{\{\s*([\w$]+(?:\.[\w$]+)*)\s*\}\}/g;
+
+function parseParts(text: string): Part[] | null {
+  if (!text.includes('{{')) {
+    return null;
+  }
+
+  const parts: Part[] = [];
+  let last = 0;
+  for (const match of text.matchAll(EXPRESSION)) {
+    if (match.index! > last) {
+      parts.push(text.slice(last, match.index));
+    }
+    parts.push({ source: match[1], path: match[1].split('.') });
+    last = match.index! + match[0].length;
+  }
+  if (last === 0) {
+    return null;
+  }
+  if (last < text.length) {
+    parts.push(text.slice(last));
+  }
+  return parts;
+}
+
+function resolve(scope: any, path: string[]): any {
+  let value = scope;
+  for (const key of path) {
+    if (value === null || value === undefined) {
+      return undefined;
+    }
+    value = value[key];
+  }
+  return value;
+}
+
+function stringify(value: any): string {
+  if (value === null || value === undefined) {
+    return '';
+  }
+  if (typeof value === 'object') {
+    return JSON.stringify(value);
+  }
+  return String(value);
+}
+
+export class TemplateInstance {
+  private _dependencies = new Map<string, Dependency>();
+  private _lists: ListBinding[] = [];
+
+  constructor(root: Node) {
+    if (root.nodeType === Node.ELEMENT_NODE) {
+      this._bindElement(root as Element);
+    } else {
+      this._bindChildren(root);
+    }
+  }
+
+  private _bindChildren(node: Node): void {
+    for (const child of Array.from(node.childNodes)) {
+      if (child.nodeType === Node.TEXT_NODE) {
+        const text = child as Text;
+        const parts = parseParts(text.data);
+        if (parts) {
+          text.data = '';
+          this._bind(parts, (value) => { text.data = value; });
+        }
+      } else if (child.nodeType === Node.ELEMENT_NODE) {
+        const element = child as Element;
+        if (element.hasAttribute('data-each')) {
+          this._lists.push(new ListBinding(element));
+        } else {
+          this._bindElement(element);
+        }
+      }
+    }
+  }
+
+  private _bindElement(element: Element): void {
+    for (const attribute of Array.from(element.attributes)) {
+      const parts = parseParts(attribute.value);
+      if (parts) {
+        const name = attribute.name;
+        element.setAttribute(name, '');
+        this._bind(parts, (value) => element.setAttribute(name, value));
+      }
+    }
+    // <template> content is inert and not part of the rendered output
+    if (element.localName !== 'template') {
+      this._bindChildren(element);
+    }
+  }
+
+  private _bind(parts: Part[], apply: (value: string) => void): void {
+    const binding: Binding = { parts, apply };
+    for (const part of parts) {
+      if (typeof part === 'string') {
+        continue;
+      }
+      let dependency = this._dependencies.get(part.source);
+      if (!dependency) {
+        dependency = { path: part.path, bindings: [] };
+        this._dependencies.set(part.source, dependency);
+      }
+      dependency.bindings.push(binding);
+    }
+  }
+
+  // Apply a new scope, touching only bindings whose paths changed
+  public update(scope: Scope): void {
+    const values = new Map<string, string>();
+    const changed = new Set<Binding>();
+
+    for (const [source, dependency] of this._dependencies) {
+      const value = stringify(resolve(scope, dependency.path));
+      values.set(source, value);
+      if (value !== dependency.last) {
+        dependency.last = value;
+        dependency.bindings.forEach((binding) => changed.add(binding));
+      }
+    }
+
+    for (const binding of changed) {
+      binding.apply(
+        binding.parts.map((part) => (typeof part === 'string' ? part : values.get(part.source)!)).join('')
+      );
+    }
+
+    for (const list of this._lists) {
+      list.update(scope);
+    }
+  }
+}
+
+interface ListItem {
+  node: Element;
+  instance: TemplateInstance;
+}
+
+// A repeated element, reconciled by key
+class ListBinding {
+  private _anchor: Comment;
+  private _prototype: Element;
+  private _path: string[];
+  private _keyPath: string[] | null;
+  private _alias: string;
+  private _items = new Map<unknown, ListItem>();
+  // Items without a usable key, by position; kept apart so a key can't collide
+  private _positional = new Map<number, ListItem>();
+
+  constructor(element: Element) {
+    const source = element.getAttribute('data-each')!.trim();
+    const key = element.getAttribute('data-key');
+    this._path = source.split('.');
+    this._keyPath = key ? key.trim().split('.') : null;
+    this._alias = element.getAttribute('data-as') || 'item';
+
+    element.removeAttribute('data-each');
+    element.removeAttribute('data-key');
+    element.removeAttribute('data-as');
+    this._prototype = element;
+    this._anchor = document.createComment(` each ${source} `);
+    element.replaceWith(this._anchor);
+  }
+
+  public update(scope: Scope): void {
+    const list = resolve(scope, this._path);
+    const items: any[] = Array.isArray(list) ? list : [];
+    const parent = this._anchor.parentNode!;
+    const next = new Map<unknown, ListItem>();
+    const nextPositional = new Map<number, ListItem>();
+    let previous: Node = this._anchor;
+
+    items.forEach((value, index) => {
+      const key = this._keyPath ? resolve(value, this._keyPath) : undefined;
+      // Unkeyed lists, missing and duplicate keys fall back to the position
+      const keyed = key !== undefined && !next.has(key);
+
+      let item = keyed ? this._items.get(key) : this._positional.get(index);
+      if (!item) {
+        const node = this._prototype.cloneNode(true) as Element;
+        item = { node, instance: new TemplateInstance(node) };
+      }
+      item.instance.update({ ...scope, [this._alias]: value });
+
+      if (previous.nextSibling !== item.node) {
+        parent.insertBefore(item.node, previous.nextSibling);
+      }
+      previous = item.node;
+      if (keyed) {
+        next.set(key, item);
+      } else {
+        nextPositional.set(index, item);
+      }
+    });
+
+    for (const [key, item] of this._items) {
+      if (!next.has(key)) {
+        item.node.remove();
+      }
+    }
+    for (const [index, item] of this._positional) {
+      if (!nextPositional.has(index)) {
+        item.node.remove();
+      }
+    }
+    this._items = next;
+    this._positional = nextPositional;
+  }
+}
+
+export interface CompiledTemplate {
+  source: string;
+  // Container holding the rendered template; move it to remount
+  host: HTMLElement;
+  update: (scope: Scope) => void;
+}
+
+export function compileTemplate(source: string): CompiledTemplate {
+  const template = document.createElement('template');
+  template.innerHTML = source;
+
+  const host = document.createElement('div');
+  host.style.display = 'contents';
+  host.appendChild(document.importNode(template.content, true));
+
+  const instance = new TemplateInstance(host);
+  return {
+    source,
+    host,
+    update: (scope: Scope) => instance.update(scope),
+  };
+}
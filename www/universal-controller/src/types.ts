@@ -0,0 +1,28 @@
+export interface HomeAssistant {
+  callService: (domain: string, service: string, data?: any) => Promise<any>;
+  states: { [key: string]: any };
+  config: any;
+  connection: any;
+}
+
+export interface UniversalControllerConfig {
+  type: string;
+  name?: string;
+  ticker_id?: string; // NEW: Connect to a ticker service
+  user_code?: string;
+  html_template?: string;
+  css_styles?: string;
+  show_code_editor?: boolean;
+  update_interval?: number;
+  card_width?: '1/4' | '2/4' | '3/4' | '4/4' | 'auto';
+  card_height?: number; // Grid rows (1-10)
+}
+
+export interface ExecutionResult {
+  success: boolean;
+  result?: any;
+  error?: string;
+  timestamp: number;
+}
+
+export type CodeEditorTab = 'code' | 'html' | 'css';